@@ -4,9 +4,12 @@ LLM 파서 모듈 (추후 확장용)
 """
 
 import json
+import logging
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+logger = logging.getLogger(__name__)
+
 class LLMParser:
     """LLM 기반 파서 클래스 (추후 확장용)"""
     
@@ -21,6 +24,11 @@ class LLMParser:
         # 추후 실제 LLM 초기화 코드 위치
         # self._init_llm()
     
+    @property
+    def mapping_version(self) -> str:
+        """파싱 캐시 네임스페이스용 버전 (모델 및 시뮬레이션 여부)"""
+        return f"{self.model_id}:{'llm' if self.llm_available else 'simulation'}"
+    
     def _init_llm(self):
         """LLM 모델 초기화 (추후 구현)"""
         # 추후 실제 LLM 모델 로딩 코드
@@ -28,14 +36,14 @@ class LLMParser:
     
     def parse(self, user_input: str) -> Dict:
         """LLM 파싱 메인 함수"""
-        print(f"🤖 LLM 파싱 시작: {user_input}")
+        logger.info(f"🤖 LLM 파싱 시작: {user_input}")
         
         if self.llm_available:
             # 실제 LLM 파싱 로직
             return self._llm_parse(user_input)
         else:
             # 시뮬레이션 모드 - 규칙 기반 백업
-            print("⚠️  LLM 시뮬레이션 모드 - 규칙 기반 백업 사용")
+            logger.info("⚠️  LLM 시뮬레이션 모드 - 규칙 기반 백업 사용")
             return self._simulate_llm_parse(user_input)
     
     def _llm_parse(self, user_input: str) -> Dict:
@@ -80,7 +88,7 @@ class LLMParser:
             "industry_specialization": "금융권 경험"
         }
         
-        print("✅ LLM 시뮬레이션 파싱 완료")
+        logger.info("✅ LLM 시뮬레이션 파싱 완료")
         return result
     
     def _create_llm_prompt(self, user_input: str) -> str:
@@ -0,0 +1,209 @@
+"""
+근사 최근접 이웃(ANN) 색인 모듈
+내적(inner product) 기준 IVF-flat 색인 - NumPy 구현, faiss 설치 시 faiss 사용
+"""
+
+import logging
+import math
+from typing import Dict, Iterable, Optional, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 환경에서는 ANN 검색 비활성화
+    np = None
+
+try:
+    import faiss
+except ImportError:  # faiss는 선택 의존성
+    faiss = None
+
+logger = logging.getLogger(__name__)
+
+# k-means 학습 설정
+KMEANS_ITERATIONS = 10
+KMEANS_MAX_TRAINING_POINTS = 100000
+ASSIGN_CHUNK_SIZE = 8192
+
+def default_nlist(size: int) -> int:
+    """데이터 크기에 맞는 클러스터 수 (약 √N)"""
+    return max(1, int(round(math.sqrt(size))))
+
+class IVFFlatIndex:
+    """NumPy IVF-flat 색인 - k-means 클러스터별 행 목록, 검색 시 가까운 nprobe개 클러스터만 정확히 계산"""
+    
+    backend = "numpy"
+    
+    def __init__(self, dim: int, nlist: int, nprobe: int = 8, seed: int = 0):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.seed = seed
+        
+        self.centroids = None
+        self._lists = []      # 클러스터별 {행 번호: 벡터}
+        self._row_list = {}   # 행 번호 → 클러스터
+        self._packed = []     # 클러스터별 (행 번호 배열, 벡터 행렬) 캐시, 변경 시 None
+    
+    def __len__(self) -> int:
+        return len(self._row_list)
+    
+    def build(self, vectors: "np.ndarray", rows: "np.ndarray"):
+        """k-means로 클러스터 학습 후 전체 벡터 등록"""
+        rng = np.random.default_rng(self.seed)
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.nlist = max(1, min(self.nlist, len(vectors)))
+        
+        training = vectors
+        if len(training) > KMEANS_MAX_TRAINING_POINTS:
+            training = training[rng.choice(len(training), KMEANS_MAX_TRAINING_POINTS, replace=False)]
+        
+        self.centroids = training[rng.choice(len(training), self.nlist, replace=False)].copy()
+        for _ in range(KMEANS_ITERATIONS):
+            assignment = self._assign(training)
+            sums = np.zeros_like(self.centroids)
+            np.add.at(sums, assignment, training)
+            counts = np.bincount(assignment, minlength=self.nlist)
+            filled = counts > 0
+            # 빈 클러스터는 이전 중심 유지
+            self.centroids[filled] = sums[filled] / counts[filled, None]
+        
+        self._lists = [dict() for _ in range(self.nlist)]
+        self._packed = [None] * self.nlist
+        self._row_list = {}
+        self.add(vectors, rows)
+    
+    def add(self, vectors: "np.ndarray", rows: Iterable[int]):
+        """벡터를 가장 가까운 클러스터에 등록 (같은 행이 있으면 교체)"""
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        rows = [int(row) for row in rows]
+        self.remove(rows)
+        
+        for row, vector, list_id in zip(rows, vectors, self._assign(vectors).tolist()):
+            self._lists[list_id][row] = vector
+            self._row_list[row] = list_id
+            self._packed[list_id] = None
+    
+    def remove(self, rows: Iterable[int]):
+        for row in rows:
+            list_id = self._row_list.pop(int(row), None)
+            if list_id is not None:
+                del self._lists[list_id][int(row)]
+                self._packed[list_id] = None
+    
+    def search(self, query: "np.ndarray", k: int, nprobe: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        """내적 상위 k개 (행 번호, 점수) 반환 - 점수 내림차순, 동점은 행 번호 순"""
+        query = np.asarray(query, dtype=np.float32)
+        nprobe = min(nprobe or self.nprobe, self.nlist)
+        
+        # 중심과의 내적이 큰 클러스터부터 탐색
+        probed = np.argsort(-(self.centroids @ query), kind="stable")[:nprobe]
+        rows, scores = [], []
+        for list_id in probed.tolist():
+            cluster_rows, cluster_vectors = self._get_packed(list_id)
+            if len(cluster_rows):
+                rows.append(cluster_rows)
+                scores.append(cluster_vectors @ query)
+        
+        if not rows or k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        
+        rows = np.concatenate(rows)
+        scores = np.concatenate(scores)
+        order = np.lexsort((rows, -scores))[:k]
+        return rows[order], scores[order]
+    
+    def __getstate__(self) -> Dict:
+        """pickle 상태 - 클러스터를 행별 벡터 dict 대신 (행 번호 배열, 벡터 행렬)로 저장 (스냅샷 크기/로드 속도)"""
+        state = self.__dict__.copy()
+        state["_lists"] = [self._get_packed(list_id) for list_id in range(len(self._lists))]
+        state["_packed"] = None
+        return state
+    
+    def __setstate__(self, state: Dict):
+        packed = state.pop("_lists")
+        self.__dict__.update(state)
+        self._lists = [dict(zip(rows.tolist(), vectors)) for rows, vectors in packed]
+        self._packed = list(packed)
+    
+    def _get_packed(self, list_id: int) -> Tuple["np.ndarray", "np.ndarray"]:
+        """클러스터 벡터를 연속 행렬로 묶어 캐시 (변경된 클러스터만 다시 묶음)"""
+        packed = self._packed[list_id]
+        if packed is None:
+            cluster = self._lists[list_id]
+            rows = np.fromiter(cluster.keys(), dtype=np.int64, count=len(cluster))
+            vectors = np.stack(list(cluster.values())) if cluster else np.zeros((0, self.dim), dtype=np.float32)
+            packed = self._packed[list_id] = (rows, vectors)
+        return packed
+    
+    def _assign(self, vectors: "np.ndarray") -> "np.ndarray":
+        """각 벡터의 최근접 중심 (L2 거리)"""
+        centroid_norms = (self.centroids * self.centroids).sum(axis=1)
+        assignment = np.empty(len(vectors), dtype=np.int64)
+        
+        for start in range(0, len(vectors), ASSIGN_CHUNK_SIZE):
+            chunk = vectors[start:start + ASSIGN_CHUNK_SIZE]
+            # ‖x - c‖² = ‖x‖² - 2x·c + ‖c‖² (‖x‖²는 비교에 불필요)
+            distances = centroid_norms[None, :] - 2.0 * (chunk @ self.centroids.T)
+            assignment[start:start + len(chunk)] = np.argmin(distances, axis=1)
+        
+        return assignment
+
+class FaissIVFIndex:
+    """faiss IndexIVFFlat(내적) 래퍼 - IVFFlatIndex와 같은 인터페이스"""
+    
+    backend = "faiss"
+    
+    def __init__(self, dim: int, nlist: int, nprobe: int = 8, seed: int = 0):
+        self.dim = dim
+        self.nlist = nlist
+        self.nprobe = nprobe
+        self.seed = seed
+        self.index = None
+    
+    def __len__(self) -> int:
+        return 0 if self.index is None else self.index.ntotal
+    
+    def build(self, vectors: "np.ndarray", rows: "np.ndarray"):
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.nlist = max(1, min(self.nlist, len(vectors)))
+        
+        quantizer = faiss.IndexFlatL2(self.dim)
+        self.index = faiss.IndexIVFFlat(quantizer, self.dim, self.nlist, faiss.METRIC_INNER_PRODUCT)
+        self.index.cp.seed = self.seed
+        self.index.train(vectors)
+        self.index.nprobe = self.nprobe
+        self._quantizer = quantizer  # 색인보다 먼저 해제되지 않도록 참조 유지
+        self.add(vectors, rows)
+    
+    def add(self, vectors: "np.ndarray", rows: Iterable[int]):
+        rows = np.asarray(list(rows), dtype=np.int64)
+        self.remove(rows)
+        self.index.add_with_ids(np.ascontiguousarray(vectors, dtype=np.float32), rows)
+    
+    def remove(self, rows: Iterable[int]):
+        rows = np.asarray(list(rows), dtype=np.int64)
+        if len(rows):
+            self.index.remove_ids(rows)
+    
+    def search(self, query: "np.ndarray", k: int, nprobe: Optional[int] = None) -> Tuple["np.ndarray", "np.ndarray"]:
+        if k <= 0 or self.index.ntotal == 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        
+        self.index.nprobe = min(nprobe or self.nprobe, self.nlist)
+        scores, rows = self.index.search(np.asarray(query, dtype=np.float32)[None, :], k)
+        found = rows[0] >= 0
+        return rows[0][found], scores[0][found]
+
+def create_ann_index(dim: int, size: int, nlist: Optional[int] = None, nprobe: int = 8,
+                     backend: str = "auto"):
+    """ANN 색인 생성 (backend: "auto" | "numpy" | "faiss")"""
+    if np is None:
+        raise RuntimeError("ANN 색인에는 NumPy가 필요합니다")
+    
+    nlist = nlist or default_nlist(size)
+    if backend == "faiss" or (backend == "auto" and faiss is not None):
+        if faiss is None:
+            raise RuntimeError("faiss가 설치되어 있지 않습니다")
+        return FaissIVFIndex(dim, nlist, nprobe)
+    
+    return IVFFlatIndex(dim, nlist, nprobe)
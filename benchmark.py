@@ -0,0 +1,258 @@
+"""
+성능 벤치마크 모듈
+합성 인재 데이터(example.synthetic_talents) 규모별로 색인 구축과 검색 단계별 지연시간/처리량/최대 메모리 측정
+
+측정 단계:
+    build       인재 DB + 검색 시스템 생성 (역색인, 컬럼 배열, 후보자 벡터 사전 계산)
+    parse       RulebasePromptParser.parse (파싱 캐시 없이)
+    payload     PayloadSearcher.search
+    vector      VectorSearcher.search (payload 단계 후보 입력)
+    rerank      ReRanker.rerank (vector 단계 결과 입력)
+    end_to_end  search_talents_chatbot (파싱/결과 캐시 없이)
+    batch       search_batch (전체 질의를 한 요청으로)
+
+단계별 지연시간은 질의마다 측정한 p50/p95/p99/평균과 처리량(질의/초),
+최대 메모리는 tracemalloc으로 일부 질의를 따로 실행해 단계 실행 중 늘어난 최대 할당량으로 기록한다.
+(tracemalloc은 할당마다 추적 비용이 있어 지연시간 측정과 분리, build는 프로세스 최대 RSS로 기록)
+
+사용 예:
+    python benchmark.py --sizes 10000 100000 --queries 200 --json bench.json
+    python benchmark.py --sizes 1000000 --queries 50 --stages payload vector
+"""
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import math
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, Iterable, List, Optional
+
+from example.synthetic_talents import DEFAULT_SEED, generate_queries, iter_synthetic_talents
+
+DEFAULT_SIZES = (10000, 100000)
+DEFAULT_QUERY_COUNT = 200
+DEFAULT_MEMORY_QUERIES = 20
+WARM_UP_QUERIES = 5
+
+STAGES = ("parse", "payload", "vector", "rerank", "end_to_end", "batch")
+
+def _percentile(sorted_values: List[float], percentile: float) -> float:
+    """최근접 순위 백분위수"""
+    if not sorted_values:
+        return 0.0
+    rank = max(0, min(len(sorted_values) - 1, math.ceil(percentile / 100 * len(sorted_values)) - 1))
+    return sorted_values[rank]
+
+def summarize_latencies(durations: List[float], total_seconds: Optional[float] = None) -> Dict:
+    """질의별 처리 시간(초) → 지연시간 요약(ms)과 처리량"""
+    ordered = sorted(durations)
+    total = total_seconds if total_seconds is not None else sum(durations)
+    return {
+        "count": len(durations),
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 4),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 4),
+        "p99_ms": round(_percentile(ordered, 99) * 1000, 4),
+        "mean_ms": round(statistics.fmean(durations) * 1000, 4) if durations else 0.0,
+        "max_ms": round(ordered[-1] * 1000, 4) if ordered else 0.0,
+        "throughput_qps": round(len(durations) / total, 2) if total > 0 else None
+    }
+
+def peak_rss_mb() -> float:
+    """프로세스 최대 RSS (MB, 지금까지의 최댓값)"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 1)
+
+@contextlib.contextmanager
+def _quiet():
+    """구성요소 초기화 출력 숨김 (벤치마크 결과만 출력)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+class StageBenchmark:
+    """한 규모의 인재 데이터로 만든 검색 시스템에서 단계별 측정
+    
+    앞 단계 결과(파싱 결과, payload 후보, 벡터 결과)를 입력으로 다음 단계를 따로 측정한다.
+    """
+    
+    def __init__(self, system, queries: List[str]):
+        self.system = system
+        self.queries = queries
+        self.budget = dict(system.candidate_budget)
+        self.parser = system.get_parser()
+        
+        # 단계 입력 준비 (측정 대상 아님)
+        with _quiet():
+            self.parsed = [self.parser.parse(query) for query in queries]
+            self.weights = [system.weight_controller.calculate_weights(parsed) for parsed in self.parsed]
+            self.payload_results = [self._payload(i) for i in range(len(queries))]
+            self.vector_results = [self._vector(i) for i in range(len(queries))]
+    
+    def _payload(self, i: int):
+        return self.system.payload_searcher.search(self.parsed[i], top_k=self.budget["payload"])
+    
+    def _vector(self, i: int):
+        return self.system.vector_searcher.search(self.parsed[i], self.payload_results[i], top_k=self.budget["vector"])
+    
+    def _rerank(self, i: int):
+        return self.system.reranker.rerank(self.vector_results[i], self.weights[i], top_k=self.budget["rerank"])
+    
+    def per_query_stages(self) -> Dict[str, Callable[[int], object]]:
+        return {
+            "parse": lambda i: self.parser.parse(self.queries[i]),
+            "payload": self._payload,
+            "vector": self._vector,
+            "rerank": self._rerank,
+            "end_to_end": lambda i: self.system.search_talents_chatbot(self.queries[i])
+        }
+    
+    def run(self, stages: Iterable[str], memory_queries: int = DEFAULT_MEMORY_QUERIES) -> Dict[str, Dict]:
+        results = {}
+        per_query = self.per_query_stages()
+        
+        for stage in stages:
+            if stage == "batch":
+                results[stage] = self._run_batch(memory_queries)
+                continue
+            
+            run_query = per_query[stage]
+            with _quiet():
+                for i in range(min(WARM_UP_QUERIES, len(self.queries))):
+                    run_query(i)
+                
+                durations = []
+                for i in range(len(self.queries)):
+                    started = time.perf_counter()
+                    run_query(i)
+                    durations.append(time.perf_counter() - started)
+                
+                peak = self._measure_peak(lambda: [run_query(i) for i in range(min(memory_queries, len(self.queries)))])
+            
+            results[stage] = summarize_latencies(durations)
+            results[stage]["peak_memory_mb"] = peak
+        
+        return results
+    
+    def _run_batch(self, memory_queries: int) -> Dict:
+        with _quiet():
+            self.system.search_batch(self.queries[:WARM_UP_QUERIES])
+            started = time.perf_counter()
+            self.system.search_batch(self.queries)
+            elapsed = time.perf_counter() - started
+            peak = self._measure_peak(lambda: self.system.search_batch(self.queries[:memory_queries]))
+        
+        # 일괄 검색은 질의별 시간이 없으므로 평균값으로 요약
+        summary = summarize_latencies([elapsed / len(self.queries)] * len(self.queries), elapsed)
+        summary["request_ms"] = round(elapsed * 1000, 4)
+        summary["peak_memory_mb"] = peak
+        return summary
+    
+    @staticmethod
+    def _measure_peak(run: Callable[[], object]) -> float:
+        """실행 중 늘어난 최대 할당량 (MB, NumPy 배열 포함)"""
+        gc.collect()
+        tracemalloc.start()
+        try:
+            baseline = tracemalloc.get_traced_memory()[0]
+            run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        return round((peak - baseline) / (1024 * 1024), 3)
+
+def build_system(size: int, seed: int):
+    """합성 인재 size명으로 검색 시스템 생성 (파싱/결과 캐시 비활성화)"""
+    with _quiet():
+        # main import 시 생성되는 기본 시스템의 초기화 출력도 숨김
+        from main import TalentSearchSystem
+        from parse_cache import ParseCache
+        from result_cache import ResultCache
+        from example.talent_data import TalentDatabase
+        
+        talent_db = TalentDatabase(seed_scenario_data=False)
+        talent_db.add_talents(iter_synthetic_talents(size, seed))
+        return TalentSearchSystem(talent_db=talent_db, parse_cache=ParseCache(max_size=0),
+                                  result_cache=ResultCache(max_size=0))
+
+def run_benchmarks(sizes: Iterable[int], query_count: int = DEFAULT_QUERY_COUNT, seed: int = DEFAULT_SEED,
+                   stages: Iterable[str] = STAGES, memory_queries: int = DEFAULT_MEMORY_QUERIES) -> Dict:
+    """규모별 벤치마크 실행 (작은 규모부터 - 최대 RSS가 규모 순으로 늘어나도록)"""
+    queries = generate_queries(query_count, seed)
+    stages = list(stages)
+    report = {"environment": environment_info(), "seed": seed, "queries": query_count, "results": []}
+    
+    for size in sorted(sizes):
+        gc.collect()
+        started = time.perf_counter()
+        system = build_system(size, seed)
+        build_seconds = time.perf_counter() - started
+        
+        benchmark = StageBenchmark(system, queries)
+        entry = {
+            "size": size,
+            "build": {"seconds": round(build_seconds, 3), "peak_rss_mb": peak_rss_mb()},
+            "stages": benchmark.run(stages, memory_queries)
+        }
+        entry["peak_rss_mb"] = peak_rss_mb()
+        report["results"].append(entry)
+        print_result(entry)
+        
+        del benchmark, system
+    
+    return report
+
+def environment_info() -> Dict:
+    try:
+        import numpy
+        numpy_version = numpy.__version__
+    except ImportError:
+        numpy_version = None
+    
+    try:
+        cores = len(os.sched_getaffinity(0))
+    except AttributeError:
+        cores = os.cpu_count()
+    
+    return {
+        "python": platform.python_version(),
+        "numpy": numpy_version,
+        "platform": platform.platform(),
+        "cores": cores
+    }
+
+def print_result(entry: Dict):
+    print(f"\n📏 인재 {entry['size']:,}명 - 구축 {entry['build']['seconds']:.2f}초, "
+          f"최대 RSS {entry['peak_rss_mb']:.0f}MB")
+    print(f"  {'단계':<12}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'평균(ms)':>10}{'질의/초':>10}{'메모리(MB)':>12}")
+    for stage, summary in entry["stages"].items():
+        print(f"  {stage:<12}{summary['p50_ms']:>10.3f}{summary['p95_ms']:>10.3f}{summary['p99_ms']:>10.3f}"
+              f"{summary['mean_ms']:>10.3f}{summary['throughput_qps'] or 0:>10.1f}{summary['peak_memory_mb']:>12.2f}")
+
+def main(argv: Optional[Iterable[str]] = None):
+    parser = argparse.ArgumentParser(description="인재 검색 규모별/단계별 성능 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES), help="합성 인재 수 목록")
+    parser.add_argument("--queries", type=int, default=DEFAULT_QUERY_COUNT, help="측정 질의 수")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="데이터/질의 시드")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES), help="측정할 단계")
+    parser.add_argument("--memory-queries", type=int, default=DEFAULT_MEMORY_QUERIES,
+                        help="메모리 측정에 쓸 질의 수")
+    parser.add_argument("--json", help="결과 JSON 저장 경로 (규모 간/실행 간 비교용)")
+    args = parser.parse_args(argv)
+    
+    print(f"🏁 벤치마크 시작: 규모 {', '.join(f'{size:,}' for size in sorted(args.sizes))}명, 질의 {args.queries}개")
+    report = run_benchmarks(args.sizes, args.queries, args.seed, args.stages, args.memory_queries)
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json}")
+
+if __name__ == "__main__":
+    main()
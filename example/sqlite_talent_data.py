@@ -0,0 +1,423 @@
+"""
+디스크 기반 인재 데이터베이스 (SQLite)
+필터링 컬럼만 색인해 두고, 전체 프로필 JSON은 필터를 통과한 인재만 로드
+"""
+
+import json
+import sqlite3
+import threading
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+from example.talent_data import INDEXED_FIELDS, TalentDatabase
+
+# talents 테이블에 컬럼으로 저장하는 점수 계산용 필드
+SCORING_COLUMNS = (
+    "age",
+    "experience_years",
+    "residence",
+    "industry_domain",
+    "industry_knowledge",
+    "specialization",
+    "talent_level"
+)
+
+# 단일 값 범주형 컬럼 (B-tree 색인 대상)
+INDEXED_COLUMNS = ("age", "experience_years", "residence", "industry_domain", "specialization", "talent_level")
+
+# SQLite 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+QUERY_CHUNK_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS talents (
+    id TEXT NOT NULL UNIQUE,
+    age INTEGER,
+    experience_years INTEGER,
+    residence TEXT,
+    industry_domain TEXT,
+    industry_knowledge TEXT,
+    specialization TEXT,
+    talent_level TEXT,
+    profile TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS talent_postings (
+    field TEXT NOT NULL,
+    value TEXT NOT NULL,
+    talent_rowid INTEGER NOT NULL,
+    PRIMARY KEY (field, value, talent_rowid)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_postings_talent ON talent_postings (talent_rowid);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO meta (key, value) VALUES ('data_version', 0);
+"""
+
+class SQLiteTalentDatabase:
+    """SQLite(WAL) 기반 인재 데이터베이스 - TalentDatabase와 같은 인터페이스"""
+    
+    is_disk_backed = True
+    
+    def __init__(self, db_path: str = "talents.db", seed_scenario_data: bool = True):
+        self.db_path = db_path
+        self._lock = threading.RLock()
+        self._change_listeners = []
+        
+        self._conn = self._connect()
+        self._conn.executescript(SCHEMA)
+        for column in INDEXED_COLUMNS:
+            self._conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_talents_{column} ON talents ({column})"
+            )
+        self._conn.commit()
+        
+        if seed_scenario_data and self.get_talent_count() == 0:
+            self.add_talents(TalentDatabase._generate_scenario_data())
+        
+        print(f"💾 SQLite 인재 데이터베이스 연결: {db_path} ({self.get_talent_count()}명)")
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
+    
+    def reopen(self):
+        """fork된 자식 프로세스에서 새 연결 생성 (SQLite 연결은 fork 경계를 넘어 쓰면 안 됨)
+        
+        부모 프로세스의 연결은 닫지 않고 참조만 남겨 두어 부모 쪽 상태를 건드리지 않는다.
+        """
+        self._lock = threading.RLock()
+        self._inherited_conns = getattr(self, "_inherited_conns", []) + [self._conn]
+        self._conn = self._connect()
+    
+    def close(self):
+        """연결 종료"""
+        with self._lock:
+            self._conn.close()
+    
+    @staticmethod
+    def _row_values(talent: Dict) -> tuple:
+        """talents 테이블 행 값 (id, 점수 계산 컬럼, 프로필 JSON)"""
+        knowledge = talent.get("industry_knowledge")
+        return (
+            talent["id"],
+            talent.get("age"),
+            talent.get("experience_years"),
+            talent.get("residence"),
+            talent.get("industry_domain"),
+            json.dumps(knowledge, ensure_ascii=False) if knowledge is not None else None,
+            talent.get("specialization"),
+            talent.get("talent_level"),
+            json.dumps(talent, ensure_ascii=False)
+        )
+    
+    def _insert_talent(self, talent: Dict, postings: Optional[Set[tuple]] = None) -> int:
+        """인재 한 명 저장 (트랜잭션 내부에서 호출, postings가 주어지면 posting 행은 모아서 저장)"""
+        cursor = self._conn.execute(
+            f"INSERT INTO talents ({', '.join(('id',) + SCORING_COLUMNS + ('profile',))}) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+            self._row_values(talent)
+        )
+        rowid = cursor.lastrowid
+        if postings is None:
+            self._insert_postings(self._posting_rows(rowid, talent))
+        else:
+            postings.update(self._posting_rows(rowid, talent))
+        return rowid
+    
+    @staticmethod
+    def _posting_rows(rowid: int, talent: Dict) -> Set[tuple]:
+        """역색인(posting) 행 목록"""
+        return {
+            (field, value, rowid)
+            for field in INDEXED_FIELDS
+            for value in TalentDatabase._index_values(talent, field)
+        }
+    
+    def _insert_postings(self, postings: Iterable[tuple]):
+        """역색인(posting) 행 저장"""
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO talent_postings (field, value, talent_rowid) VALUES (?, ?, ?)",
+            postings
+        )
+    
+    def _bump_version(self):
+        """데이터 버전 증가 (트랜잭션 내부에서 호출)"""
+        self._conn.execute("UPDATE meta SET value = value + 1 WHERE key = 'data_version'")
+    
+    def add_talent(self, talent_data: Dict) -> bool:
+        """새 인재 추가"""
+        if "id" not in talent_data:
+            return False
+        
+        with self._lock:
+            try:
+                with self._conn:
+                    self._insert_talent(talent_data)
+                    self._bump_version()
+            except sqlite3.IntegrityError:
+                # 중복 ID
+                return False
+        
+        self._notify_changed([talent_data["id"]])
+        return True
+    
+    def add_talents(self, talents: Iterable[Dict]) -> int:
+        """여러 인재를 한 트랜잭션으로 추가 (중복/ID 없는 항목은 건너뜀, posting 행은 한 번에 저장)"""
+        added_ids = []
+        postings = set()
+        
+        with self._lock:
+            with self._conn:
+                for talent in talents:
+                    if "id" not in talent:
+                        continue
+                    try:
+                        self._insert_talent(talent, postings)
+                        added_ids.append(talent["id"])
+                    except sqlite3.IntegrityError:
+                        continue
+                if added_ids:
+                    self._insert_postings(sorted(postings))
+                    self._bump_version()
+        
+        if added_ids:
+            self._notify_changed(added_ids)
+        return len(added_ids)
+    
+    def bulk_load(self, path: str, chunk_size: Optional[int] = None,
+                  file_format: Optional[str] = None, verbose: bool = True) -> Dict:
+        """JSONL/CSV 파일 대량 적재 (청크마다 한 트랜잭션)"""
+        from example.talent_loader import DEFAULT_CHUNK_SIZE, bulk_load
+        
+        return bulk_load(self, path, chunk_size or DEFAULT_CHUNK_SIZE, file_format, verbose)
+    
+    def update_talent(self, talent_id: str, update_data: Dict) -> bool:
+        """인재 정보 업데이트"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT rowid, profile FROM talents WHERE id = ?", (talent_id,)
+            ).fetchone()
+            if row is None:
+                return False
+            
+            rowid, profile = row
+            talent = json.loads(profile)
+            talent.update(update_data)
+            
+            assignments = ", ".join(f"{column} = ?" for column in ("id",) + SCORING_COLUMNS + ("profile",))
+            try:
+                with self._conn:
+                    # rowid(저장 순서)는 유지하고 컬럼과 posting만 교체
+                    self._conn.execute(
+                        f"UPDATE talents SET {assignments} WHERE rowid = ?",
+                        self._row_values(talent) + (rowid,)
+                    )
+                    self._conn.execute("DELETE FROM talent_postings WHERE talent_rowid = ?", (rowid,))
+                    self._insert_postings(self._posting_rows(rowid, talent))
+                    self._bump_version()
+            except sqlite3.IntegrityError:
+                # 변경된 ID가 기존 인재와 중복
+                return False
+        
+        self._notify_changed([talent_id, talent["id"]])
+        return True
+    
+    def delete_talent(self, talent_id: str) -> bool:
+        """인재 정보 삭제"""
+        with self._lock:
+            with self._conn:
+                row = self._conn.execute(
+                    "SELECT rowid FROM talents WHERE id = ?", (talent_id,)
+                ).fetchone()
+                if row is None:
+                    return False
+                
+                self._conn.execute("DELETE FROM talent_postings WHERE talent_rowid = ?", (row[0],))
+                self._conn.execute("DELETE FROM talents WHERE rowid = ?", (row[0],))
+                self._bump_version()
+        
+        self._notify_changed([talent_id])
+        return True
+    
+    def add_change_listener(self, listener: Callable[[List[str]], None]):
+        """인재 추가/수정/삭제 시 변경된 ID 목록을 받을 콜백 등록 (하위 캐시 무효화용)"""
+        self._change_listeners.append(listener)
+    
+    def _notify_changed(self, changed_ids: List[str]):
+        """커밋된 추가/수정/삭제를 리스너에 통지"""
+        for listener in self._change_listeners:
+            listener(changed_ids)
+    
+    def _query(self, sql: str, params: Iterable = ()) -> List[tuple]:
+        with self._lock:
+            return self._conn.execute(sql, tuple(params)).fetchall()
+    
+    def get_data_version(self) -> int:
+        """데이터 버전 (다른 프로세스의 변경도 반영)"""
+        return self._query("SELECT value FROM meta WHERE key = 'data_version'")[0][0]
+    
+    def get_talent_count(self) -> int:
+        """현재 인재 수"""
+        return self._query("SELECT COUNT(*) FROM talents")[0][0]
+    
+    def get_posting_ids(self, field: str, values: Iterable[str]) -> Set[str]:
+        """주어진 값 중 하나라도 가진 인재 ID 집합"""
+        values = list(values)
+        ids = set()
+        
+        for start in range(0, len(values), QUERY_CHUNK_SIZE):
+            chunk = values[start:start + QUERY_CHUNK_SIZE]
+            rows = self._query(
+                "SELECT t.id FROM talent_postings p JOIN talents t ON t.rowid = p.talent_rowid "
+                f"WHERE p.field = ? AND p.value IN ({','.join('?' * len(chunk))})",
+                [field] + chunk
+            )
+            ids.update(row[0] for row in rows)
+        
+        return ids
+    
+    def get_index_values(self, field: str) -> List[str]:
+        """역색인에 등록된 필드 값 목록"""
+        rows = self._query("SELECT DISTINCT value FROM talent_postings WHERE field = ?", (field,))
+        return [row[0] for row in rows]
+    
+    def get_columns(self):
+        """컬럼형 저장소는 메모리 백엔드 전용"""
+        return None
+    
+    def get_scoring_rows(self, constraints: Optional[Dict[str, Set[str]]] = None) -> List[Dict]:
+        """점수 계산용 경량 행 조회 (색인 컬럼 + 정규화된 기술 스택, 프로필 JSON 제외)
+        
+        constraints가 있으면 하나 이상의 posting에 속한 인재만, 없으면 전체 인재를 저장 순서대로 반환
+        """
+        candidate_filter = ""
+        params = []
+        
+        if constraints:
+            clauses = []
+            for field, values in constraints.items():
+                values = list(values)
+                clauses.append(f"(field = ? AND value IN ({','.join('?' * len(values))}))")
+                params.extend([field] + values)
+            candidate_filter = (" IN (SELECT talent_rowid FROM talent_postings WHERE "
+                                + " OR ".join(clauses) + ")")
+        
+        columns = ", ".join(("rowid", "id") + SCORING_COLUMNS)
+        where = f" WHERE rowid{candidate_filter}" if candidate_filter else ""
+        rows = self._query(f"SELECT {columns} FROM talents{where} ORDER BY rowid", params)
+        
+        scoring_rows = {}
+        for row in rows:
+            record = dict(zip(("rowid", "id") + SCORING_COLUMNS, row))
+            if record["industry_knowledge"] is not None:
+                record["industry_knowledge"] = json.loads(record["industry_knowledge"])
+            record["skills"] = []
+            scoring_rows[record.pop("rowid")] = record
+        
+        skill_sql = "SELECT talent_rowid, value FROM talent_postings WHERE field = 'skills'"
+        if candidate_filter:
+            skill_sql += f" AND talent_rowid{candidate_filter}"
+        for rowid, skill in self._query(skill_sql, params):
+            if rowid in scoring_rows:
+                scoring_rows[rowid]["skills"].append(skill)
+        
+        return list(scoring_rows.values())
+    
+    def get_profiles(self, talent_ids: List[str]) -> Dict[str, Dict]:
+        """전체 프로필 JSON 로드 (필터를 통과한 인재만 호출)"""
+        profiles = {}
+        
+        for start in range(0, len(talent_ids), QUERY_CHUNK_SIZE):
+            chunk = talent_ids[start:start + QUERY_CHUNK_SIZE]
+            rows = self._query(
+                f"SELECT id, profile FROM talents WHERE id IN ({','.join('?' * len(chunk))})",
+                chunk
+            )
+            profiles.update((talent_id, json.loads(profile)) for talent_id, profile in rows)
+        
+        return profiles
+    
+    def get_all_talents(self) -> List[Dict]:
+        """모든 인재 정보 반환 (전체 프로필 로드 - 대용량에서는 get_scoring_rows 사용 권장)"""
+        return [json.loads(row[0]) for row in self._query("SELECT profile FROM talents ORDER BY rowid")]
+    
+    def get_talent_by_id(self, talent_id: str) -> Optional[Dict]:
+        """ID로 특정 인재 조회"""
+        rows = self._query("SELECT profile FROM talents WHERE id = ?", (talent_id,))
+        return json.loads(rows[0][0]) if rows else None
+    
+    def get_talents_by_filter(self, filters: Dict) -> List[Dict]:
+        """필터 조건으로 인재 검색 (컬럼 조건은 SQL, 나머지는 프로필에서 확인)"""
+        clauses = []
+        params = []
+        profile_filters = {}
+        
+        for key, value in filters.items():
+            if key not in INDEXED_COLUMNS:
+                profile_filters[key] = value
+            elif isinstance(value, list):
+                non_null = [v for v in value if v is not None]
+                options = [f"{key} IN ({','.join('?' * len(non_null))})"] if non_null else []
+                if None in value:
+                    options.append(f"{key} IS NULL")
+                clauses.append("(" + " OR ".join(options) + ")" if options else "0")
+                params.extend(non_null)
+            else:
+                clauses.append(f"{key} IS ?")
+                params.append(value)
+        
+        where = " WHERE " + " AND ".join(clauses) if clauses else ""
+        rows = self._query(f"SELECT profile FROM talents{where} ORDER BY rowid", params)
+        
+        filtered_talents = []
+        for row in rows:
+            talent = json.loads(row[0])
+            match = True
+            
+            for key, value in profile_filters.items():
+                if key in talent:
+                    if isinstance(value, list):
+                        if talent[key] not in value:
+                            match = False
+                            break
+                    elif talent[key] != value:
+                        match = False
+                        break
+            
+            if match:
+                filtered_talents.append(talent)
+        
+        return filtered_talents
+    
+    def get_statistics(self) -> Dict:
+        """인재 통계 정보 (SQL 집계)"""
+        stats = {
+            "total_count": self.get_talent_count(),
+            "by_specialization": {},
+            "by_residence": {},
+            "by_industry": {},
+            "by_talent_level": {},
+            "experience_distribution": {}
+        }
+        
+        for key, column in (("by_specialization", "specialization"),
+                            ("by_residence", "residence"),
+                            ("by_industry", "industry_domain"),
+                            ("by_talent_level", "talent_level")):
+            rows = self._query(f"SELECT {column}, COUNT(*) FROM talents GROUP BY {column}")
+            stats[key] = {value: count for value, count in rows}
+        
+        rows = self._query(
+            "SELECT CASE "
+            "WHEN COALESCE(experience_years, 0) <= 2 THEN '0-2년' "
+            "WHEN experience_years <= 5 THEN '3-5년' "
+            "WHEN experience_years <= 10 THEN '6-10년' "
+            "ELSE '11년+' END AS bucket, COUNT(*) FROM talents GROUP BY bucket"
+        )
+        buckets = dict(rows)
+        for bucket in ("0-2년", "3-5년", "6-10년", "11년+"):
+            stats["experience_distribution"][bucket] = buckets.get(bucket, 0)
+        
+        return stats
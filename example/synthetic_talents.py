@@ -0,0 +1,250 @@
+"""
+합성 인재 데이터 생성 모듈
+시나리오 데이터와 같은 스키마/값 체계(파서 매핑의 지역·산업·전문분야·기술 스택)로 임의 규모의 인재를 시드 고정 생성
+- 전문 분야별 기술 스택 묶음으로 기술 동시 출현 재현 (NE → 시스코/스위치/라우터 등)
+- 산업 도메인별 산업 지식, 경력별 나이·인재 등급, 전문 분야별 자격증 분포
+- 벡터 필드는 시나리오 데이터와 같은 문구 패턴 ("화웨이 네트워크 유지보수 4년", "Java, Spring 전문" 등)
+
+같은 시드면 작은 규모 데이터가 큰 규모 데이터의 앞부분과 같다 (10k ⊂ 100k ⊂ 1M).
+
+사용 예:
+    python -m example.synthetic_talents 100000 --seed 7 --out talents_100k.jsonl
+"""
+
+import argparse
+import json
+import random
+import time
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+DEFAULT_SEED = 42
+
+# (값, 비중) - 실제 데이터가 없는 값(None) 비중 포함
+REGION_WEIGHTS = (
+    ("서울", 36), ("경기도", 22), ("인천", 6), ("부산", 6), ("대전", 5),
+    ("대구", 4), ("광주", 3), ("울산", 3), (None, 15)
+)
+
+INDUSTRY_WEIGHTS = (
+    ("금융", 34), ("공공", 18), ("제조", 14), ("유통", 10), ("에너지", 10), ("일반", 8), (None, 6)
+)
+
+# 산업 도메인 → 산업 지식 분포
+INDUSTRY_KNOWLEDGE_WEIGHTS = {
+    "금융": (("은행", 30), ("보험", 25), ("증권", 15), ("인프라", 20), (None, 10)),
+    "공공": (("군업무", 25), ("공통", 40), ("인프라", 15), (None, 20)),
+    "제조": (("공통", 40), ("인프라", 30), (None, 30)),
+    "유통": (("공통", 50), (None, 50)),
+    "에너지": (("전력", 45), ("인프라", 30), (None, 25)),
+    "일반": (("공통", 40), ("메디컬", 15), (None, 45)),
+    None: (("공통", 20), (None, 80))
+}
+
+SPECIALIZATION_WEIGHTS = (
+    ("DVLP", 20), ("SE", 16), ("NE", 14), ("OP", 9), ("DBA", 8), ("보안", 7), ("AA", 5),
+    ("PMO", 5), ("WAS", 4), ("QA", 4), ("SI", 3), ("SM", 3), ("회계", 2)
+)
+
+# 전문 분야 → 기술 스택 묶음 (한 묶음 안의 기술이 함께 나타남)
+SKILL_BUNDLES = {
+    "NE": (("cisco", "switch", "router"), ("시스코", "네트워크", "장비 구축"), ("화웨이", "네트워크 유지보수"),
+           ("juniper", "firewall"), ("dns", "proxy")),
+    "SE": (("linux", "redhat", "centos"), ("unix", "aix"), ("x86 서버", "이중화"), ("가상화", "windows"),
+           ("docker", "kubernetes")),
+    "DVLP": (("java", "spring"), ("python", "django"), ("javascript", "react"), ("c#", ".net"), ("php", "mysql")),
+    "DBA": (("oracle", "rac"), ("mysql", "postgresql"), ("mssql",), ("mongodb", "redis"), ("오라클", "튜닝")),
+    "보안": (("방화벽", "ips", "ids"), ("waf", "dlp"), ("apm", "취약점 점검"), ("보안관제",)),
+    "AA": (("java", "spring", "msa"), ("아키텍처 설계",), ("aws", "azure")),
+    "PMO": (("일정 관리", "품질 관리"), ("jira", "confluence"), ("요구사항 분석",)),
+    "OP": (("모니터링", "zabbix"), ("linux", "shell"), ("장애 대응",), ("nginx", "apache")),
+    "WAS": (("tomcat", "weblogic"), ("jboss", "jeus"), ("nginx", "apache")),
+    "QA": (("테스트 자동화", "selenium"), ("품질보증",), ("jmeter", "성능 테스트")),
+    "SI": (("java", "spring"), ("oracle",), ("javascript",)),
+    "SM": (("java", "spring", "ncrm"), ("oracle", "유지보수")),
+    "회계": (("sap", "fi/co"), ("erp",), ("더존",))
+}
+
+# 분야 무관하게 덧붙는 기술 (비중)
+COMMON_SKILLS = (("linux", 6), ("aws", 5), ("oracle", 4), ("python", 3), ("docker", 3), ("git", 3))
+
+CERTIFICATIONS = {
+    "NE": ("CCNA", "CCNP", "네트워크관리사"),
+    "SE": ("RHCSA", "RHCE", "리눅스마스터"),
+    "DVLP": ("정보처리기사", "SCJP"),
+    "DBA": ("OCP", "SQLP", "SQLD"),
+    "보안": ("CISSP", "정보보안기사", "CISA"),
+    "AA": ("정보처리기사", "AWS SAA"),
+    "PMO": ("PMP",),
+    "OP": ("리눅스마스터", "정보처리기사"),
+    "WAS": ("정보처리기사",),
+    "QA": ("ISTQB",),
+    "SI": ("정보처리기사",),
+    "SM": ("정보처리기사",),
+    "회계": ("전산회계", "AICPA")
+}
+
+# 전문 분야 → 벡터 필드 문구에 쓰는 분야명
+SPECIALIZATION_LABELS = {
+    "NE": "네트워크", "SE": "시스템", "DVLP": "개발", "DBA": "데이터베이스", "보안": "보안",
+    "AA": "아키텍처", "PMO": "프로젝트 관리", "OP": "시스템 운영", "WAS": "웹서버", "QA": "품질보증",
+    "SI": "SI", "SM": "SM", "회계": "회계 시스템"
+}
+
+COMPETENCIES = ("유지보수", "구축", "정기점검", "장애 대응", "운영", "설계", "모니터링", "이중화 구축")
+
+SCALE_PHRASES = (
+    "대규모 {label} 프로젝트 수행", "대형 시스템 리뉴얼 프로젝트 참여", "중규모 {label} 운영 프로젝트",
+    "중대형 시스템 유지보수", "소규모 인프라 유지보수", "이중화 클러스터 운영 경험", "글로벌 {label} 구축 참여"
+)
+
+LEADERSHIP_PHRASES = (
+    "팀 리딩 경험 있음", "{industry} 구축 주도", "PL 역할 수행 {years}년", "팀장 경험", "{industry}권 현장 대응"
+)
+
+COMPLIANCE_PHRASES = (
+    "금융권 보안 규제 대응", "ISMS 인증 심사 대응", "개인정보보호 컴플라이언스 점검", "보안 감사 대응 경험"
+)
+
+SURNAMES = ("김", "이", "박", "최", "정", "강", "조", "윤", "장", "임", "한", "오", "서", "신", "권")
+GIVEN_NAMES = ("철수", "영희", "민수", "지훈", "서연", "도윤", "하은", "준호", "수빈", "현우", "지민", "예진")
+
+# 합성 질의 구성 요소 (파서가 인식하는 표현)
+QUERY_PARTS = {
+    "region": ("서울", "경기", "판교", "부산", "인천", "대전"),
+    "age": ("20대", "30대", "40대", "30대 중반", "50대"),
+    "industry": ("금융", "은행", "보험", "공공", "제조", "에너지", "유통"),
+    "specialization": ("NE", "SE", "DBA", "개발", "보안", "운영", "WAS", "PMO", "QA"),
+    "experience": ("3년 이상", "5년 이상", "7년 이상", "10년 이상", "경력 15년"),
+    "level": ("고급", "중급", "초급", "시니어"),
+    "skill": ("oracle", "java", "linux", "cisco", "aws", "tomcat", "mysql", "spring", "nginx", "방화벽"),
+    "context": ("유지보수", "구축", "팀장", "대규모", "긴급", "운영", "보안 인증", "상주")
+}
+
+def _weighted_choice(rng: random.Random, weighted: Sequence[Tuple]):
+    values, weights = zip(*weighted)
+    return rng.choices(values, weights=weights)[0]
+
+def _pick_skills(rng: random.Random, specialization: str) -> List[str]:
+    """전문 분야 기술 묶음 1~2개에서 기술 선택 + 공통 기술 가끔 추가 (중복 제거, 순서 유지)"""
+    bundles = SKILL_BUNDLES[specialization]
+    skills = []
+    for bundle in rng.sample(bundles, min(len(bundles), rng.choice((1, 1, 2)))):
+        skills.extend(rng.sample(bundle, rng.randint(1, len(bundle))))
+    if rng.random() < 0.3:
+        skills.append(_weighted_choice(rng, COMMON_SKILLS))
+    return list(dict.fromkeys(skills))
+
+def _talent_level(rng: random.Random, experience_years: int) -> Optional[str]:
+    roll = rng.random()
+    if roll < 0.08:
+        return None
+    if roll < 0.12:
+        return "무관"
+    if experience_years >= 9:
+        return "고급"
+    if experience_years >= 4:
+        return "중급"
+    return "초급"
+
+def _vector_fields(rng: random.Random, specialization: str, skills: List[str], experience_years: int,
+                   industry: Optional[str], knowledge: Optional[str]) -> Dict[str, Optional[str]]:
+    """시나리오 데이터 문구 패턴으로 벡터 필드 생성"""
+    label = SPECIALIZATION_LABELS[specialization]
+    lead_skill = skills[0] if skills else label
+    industry_text = " ".join(value for value in (industry, knowledge) if value) or None
+    
+    competency = rng.choice(COMPETENCIES)
+    if rng.random() < 0.5:
+        professional = f"{lead_skill} {label} {competency} {max(experience_years, 1)}년"
+    else:
+        professional = f"{', '.join(skills[:3]) or label} 기반 {competency} 경험"
+    
+    technical = f"{', '.join(skills[:2])} 전문" if skills else f"{label} 전문"
+    
+    leadership = None
+    if experience_years >= 8 and rng.random() < 0.55:
+        leadership = rng.choice(LEADERSHIP_PHRASES).format(industry=industry or label, years=experience_years // 3)
+    elif rng.random() < 0.1:
+        leadership = f"{industry or label}권 현장 대응"
+    
+    scale = rng.choice(SCALE_PHRASES).format(label=label) if rng.random() < 0.85 else None
+    
+    compliance = None
+    if specialization == "보안" or (industry == "금융" and rng.random() < 0.25) or rng.random() < 0.05:
+        compliance = rng.choice(COMPLIANCE_PHRASES)
+    
+    return {
+        "professional_competency": professional,
+        "technical_expertise": technical,
+        "leadership_experience": leadership,
+        "scale_complexity": scale,
+        "compliance_security": compliance,
+        "industry_specialization": industry_text
+    }
+
+def _make_talent(rng: random.Random, talent_id: str) -> Dict:
+    specialization = _weighted_choice(rng, SPECIALIZATION_WEIGHTS)
+    industry = _weighted_choice(rng, INDUSTRY_WEIGHTS)
+    knowledge = _weighted_choice(rng, INDUSTRY_KNOWLEDGE_WEIGHTS[industry])
+    
+    # 경력 분포: 3~8년에 몰리고 25년까지 꼬리
+    experience_years = min(30, int(rng.gammavariate(2.2, 3.2)))
+    age = min(60, 24 + experience_years + rng.randint(0, 6)) if rng.random() < 0.75 else None
+    skills = _pick_skills(rng, specialization)
+    certifications = [rng.choice(CERTIFICATIONS[specialization])] if rng.random() < 0.35 else None
+    
+    return {
+        "id": talent_id,
+        "name": rng.choice(SURNAMES) + rng.choice(GIVEN_NAMES),
+        "age_min": None,
+        "age_max": None,
+        "age": age,
+        "residence": _weighted_choice(rng, REGION_WEIGHTS),
+        "final_education": None,
+        "industry_domain": industry,
+        "industry_knowledge": knowledge,
+        "industry_detail": None,
+        "specialization": specialization,
+        "experience_years": experience_years,
+        "talent_level": _talent_level(rng, experience_years),
+        "skills": skills,
+        "certifications": certifications,
+        "other_skills": None,
+        "vector_fields": _vector_fields(rng, specialization, skills, experience_years, industry, knowledge)
+    }
+
+def iter_synthetic_talents(count: int, seed: int = DEFAULT_SEED, id_prefix: str = "SYN") -> Iterator[Dict]:
+    """합성 인재 스트리밍 생성 (대규모 적재 시 목록을 만들지 않고 add_talents/파일로 바로 전달)"""
+    rng = random.Random(seed)
+    for i in range(count):
+        yield _make_talent(rng, f"{id_prefix}{seed}_{i:07d}")
+
+def generate_talents(count: int, seed: int = DEFAULT_SEED, id_prefix: str = "SYN") -> List[Dict]:
+    """합성 인재 목록 생성"""
+    return list(iter_synthetic_talents(count, seed, id_prefix))
+
+def generate_queries(count: int, seed: int = DEFAULT_SEED) -> List[str]:
+    """합성 검색 질의 생성 (조건 2~6개 조합, 같은 시드면 같은 질의 목록)"""
+    rng = random.Random(seed)
+    kinds = list(QUERY_PARTS)
+    queries = []
+    for _ in range(count):
+        chosen = rng.sample(kinds, rng.randint(2, 6))
+        queries.append(" ".join(rng.choice(QUERY_PARTS[kind]) for kind in kinds if kind in chosen))
+    return queries
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="합성 인재 데이터 생성 (JSONL)")
+    parser.add_argument("count", type=int, help="생성할 인재 수")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="난수 시드")
+    parser.add_argument("--out", default="synthetic_talents.jsonl", help="출력 JSONL 경로")
+    args = parser.parse_args(argv)
+    
+    started = time.perf_counter()
+    with open(args.out, "w", encoding="utf-8") as f:
+        for talent in iter_synthetic_talents(args.count, args.seed):
+            f.write(json.dumps(talent, ensure_ascii=False) + "\n")
+    print(f"🧪 합성 인재 {args.count:,}명 생성: {args.out} ({time.perf_counter() - started:.1f}초)")
+
+if __name__ == "__main__":
+    main()
@@ -3,16 +3,420 @@
 시나리오 테스트용 실제 데이터
 """
 
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 환경에서는 컬럼형 저장소 비활성화
+    np = None
+
+# 역색인(posting list) 대상 필드
+INDEXED_FIELDS = (
+    "specialization",
+    "industry_domain",
+    "industry_knowledge",
+    "residence",
+    "talent_level",
+    "skills"
+)
+
+# 컬럼형 저장소에서 정수 코드로 표현하는 범주형 필드
+CATEGORICAL_FIELDS = (
+    "residence",
+    "industry_domain",
+    "industry_knowledge",
+    "specialization",
+    "talent_level"
+)
+
+# 컬럼 배열을 다시 할당할 때 늘리는 배수 (슬롯/기술 항목 추가 비용을 분할 상환)
+COLUMN_GROWTH_FACTOR = 2
+
+def _small_int_dtype(size: int):
+    """코드 개수에 맞는 최소 정수 타입"""
+    if size < np.iinfo(np.int16).max:
+        return np.int16
+    return np.int32
+
+def _grown(array: "np.ndarray", capacity: int, dtype=None) -> "np.ndarray":
+    """앞쪽은 array, 나머지는 0으로 채운 capacity 길이의 쓰기 가능한 새 배열"""
+    grown = np.zeros(capacity, dtype=dtype or array.dtype)
+    grown[:len(array)] = array
+    return grown
+
+class CategoryColumn:
+    """범주형 필드 컬럼 (코드 0은 값 없음)
+    
+    코드 → 값 목록과 값 → 코드 사전은 추가만 하므로 이전 컬럼 객체와 공유해도 기존 코드의 의미는 그대로다.
+    """
+    
+    def __init__(self, raw_values: List):
+        self.values = [None]  # 코드 → 원래 값
+        self._lookup = {}
+        codes = [self.encode(value) for value in raw_values]
+        self.codes = np.array(codes, dtype=_small_int_dtype(len(self.values)))
+    
+    @staticmethod
+    def _key(value):
+        # 리스트 값(예: 복수 산업 지식)은 튜플로 묶어 하나의 범주로 취급
+        return tuple(value) if isinstance(value, list) else value
+    
+    def encode(self, value) -> int:
+        """값의 코드 (처음 보는 값은 values에 추가)"""
+        if not value:
+            return 0
+        
+        if self._lookup is None:
+            # 저장된 컬럼을 복원한 뒤 처음 쓸 때 생성
+            self._lookup = {self._key(known): code for code, known in enumerate(self.values) if code}
+        
+        key = self._key(value)
+        code = self._lookup.get(key)
+        if code is None:
+            code = len(self.values)
+            self._lookup[key] = code
+            self.values.append(value)
+        return code
+    
+    def fits_codes(self) -> bool:
+        """모든 코드를 현재 코드 배열 타입으로 표현할 수 있는지"""
+        return len(self.values) - 1 <= np.iinfo(self.codes.dtype).max
+    
+    def resized(self, capacity: int) -> "CategoryColumn":
+        """capacity 행으로 늘린 쓰기 가능한 복사본 (코드 타입은 값 개수에 맞춤)"""
+        column = CategoryColumn.__new__(CategoryColumn)
+        column.values = self.values
+        column._lookup = self._lookup
+        column.codes = _grown(self.codes, capacity, _small_int_dtype(len(self.values)))
+        return column
+    
+    @classmethod
+    def from_codes(cls, values: List, codes: "np.ndarray") -> "CategoryColumn":
+        """저장된 코드 배열과 코드 → 값 목록으로 복원"""
+        column = cls.__new__(cls)
+        column.values = values
+        column._lookup = None
+        column.codes = codes
+        return column
+
+class TalentColumns:
+    """인재 풀의 컬럼형(NumPy) 표현
+    
+    행 번호는 TalentDatabase 슬롯 번호와 같고 alive가 False인 행(삭제된 슬롯, 여유 행)은 검색에서 제외한다.
+    인재 추가/수정/삭제는 write()로 해당 행만 제자리에서 고치므로 풀 크기와 무관한 비용이 든다.
+    기술 스택은 COO 항목(행 번호, 기술 코드)을 뒤에 덧붙이고 이전 항목은 skill_alive로 끄며,
+    인재별 항목은 skill_start:skill_stop 연속 구간에 있다.
+    """
+    
+    def __init__(self, talents: List[Optional[Dict]]):
+        """talents: 슬롯 순 인재 목록 (None은 삭제된 슬롯)"""
+        rows = [talent or {} for talent in talents]
+        self.size = len(rows)
+        self.ids = [row.get("id") for row in rows]
+        self.alive = np.array([talent is not None for talent in talents], dtype=bool)
+        
+        # 수치형 필드 (값 없음은 0)
+        self.age = np.array([row.get("age") or 0 for row in rows], dtype=np.int64)
+        self.experience_years = np.array([row.get("experience_years") or 0 for row in rows], dtype=np.int64)
+        
+        # 범주형 필드
+        self.categories = {
+            field: CategoryColumn([row.get(field) for row in rows])
+            for field in CATEGORICAL_FIELDS
+        }
+        
+        self._build_skill_incidence(rows)
+    
+    def _build_skill_incidence(self, rows: List[Dict]):
+        """기술 스택 희소 행렬 (COO 형식: 행 번호 / 소문자 기술 코드)"""
+        self.skill_vocab = {}
+        entry_rows = []
+        indices = []
+        starts = []
+        stops = []
+        
+        for row, talent in enumerate(rows):
+            starts.append(len(entry_rows))
+            for code in self._skill_codes(talent):
+                entry_rows.append(row)
+                indices.append(code)
+            stops.append(len(entry_rows))
+        
+        self.skill_rows = np.array(entry_rows, dtype=np.int64)
+        self.skill_indices = np.array(indices, dtype=_small_int_dtype(len(self.skill_vocab)))
+        self.skill_alive = np.ones(len(entry_rows), dtype=bool)
+        self.skill_start = np.array(starts, dtype=np.int64)
+        self.skill_stop = np.array(stops, dtype=np.int64)
+        self.skill_count = len(entry_rows)  # 사용 중인 항목 수 (뒤쪽은 여유 공간)
+        self.has_skills = np.array([bool(talent.get("skills")) for talent in rows], dtype=bool)
+    
+    def _skill_codes(self, talent: Dict) -> List[int]:
+        """인재의 (중복 제거된 소문자) 기술 코드 (처음 보는 기술은 skill_vocab에 추가)"""
+        vocab = self.skill_vocab
+        return [vocab.setdefault(skill, len(vocab))
+                for skill in {skill.lower() for skill in talent.get("skills") or [] if skill}]
+    
+    def _arrays(self) -> List["np.ndarray"]:
+        return [self.alive, self.age, self.experience_years, self.has_skills, self.skill_rows,
+                self.skill_indices, self.skill_alive, self.skill_start, self.skill_stop] + \
+            [column.codes for column in self.categories.values()]
+    
+    def write(self, slots: List[int], talents: List[Optional[Dict]]) -> "TalentColumns":
+        """슬롯별 행을 talents로 교체 (None이면 삭제) - 바뀐 행 수에만 비례하는 비용
+        
+        배열이 읽기 전용(스냅샷 메모리 맵)이거나 행/기술 항목/코드 범위가 모자라면
+        여유 있게 늘린 복사본을 새 객체로 만들어 쓰고 반환한다 (COLUMN_GROWTH_FACTOR배씩 늘려 분할 상환).
+        검색 중인 스레드가 보던 배열은 모양이 바뀌지 않고, 제자리 쓰기 중에는 바뀌는 행의 이전/새 값을 본다.
+        """
+        rows = [talent or {} for talent in talents]
+        codes = {field: [column.encode(row.get(field)) for row in rows] for field, column in self.categories.items()}
+        skill_codes = [self._skill_codes(row) for row in rows]
+        added = sum(len(row_codes) for row_codes in skill_codes)
+        
+        columns = self
+        if (max(slots) >= self.size
+                or self.skill_count + added > len(self.skill_rows)
+                or len(self.skill_vocab) - 1 > np.iinfo(self.skill_indices.dtype).max
+                or not all(column.fits_codes() for column in self.categories.values())
+                or not all(array.flags.writeable for array in self._arrays())):
+            columns = self._resized(max(slots) + 1, added)
+        
+        columns._write_rows(slots, talents, rows, codes, skill_codes)
+        return columns
+    
+    def _resized(self, min_size: int, added_entries: int) -> "TalentColumns":
+        """쓰기 가능한 복사본 (행은 필요 시 늘리고, 기술 항목은 꺼진 항목을 빼고 여유 공간 확보)"""
+        size = self.size if min_size <= self.size else max(min_size, self.size * COLUMN_GROWTH_FACTOR)
+        
+        columns = TalentColumns.__new__(TalentColumns)
+        columns.size = size
+        columns.ids = self.ids + [None] * (size - self.size)
+        columns.alive = _grown(self.alive, size)
+        columns.age = _grown(self.age, size)
+        columns.experience_years = _grown(self.experience_years, size)
+        columns.has_skills = _grown(self.has_skills, size)
+        columns.categories = {field: column.resized(size) for field, column in self.categories.items()}
+        
+        # 살아 있는 기술 항목만 앞으로 모으고 인재별 구간 위치를 당김 (인재별 항목은 연속 구간이라 그대로 유지)
+        count = self.skill_count
+        keep = np.asarray(self.skill_alive[:count])
+        kept_before = np.concatenate(([0], np.cumsum(keep)))
+        live = int(kept_before[-1])
+        capacity = max((live + added_entries) * COLUMN_GROWTH_FACTOR, 1)
+        
+        columns.skill_vocab = self.skill_vocab
+        columns.skill_rows = _grown(self.skill_rows[:count][keep], capacity)
+        columns.skill_indices = _grown(self.skill_indices[:count][keep], capacity,
+                                       _small_int_dtype(len(self.skill_vocab)))
+        columns.skill_alive = _grown(keep[keep], capacity)
+        columns.skill_start = _grown(kept_before[self.skill_start], size)
+        columns.skill_stop = _grown(kept_before[self.skill_stop], size)
+        columns.skill_count = live
+        return columns
+    
+    def _write_rows(self, slots: List[int], talents: List[Optional[Dict]], rows: List[Dict],
+                    codes: Dict[str, List[int]], skill_codes: List[List[int]]):
+        """행 제자리 쓰기 (용량과 쓰기 가능 여부는 write()에서 확인)"""
+        positions = np.array(slots, dtype=np.int64)
+        for slot, row in zip(slots, rows):
+            self.ids[slot] = row.get("id")
+        
+        self.age[positions] = [row.get("age") or 0 for row in rows]
+        self.experience_years[positions] = [row.get("experience_years") or 0 for row in rows]
+        for field, column in self.categories.items():
+            column.codes[positions] = codes[field]
+        self.has_skills[positions] = [bool(row.get("skills")) for row in rows]
+        
+        # 새 기술 항목을 뒤에 덧붙여 공개한 다음 이전 항목을 끔
+        start = self.skill_count
+        entry_rows = [slot for slot, row_codes in zip(slots, skill_codes) for _ in row_codes]
+        stop = start + len(entry_rows)
+        self.skill_rows[start:stop] = entry_rows
+        self.skill_indices[start:stop] = [code for row_codes in skill_codes for code in row_codes]
+        self.skill_alive[start:stop] = True
+        self.skill_count = stop
+        
+        for slot in slots:
+            self.skill_alive[self.skill_start[slot]:self.skill_stop[slot]] = False
+        lengths = np.array([len(row_codes) for row_codes in skill_codes], dtype=np.int64)
+        self.skill_stop[positions] = start + np.cumsum(lengths)
+        self.skill_start[positions] = self.skill_stop[positions] - lengths
+        
+        self.alive[positions] = [talent is not None for talent in talents]
+    
+    def match_any(self, field: str, values: Set[str]) -> "np.ndarray":
+        """행별로 필드 값 중 하나라도 values에 있는지 (역색인 posting 합집합과 같은 행, 기술은 소문자 기준)"""
+        if field == "skills":
+            return (self.count_skill_hits(values) > 0) & self.alive
+        
+        column = self.categories[field]
+        table = np.array([
+            any(value in values for value in (raw if isinstance(raw, list) else [raw]) if value) if raw else False
+            for raw in column.values
+        ], dtype=bool)
+        return table[column.codes] & self.alive
+    
+    def take(self, rows: "np.ndarray") -> "TalentColumnRows":
+        """지정 행만의 점수 계산용 보기 (역색인 후보)"""
+        return TalentColumnRows(self, rows)
+    
+    def export_arrays(self) -> Tuple[Dict[str, "np.ndarray"], Dict]:
+        """스냅샷 저장용 (NumPy 배열, 그 외 메타데이터)"""
+        count = self.skill_count
+        arrays = {
+            "alive": self.alive,
+            "age": self.age,
+            "experience_years": self.experience_years,
+            "skill_rows": self.skill_rows[:count],
+            "skill_indices": self.skill_indices[:count],
+            "skill_alive": self.skill_alive[:count],
+            "skill_start": self.skill_start,
+            "skill_stop": self.skill_stop,
+            "has_skills": self.has_skills
+        }
+        for field, column in self.categories.items():
+            arrays[f"category.{field}"] = column.codes
+        
+        meta = {
+            "size": self.size,
+            "ids": self.ids,
+            "skill_count": count,
+            "skill_vocab": self.skill_vocab,
+            "category_values": {field: column.values for field, column in self.categories.items()}
+        }
+        return arrays, meta
+    
+    @classmethod
+    def from_arrays(cls, arrays: Dict[str, "np.ndarray"], meta: Dict) -> "TalentColumns":
+        """export_arrays() 결과로 복원 (배열은 메모리 맵이어도 됨 - 처음 쓸 때 복사)"""
+        columns = cls.__new__(cls)
+        columns.size = meta["size"]
+        columns.ids = meta["ids"]
+        columns.alive = arrays["alive"]
+        columns.age = arrays["age"]
+        columns.experience_years = arrays["experience_years"]
+        columns.categories = {
+            field: CategoryColumn.from_codes(values, arrays[f"category.{field}"])
+            for field, values in meta["category_values"].items()
+        }
+        columns.skill_vocab = meta["skill_vocab"]
+        columns.skill_rows = arrays["skill_rows"]
+        columns.skill_indices = arrays["skill_indices"]
+        columns.skill_alive = arrays["skill_alive"]
+        columns.skill_start = arrays["skill_start"]
+        columns.skill_stop = arrays["skill_stop"]
+        columns.skill_count = meta["skill_count"]
+        columns.has_skills = arrays["has_skills"]
+        return columns
+    
+    def count_skill_hits(self, skills: Iterable[str]) -> "np.ndarray":
+        """인재별로 보유한 (중복 제거된) 지정 기술 개수"""
+        codes = [self.skill_vocab[skill] for skill in set(skills) if skill in self.skill_vocab]
+        if not codes:
+            return np.zeros(self.size, dtype=np.int64)
+        
+        count = self.skill_count
+        hit = np.isin(self.skill_indices[:count], codes) & self.skill_alive[:count]
+        return np.bincount(self.skill_rows[:count][hit], minlength=self.size)
+    
+    def count_skill_hits_batch(self, skill_sets: List[Iterable[str]],
+                               max_cells: int = 4000000) -> "np.ndarray":
+        """여러 기술 집합의 count_skill_hits를 (집합 수, 인재 수) 행렬로 한 번에 계산"""
+        counts = np.zeros((len(skill_sets), self.size), dtype=np.int64)
+        live = np.flatnonzero(self.skill_alive[:self.skill_count])
+        if len(live) == 0:
+            return counts
+        
+        rows = self.skill_rows[live]
+        indices = self.skill_indices[live]
+        indicator = np.zeros((len(skill_sets), len(self.skill_vocab)), dtype=bool)
+        for i, skills in enumerate(skill_sets):
+            for skill in set(skills):
+                code = self.skill_vocab.get(skill)
+                if code is not None and code < indicator.shape[1]:
+                    indicator[i, code] = True
+        
+        # (집합, 항목) 적중 위치를 집합별 행 번호로 모아 한 번에 집계 (메모리 상한 단위로 나눠 계산)
+        step = max(1, max_cells // len(indices))
+        for start in range(0, len(skill_sets), step):
+            chunk = indicator[start:start + step]
+            hit_sets, hit_entries = np.nonzero(chunk[:, indices])
+            counts[start:start + step] = np.bincount(
+                hit_sets * self.size + rows[hit_entries], minlength=len(chunk) * self.size
+            ).reshape(len(chunk), self.size)
+        
+        return counts
+
+class TalentColumnRows:
+    """TalentColumns 일부 행의 점수 계산용 보기 (행 번호는 rows 순서로 0부터)
+    
+    수치/범주 컬럼은 해당 행만 뽑고, 기술 적중 수는 전체 컬럼에서 센 뒤 행만 고른다
+    (행별 기술 항목 구간을 모으는 것보다 COO 항목을 한 번 훑는 편이 빠름).
+    """
+    
+    def __init__(self, columns: TalentColumns, rows: "np.ndarray"):
+        self.columns = columns
+        self.rows = rows
+        self.size = len(rows)
+        self.alive = columns.alive[rows]
+        self.age = columns.age[rows]
+        self.experience_years = columns.experience_years[rows]
+        self.has_skills = columns.has_skills[rows]
+        self.categories = {
+            field: CategoryColumn.from_codes(column.values, column.codes[rows])
+            for field, column in columns.categories.items()
+        }
+    
+    def count_skill_hits(self, skills: Iterable[str]) -> "np.ndarray":
+        return self.columns.count_skill_hits(skills)[self.rows]
+    
+    def count_skill_hits_batch(self, skill_sets: List[Iterable[str]], max_cells: int = 4000000) -> "np.ndarray":
+        return self.columns.count_skill_hits_batch(skill_sets, max_cells)[:, self.rows]
 
 class TalentDatabase:
     """인재 데이터베이스 클래스"""
     
-    def __init__(self):
-        self.talents = self._generate_scenario_data()
+    # 전체 인재를 메모리에 유지 (SQLiteTalentDatabase는 디스크 기반)
+    is_disk_backed = False
+    
+    def __init__(self, seed_scenario_data: bool = True):
+        # 인재 슬롯 목록 (삭제된 슬롯은 None tombstone, 추가 시 재사용)
+        self.talents = self._generate_scenario_data() if seed_scenario_data else []
+        self._id_index = {talent["id"]: slot for slot, talent in enumerate(self.talents)}
+        self._free_slots = []
+        self.data_version = 0
+        
+        self.inverted_index = self._build_inverted_index()
+        self._columns = None
+        self._change_listeners = []
         print(f"👥 시나리오 테스트용 인재 데이터 생성: {len(self.talents)}명")
     
-    def _generate_scenario_data(self) -> List[Dict]:
+    def export_state(self) -> Dict:
+        """스냅샷 저장용 내부 상태 (인재 슬롯, ID 색인, 역색인, 데이터 버전)"""
+        return {
+            "talents": self.talents,
+            "id_index": self._id_index,
+            "free_slots": self._free_slots,
+            "inverted_index": self.inverted_index,
+            "data_version": self.data_version
+        }
+    
+    @classmethod
+    def from_state(cls, state: Dict, columns: Optional[TalentColumns] = None) -> "TalentDatabase":
+        """export_state() 결과로 복원 (시나리오 데이터 생성과 역색인 재구성 생략)"""
+        talent_db = cls.__new__(cls)
+        talent_db.talents = state["talents"]
+        talent_db._id_index = state["id_index"]
+        talent_db._free_slots = state["free_slots"]
+        talent_db.data_version = state["data_version"]
+        talent_db.inverted_index = state["inverted_index"]
+        talent_db._columns = columns
+        talent_db._change_listeners = []
+        print(f"👥 스냅샷에서 인재 데이터 복원: {talent_db.get_talent_count()}명")
+        return talent_db
+    
+    @staticmethod
+    def _generate_scenario_data() -> List[Dict]:
         """시나리오 테스트용 실제 인재 데이터"""
         talents = []
         
@@ -264,22 +668,120 @@ class TalentDatabase:
         
         return talents
     
+    def _build_inverted_index(self) -> Dict[str, Dict[str, Set[str]]]:
+        """필드별 역색인 생성 (필드 → 값 → 인재 ID 집합)"""
+        index = {field: {} for field in INDEXED_FIELDS}
+        
+        for talent in self.get_all_talents():
+            self._index_talent(talent, index)
+        
+        return index
+    
+    @staticmethod
+    def _index_values(talent: Dict, field: str) -> List[str]:
+        """역색인에 등록할 정규화된 필드 값 목록"""
+        value = talent.get(field)
+        if not value:
+            return []
+        
+        values = value if isinstance(value, list) else [value]
+        
+        # 기술 스택은 소문자로 정규화 (PayloadSearcher._match_skills와 동일 기준)
+        if field == "skills":
+            return [v.lower() for v in values if v]
+        return [v for v in values if v]
+    
+    def _index_talent(self, talent: Dict, index: Optional[Dict] = None):
+        """인재 한 명을 역색인에 등록"""
+        index = self.inverted_index if index is None else index
+        talent_id = talent.get("id")
+        
+        for field in INDEXED_FIELDS:
+            postings = index[field]
+            for value in self._index_values(talent, field):
+                postings.setdefault(value, set()).add(talent_id)
+    
+    def _unindex_talent(self, talent: Dict):
+        """인재 한 명을 역색인에서 제거"""
+        talent_id = talent.get("id")
+        
+        for field in INDEXED_FIELDS:
+            postings = self.inverted_index[field]
+            for value in self._index_values(talent, field):
+                ids = postings.get(value)
+                if ids is None:
+                    continue
+                ids.discard(talent_id)
+                if not ids:
+                    del postings[value]
+    
+    def get_posting_ids(self, field: str, values: Iterable[str]) -> Set[str]:
+        """주어진 값 중 하나라도 가진 인재 ID 집합 (posting list 합집합)"""
+        postings = self.inverted_index.get(field, {})
+        ids = set()
+        
+        for value in values:
+            ids |= postings.get(value, set())
+        
+        return ids
+    
+    def get_posting_count(self, field: str, values: Iterable[str]) -> int:
+        """주어진 값들의 posting 크기 합 (합집합 크기의 상한)"""
+        postings = self.inverted_index.get(field, {})
+        return sum(len(postings.get(value, ())) for value in values)
+    
+    def get_index_values(self, field: str) -> List[str]:
+        """역색인에 등록된 필드 값 목록"""
+        return list(self.inverted_index.get(field, {}).keys())
+    
+    def get_columns(self) -> Optional[TalentColumns]:
+        """컬럼형 인재 풀 반환 (NumPy 미설치 시 None)"""
+        if np is None:
+            return None
+        
+        if self._columns is None:
+            self._columns = TalentColumns(self.talents)
+        return self._columns
+    
+    def get_talent_slots(self) -> List[Optional[Dict]]:
+        """인재 슬롯 목록 (삭제된 슬롯은 None, 인덱스 = 컬럼 행 번호)
+        
+        변경마다 목록을 다시 만들지 않도록 저장소의 목록을 그대로 반환하므로 호출 측에서 수정하면 안 된다.
+        """
+        return self.talents
+    
     def get_all_talents(self) -> List[Dict]:
-        """모든 인재 정보 반환"""
-        return self.talents.copy()
+        """모든 인재 정보 반환 (삭제된 슬롯 제외)
+        
+        복사 비용을 피하려고 저장된 dict를 그대로 반환하므로 호출 측에서 수정하면 안 된다.
+        update_talent()는 기존 dict를 고치지 않고 새 dict로 교체하므로 이전에 받은 목록은 변경 전 상태로 남는다.
+        """
+        return [talent for talent in self.talents if talent is not None]
     
     def get_talent_by_id(self, talent_id: str) -> Optional[Dict]:
         """ID로 특정 인재 조회"""
-        for talent in self.talents:
-            if talent.get("id") == talent_id:
-                return talent.copy()
-        return None
+        slot = self._id_index.get(talent_id)
+        if slot is None:
+            return None
+        return self.talents[slot].copy()
+    
+    def get_talent_slot(self, talent_id: str) -> Optional[int]:
+        """인재 ID의 슬롯 번호 (컬럼 행 번호, 없으면 None)"""
+        return self._id_index.get(talent_id)
+    
+    def get_talent_count(self) -> int:
+        """현재 인재 수"""
+        return len(self._id_index)
+    
+    def get_data_version(self) -> int:
+        """데이터 버전 (추가/수정/삭제 시마다 단조 증가, 하위 캐시 키로 사용)"""
+        return self.data_version
     
     def get_talents_by_filter(self, filters: Dict) -> List[Dict]:
         """필터 조건으로 인재 검색"""
         filtered_talents = []
         
-        for talent in self.talents:
+        for talent in self.get_all_talents():
             match = True
             
             for key, value in filters.items():
@@ -300,8 +802,9 @@ class TalentDatabase:
     
     def get_statistics(self) -> Dict:
         """인재 통계 정보"""
+        talents = self.get_all_talents()
         stats = {
-            "total_count": len(self.talents),
+            "total_count": len(talents),
             "by_specialization": {},
             "by_residence": {},
             "by_industry": {},
@@ -314,7 +817,7 @@ class TalentDatabase:
             }
         }
         
-        for talent in self.talents:
+        for talent in talents:
             # 전문분야별
             spec = talent.get("specialization", "Unknown")
             stats["by_specialization"][spec] = stats["by_specialization"].get(spec, 0) + 1
@@ -350,24 +853,116 @@ class TalentDatabase:
             return False
         
         # 중복 ID 체크
-        if any(t["id"] == talent_data["id"] for t in self.talents):
+        if talent_data["id"] in self._id_index:
             return False
         
-        self.talents.append(talent_data)
+        # 삭제된 슬롯이 있으면 재사용
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            self.talents[slot] = talent_data
+        else:
+            slot = len(self.talents)
+            self.talents.append(talent_data)
+        
+        self._id_index[talent_data["id"]] = slot
+        self._index_talent(talent_data)
+        self._mark_mutated([talent_data["id"]], [slot])
         return True
     
+    def add_talents(self, talents: Iterable[Dict]) -> int:
+        """여러 인재를 한 번에 추가 (중복/ID 없는 항목은 건너뜀)
+        
+        역색인은 배치 posting을 모아 한 번에 병합하고, 데이터 버전은 배치당 한 번 증가한다.
+        """
+        batch_index = {field: {} for field in INDEXED_FIELDS}
+        added_ids = []
+        added_slots = []
+        
+        for talent_data in talents:
+            talent_id = talent_data.get("id")
+            if talent_id is None or talent_id in self._id_index:
+                continue
+            
+            if self._free_slots:
+                slot = self._free_slots.pop()
+                self.talents[slot] = talent_data
+            else:
+                slot = len(self.talents)
+                self.talents.append(talent_data)
+            
+            self._id_index[talent_id] = slot
+            self._index_talent(talent_data, batch_index)
+            added_ids.append(talent_id)
+            added_slots.append(slot)
+        
+        if added_ids:
+            for field, postings in batch_index.items():
+                index = self.inverted_index[field]
+                for value, ids in postings.items():
+                    existing = index.get(value)
+                    if existing is None:
+                        index[value] = ids
+                    else:
+                        existing |= ids
+            self._mark_mutated(added_ids, added_slots)
+        
+        return len(added_ids)
+    
+    def bulk_load(self, path: str, chunk_size: Optional[int] = None,
+                  file_format: Optional[str] = None, verbose: bool = True) -> Dict:
+        """JSONL/CSV 파일 대량 적재 (example.talent_loader.bulk_load 참고)"""
+        from example.talent_loader import DEFAULT_CHUNK_SIZE, bulk_load
+        
+        return bulk_load(self, path, chunk_size or DEFAULT_CHUNK_SIZE, file_format, verbose)
+    
     def update_talent(self, talent_id: str, update_data: Dict) -> bool:
         """인재 정보 업데이트"""
-        for i, talent in enumerate(self.talents):
-            if talent["id"] == talent_id:
-                self.talents[i].update(update_data)
-                return True
-        return False
+        slot = self._id_index.get(talent_id)
+        if slot is None:
+            return False
+        
+        # ID 변경 시 중복 체크
+        new_id = update_data.get("id", talent_id)
+        if new_id != talent_id and new_id in self._id_index:
+            return False
+        
+        # 이미 반환된 dict(검색 결과/캐시)가 바뀌지 않도록 새 dict로 교체
+        talent = self.talents[slot]
+        self._unindex_talent(talent)
+        talent = {**talent, **update_data}
+        self.talents[slot] = talent
+        self._index_talent(talent)
+        
+        if new_id != talent_id:
+            del self._id_index[talent_id]
+            self._id_index[new_id] = slot
+        
+        self._mark_mutated([talent_id, new_id], [slot])
+        return True
     
     def delete_talent(self, talent_id: str) -> bool:
-        """인재 정보 삭제"""
-        for i, talent in enumerate(self.talents):
-            if talent["id"] == talent_id:
-                del self.talents[i]
-                return True
-        return False
+        """인재 정보 삭제 (슬롯은 tombstone으로 남겨 재사용)"""
+        slot = self._id_index.pop(talent_id, None)
+        if slot is None:
+            return False
+        
+        self._unindex_talent(self.talents[slot])
+        self.talents[slot] = None
+        self._free_slots.append(slot)
+        self._mark_mutated([talent_id], [slot])
+        return True
+    
+    def add_change_listener(self, listener: Callable[[List[str]], None]):
+        """인재 추가/수정/삭제 시 변경된 ID 목록을 받을 콜백 등록 (하위 캐시 무효화용)"""
+        self._change_listeners.append(listener)
+    
+    def _mark_mutated(self, changed_ids: Optional[List[str]] = None, changed_slots: Optional[List[int]] = None):
+        """데이터 변경 기록 (버전 증가 및 변경된 슬롯의 컬럼 행 갱신, 변경된 ID는 리스너에 통지)"""
+        self.data_version += 1
+        if self._columns is not None and changed_slots:
+            slots = list(dict.fromkeys(changed_slots))
+            self._columns = self._columns.write(slots, [self.talents[slot] for slot in slots])
+        
+        if changed_ids:
+            for listener in self._change_listeners:
+                listener(changed_ids)
@@ -0,0 +1,244 @@
+"""
+인재 데이터 대량 적재 모듈
+JSONL/CSV 파일을 청크 단위로 스트리밍 → 스키마 검증 → ID 중복 제거 → 배치 추가
+
+사용 예:
+    python -m example.talent_loader talents.jsonl --db talents.db
+"""
+
+import argparse
+import csv
+import json
+import logging
+import os
+import time
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# 시나리오 데이터와 동일한 인재 스키마
+STRING_FIELDS = (
+    "name",
+    "residence",
+    "final_education",
+    "industry_domain",
+    "industry_knowledge",
+    "industry_detail",
+    "specialization",
+    "talent_level"
+)
+INTEGER_FIELDS = ("age_min", "age_max", "age", "experience_years")
+LIST_FIELDS = ("skills", "certifications", "other_skills")
+VECTOR_FIELDS = (
+    "professional_competency",
+    "technical_expertise",
+    "leadership_experience",
+    "scale_complexity",
+    "compliance_security",
+    "industry_specialization"
+)
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# CSV 목록 필드 구분자 (JSON 배열 문자열도 허용)
+CSV_LIST_SEPARATOR = "|"
+
+class TalentValidationError(ValueError):
+    """인재 레코드 스키마 오류"""
+
+def _to_string(field: str, value) -> Optional[str]:
+    if value is None or value == "":
+        return None
+    if not isinstance(value, str):
+        raise TalentValidationError(f"{field}: 문자열이 아님 ({value!r})")
+    return value
+
+def _to_integer(field: str, value) -> Optional[int]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, bool):
+        raise TalentValidationError(f"{field}: 정수가 아님 ({value!r})")
+    try:
+        number = int(value)
+    except (TypeError, ValueError):
+        raise TalentValidationError(f"{field}: 정수가 아님 ({value!r})")
+    if isinstance(value, float) and number != value:
+        raise TalentValidationError(f"{field}: 정수가 아님 ({value!r})")
+    if number < 0:
+        raise TalentValidationError(f"{field}: 음수 ({value!r})")
+    return number
+
+def _to_list(field: str, value) -> Optional[List[str]]:
+    if value is None or value == "":
+        return None
+    if isinstance(value, str):
+        value = json.loads(value) if value.startswith("[") else value.split(CSV_LIST_SEPARATOR)
+    if not isinstance(value, list):
+        raise TalentValidationError(f"{field}: 목록이 아님 ({value!r})")
+    
+    items = []
+    for item in value:
+        if not isinstance(item, str):
+            raise TalentValidationError(f"{field}: 문자열이 아닌 항목 ({item!r})")
+        item = item.strip()
+        if item:
+            items.append(item)
+    return items or None
+
+def validate_talent(record: Dict) -> Dict:
+    """레코드를 시나리오 데이터와 같은 형태의 인재 dict로 정규화 (오류 시 TalentValidationError)"""
+    talent_id = record.get("id")
+    if isinstance(talent_id, (int, float)) and not isinstance(talent_id, bool):
+        talent_id = str(talent_id)
+    if not isinstance(talent_id, str) or not talent_id.strip():
+        raise TalentValidationError(f"id 누락 ({talent_id!r})")
+    
+    talent = {"id": talent_id.strip()}
+    for field in STRING_FIELDS:
+        talent[field] = _to_string(field, record.get(field))
+    for field in INTEGER_FIELDS:
+        talent[field] = _to_integer(field, record.get(field))
+    for field in LIST_FIELDS:
+        talent[field] = _to_list(field, record.get(field))
+    
+    # 벡터 필드: 중첩 dict 또는 CSV 평탄화 컬럼(vector_fields.<이름>)
+    vector_fields = record.get("vector_fields")
+    if isinstance(vector_fields, str) and vector_fields:
+        vector_fields = json.loads(vector_fields)
+    if vector_fields is None or vector_fields == "":
+        vector_fields = {}
+    if not isinstance(vector_fields, dict):
+        raise TalentValidationError(f"vector_fields: 객체가 아님 ({vector_fields!r})")
+    
+    talent["vector_fields"] = {
+        field: _to_string(
+            f"vector_fields.{field}",
+            vector_fields.get(field, record.get(f"vector_fields.{field}"))
+        )
+        for field in VECTOR_FIELDS
+    }
+    
+    return talent
+
+def detect_format(path: str) -> str:
+    """확장자로 파일 형식 판별"""
+    extension = os.path.splitext(path)[1].lower()
+    if extension in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    if extension in (".csv", ".tsv"):
+        return "csv"
+    raise ValueError(f"지원하지 않는 파일 형식: {path}")
+
+def iter_records(path: str, file_format: Optional[str] = None) -> Iterator[Tuple[int, Dict]]:
+    """파일에서 (줄 번호, 원시 레코드)를 한 줄씩 스트리밍"""
+    file_format = file_format or detect_format(path)
+    
+    with open(path, encoding="utf-8", newline="") as f:
+        if file_format == "jsonl":
+            for line_no, line in enumerate(f, 1):
+                line = line.strip()
+                if line:
+                    yield line_no, line
+        elif file_format == "csv":
+            delimiter = "\t" if path.lower().endswith(".tsv") else ","
+            for line_no, row in enumerate(csv.DictReader(f, delimiter=delimiter), 2):
+                yield line_no, row
+        else:
+            raise ValueError(f"지원하지 않는 파일 형식: {file_format}")
+
+def iter_talent_chunks(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                       file_format: Optional[str] = None,
+                       stats: Optional[Dict] = None) -> Iterator[List[Dict]]:
+    """검증된 인재 레코드를 chunk_size 단위로 반환 (잘못된 레코드는 건너뛰고 stats에 집계)"""
+    stats = stats if stats is not None else {}
+    stats.setdefault("read", 0)
+    stats.setdefault("invalid", 0)
+    chunk = []
+    
+    for line_no, raw in iter_records(path, file_format):
+        stats["read"] += 1
+        try:
+            record = json.loads(raw) if isinstance(raw, str) else raw
+            if not isinstance(record, dict):
+                raise TalentValidationError("객체가 아닌 레코드")
+            chunk.append(validate_talent(record))
+        except (TalentValidationError, ValueError) as e:
+            stats["invalid"] += 1
+            if stats["invalid"] <= 10:
+                logger.warning(f"{path}:{line_no} 레코드 건너뜀: {e}")
+            continue
+        
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    
+    if chunk:
+        yield chunk
+
+def bulk_load(talent_db, path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+              file_format: Optional[str] = None, verbose: bool = True) -> Dict:
+    """파일의 인재를 talent_db에 청크 단위로 적재하고 적재 통계 반환
+    
+    ID는 파일 내부 및 기존 데이터와 중복되면 먼저 나온 레코드만 유지한다.
+    색인 갱신과 데이터 버전 증가는 청크마다 한 번씩 수행된다 (talent_db.add_talents).
+    """
+    stats = {"read": 0, "invalid": 0, "duplicates": 0, "loaded": 0}
+    seen_ids = set()
+    started = time.monotonic()
+    
+    for chunk in iter_talent_chunks(path, chunk_size, file_format, stats):
+        unique = []
+        for talent in chunk:
+            if talent["id"] in seen_ids:
+                stats["duplicates"] += 1
+                continue
+            seen_ids.add(talent["id"])
+            unique.append(talent)
+        
+        added = talent_db.add_talents(unique)
+        stats["duplicates"] += len(unique) - added  # 기존 데이터와 중복
+        stats["loaded"] += added
+        
+        if verbose:
+            elapsed = time.monotonic() - started
+            print(f"📥 {stats['loaded']:,}명 적재 ({stats['read']:,}행 처리, "
+                  f"{stats['read'] / max(elapsed, 1e-9):,.0f}행/초)")
+    
+    stats["elapsed_seconds"] = time.monotonic() - started
+    stats["rows_per_second"] = stats["read"] / max(stats["elapsed_seconds"], 1e-9)
+    
+    if verbose:
+        print(f"✅ 대량 적재 완료: {stats['loaded']:,}명 추가, 중복 {stats['duplicates']:,}건, "
+              f"오류 {stats['invalid']:,}건, {stats['elapsed_seconds']:.2f}초 "
+              f"({stats['rows_per_second']:,.0f}행/초)")
+    
+    return stats
+
+def main(argv: Optional[Iterable[str]] = None):
+    parser = argparse.ArgumentParser(description="JSONL/CSV 인재 데이터 대량 적재")
+    parser.add_argument("paths", nargs="+", help="적재할 JSONL/CSV 파일")
+    parser.add_argument("--db", default=os.environ.get("TALENT_DB_PATH"),
+                        help="SQLite DB 경로 (기본값: TALENT_DB_PATH, 없으면 메모리 DB로 검증만 수행)")
+    parser.add_argument("--format", choices=("jsonl", "csv"), help="파일 형식 (기본값: 확장자로 판별)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE, help="배치당 레코드 수")
+    parser.add_argument("--no-seed", action="store_true", help="시나리오 데이터 시드 생략")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    
+    if args.db:
+        from example.sqlite_talent_data import SQLiteTalentDatabase
+        talent_db = SQLiteTalentDatabase(args.db, seed_scenario_data=not args.no_seed)
+    else:
+        from example.talent_data import TalentDatabase
+        talent_db = TalentDatabase(seed_scenario_data=not args.no_seed)
+    
+    try:
+        for path in args.paths:
+            talent_db.bulk_load(path, chunk_size=args.chunk_size, file_format=args.format)
+    finally:
+        if args.db:
+            talent_db.close()
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@
 from typing import Dict, List, Optional
 import random
 import logging
+import threading
+from scored_talent import ScoredTalent
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
@@ -27,6 +29,9 @@ class ChatbotRecommendationGenerator:
         self.conversation_starters = self._init_conversation_starters()
         self.alternative_suggestions = self._init_alternative_suggestions()
         
+        # 요청별 템플릿 선택 난수 생성기 (seed 지정 시 결정적)
+        self._local = threading.local()
+        
         print("🤖 챗봇 형식 추천 시스템 초기화 완료")
     
     def _init_chatbot_templates(self) -> Dict:
@@ -91,10 +96,18 @@ class ChatbotRecommendationGenerator:
             ]
         }
     
+    def _rng(self):
+        """현재 요청의 템플릿 선택 난수 생성기 (기본은 random 모듈)"""
+        return getattr(self._local, "rng", random)
+    
     def generate_chatbot_response(self, user_query: str, parsed_query: Dict, 
-                                ranked_talents: List[Dict]) -> Dict:
-        """챗봇 형식 응답 생성 메인 함수"""
+                                ranked_talents: List[Dict], seed: Optional[int] = None) -> Dict:
+        """챗봇 형식 응답 생성 메인 함수
+        
+        seed: 지정하면 인사말/제안 문구 선택이 결정적 (결과 캐시와 같은 응답 보장)
+        """
         logger.info("🤖 챗봇 응답 생성 시작")
+        self._local.rng = random.Random(seed) if seed is not None else random
         
         try:
             # 매칭률 분석
@@ -208,9 +221,9 @@ class ChatbotRecommendationGenerator:
             
             # 인사말 선택
             if quality_level == "excellent":
-                intro = random.choice(self.chatbot_templates["excellent_intro"])
+                intro = self._rng().choice(self.chatbot_templates["excellent_intro"])
             else:
-                intro = random.choice(self.chatbot_templates["good_intro"])
+                intro = self._rng().choice(self.chatbot_templates["good_intro"])
             
             # 상위 3명 또는 최고 매칭만 선별
             recommended_talents = self._select_recommended_talents(ranked_talents, matching_analysis)
@@ -248,7 +261,7 @@ class ChatbotRecommendationGenerator:
                                      ranked_talents: List[Dict], matching_analysis: Dict) -> Dict:
         """조건부 추천 응답 생성"""
         try:
-            intro = random.choice(self.chatbot_templates["fair_intro"])
+            intro = self._rng().choice(self.chatbot_templates["fair_intro"])
             
             # 최고 점수 후보 1-2명만 선별
             top_candidates = ranked_talents[:2] if len(ranked_talents) >= 2 else ranked_talents
@@ -289,7 +302,7 @@ class ChatbotRecommendationGenerator:
                                      ranked_talents: List[Dict], matching_analysis: Dict) -> Dict:
         """대안 제안 응답 생성"""
         try:
-            intro = random.choice(self.chatbot_templates["poor_intro"])
+            intro = self._rng().choice(self.chatbot_templates["poor_intro"])
             
             # 현재 최고 점수 후보가 있다면 1명만 참고용으로 제시
             reference_candidate = None
@@ -327,7 +340,7 @@ class ChatbotRecommendationGenerator:
     def _generate_no_results_response(self, user_query: str, parsed_query: Dict) -> Dict:
         """결과 없음 응답 생성"""
         try:
-            intro = random.choice(self.chatbot_templates["no_results"])
+            intro = self._rng().choice(self.chatbot_templates["no_results"])
             
             # 검색 조건 분석
             search_analysis = self._analyze_search_conditions(parsed_query)
@@ -376,6 +389,10 @@ class ChatbotRecommendationGenerator:
     def _generate_detailed_recommendation(self, user_query: str, parsed_query: Dict, 
                                         talent: Dict, rank: int) -> Dict:
         """상세 추천 정보 생성 (기존 함수 재사용)"""
+        # 실제로 보여줄 인재만 전체 dict로 변환
+        if isinstance(talent, ScoredTalent):
+            talent = talent.to_dict()
+        
         # 기존의 상세 추천 로직 재사용
         try:
             match_score = talent.get("final_score", talent.get("combined_score", 0.0)) * 100
@@ -477,7 +494,7 @@ class ChatbotRecommendationGenerator:
             
             # 기본 제안
             if not suggestions:
-                suggestions.extend(random.sample(self.alternative_suggestions["relaxation_suggestions"], 2))
+                suggestions.extend(self._rng().sample(self.alternative_suggestions["relaxation_suggestions"], 2))
             
             return suggestions[:4]
             
@@ -0,0 +1,168 @@
+"""
+키워드 매칭 모듈
+파서/벡터 검색의 키워드 매핑 테이블을 하나의 Aho-Corasick 오토마톤으로 컴파일해
+텍스트 한 번 순회로 모든 키워드 위치와 카테고리를 찾음
+"""
+
+import threading
+from collections import deque
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+class KeywordHit(NamedTuple):
+    """키워드 매칭 결과"""
+    category: str       # 매핑 테이블 이름 (예: "specializations")
+    label: str          # 테이블 내 값 (예: "NE")
+    keyword: str        # 매칭된 키워드 (소문자)
+    start: int          # 텍스트 내 시작 위치
+    label_rank: int     # 테이블 내 값 순서 (기존 dict 순회 순서)
+    keyword_rank: int   # 값 내 키워드 순서
+
+class _Automaton:
+    """Aho-Corasick 오토마톤 (생성 후 읽기 전용)"""
+    
+    def __init__(self, keywords: List[str]):
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]       # 상태에서 끝나는 키워드 번호 (접미사 상태의 키워드 포함)
+        
+        for keyword_id, keyword in enumerate(keywords):
+            state = 0
+            for char in keyword:
+                next_state = self.goto[state].get(char)
+                if next_state is None:
+                    next_state = len(self.goto)
+                    self.goto[state][char] = next_state
+                    self.goto.append({})
+                    self.fail.append(0)
+                    self.output.append([])
+                state = next_state
+            self.output[state].append(keyword_id)
+        
+        # 너비 우선으로 실패 링크 계산 - 실패 상태의 출력을 미리 합쳐 매칭 시 링크를 따라가지 않음
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.goto[state].items():
+                queue.append(next_state)
+                
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.goto[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.output[next_state] = self.output[next_state] + self.output[self.fail[next_state]]
+    
+    def first_ends(self, text: str) -> Dict[int, int]:
+        """키워드 번호 → 처음 끝나는 위치"""
+        goto, fail, output = self.goto, self.fail, self.output
+        state = 0
+        ends = {}
+        
+        for position, char in enumerate(text):
+            next_state = goto[state].get(char)
+            while next_state is None and state:
+                state = fail[state]
+                next_state = goto[state].get(char)
+            state = next_state or 0
+            
+            if output[state]:
+                for keyword_id in output[state]:
+                    ends.setdefault(keyword_id, position)
+        
+        return ends
+
+class KeywordMatcher:
+    """카테고리별 키워드 테이블을 등록받아 하나의 오토마톤으로 매칭"""
+    
+    def __init__(self):
+        self._tables = {}      # 카테고리 → {값: [키워드]}
+        self._compiled = None  # (오토마톤, 키워드 목록, 키워드별 (카테고리, 값, 순서) 목록)
+        self._lock = threading.Lock()
+    
+    def register(self, category: str, table: Dict[str, List[str]]):
+        """카테고리 테이블 등록 (같은 카테고리는 교체, 다음 매칭 때 다시 컴파일)"""
+        with self._lock:
+            normalized = {label: [keyword.lower() for keyword in keywords if keyword]
+                          for label, keywords in table.items()}
+            if self._tables.get(category) != normalized:
+                self._tables[category] = normalized
+                self._compiled = None
+    
+    def _compile(self) -> Tuple[_Automaton, List[str], List[List[Tuple[str, str, str, int, int]]]]:
+        compiled = self._compiled
+        if compiled is not None:
+            return compiled
+        
+        with self._lock:
+            if self._compiled is None:
+                keyword_ids = {}
+                entries = []
+                for category, table in self._tables.items():
+                    for label_rank, (label, keywords) in enumerate(table.items()):
+                        for keyword_rank, keyword in enumerate(keywords):
+                            keyword_id = keyword_ids.setdefault(keyword, len(keyword_ids))
+                            if keyword_id == len(entries):
+                                entries.append([])
+                            entries[keyword_id].append((category, label, keyword, label_rank, keyword_rank))
+                
+                keywords = list(keyword_ids)
+                self._compiled = (_Automaton(keywords), keywords, entries)
+            return self._compiled
+    
+    def export_state(self) -> Dict:
+        """스냅샷 저장용 (등록된 테이블과 컴파일된 오토마톤)"""
+        compiled = self._compile()
+        with self._lock:
+            return {"tables": dict(self._tables), "compiled": compiled}
+    
+    def restore_state(self, state: Dict) -> bool:
+        """스냅샷의 컴파일 결과 설치 (현재 등록된 테이블과 같을 때만, 다르면 다음 매칭 때 다시 컴파일)"""
+        with self._lock:
+            if state.get("tables") != self._tables:
+                return False
+            self._compiled = state["compiled"]
+            return True
+    
+    def find(self, text: str, categories: Optional[List[str]] = None) -> Dict[str, List[KeywordHit]]:
+        """텍스트 한 번 순회로 카테고리별 키워드 매칭 (키워드별 첫 위치만, 위치 순)
+        
+        text는 호출 측에서 소문자로 변환해 전달한다.
+        """
+        automaton, keywords, entries = self._compile()
+        wanted = set(categories) if categories is not None else None
+        
+        starts = [(end - len(keywords[keyword_id]) + 1, keyword_id)
+                  for keyword_id, end in automaton.first_ends(text).items()]
+        starts.sort()
+        
+        hits = {}
+        for start, keyword_id in starts:
+            for category, label, keyword, label_rank, keyword_rank in entries[keyword_id]:
+                if wanted is None or category in wanted:
+                    hit = KeywordHit(category, label, keyword, start, label_rank, keyword_rank)
+                    if category in hits:
+                        hits[category].append(hit)
+                    else:
+                        hits[category] = [hit]
+        return hits
+    
+    @staticmethod
+    def first_label(hits: List[KeywordHit]) -> Optional[str]:
+        """테이블 순서상 가장 앞선 값 (기존 '첫 번째로 매칭된 값' 규칙)"""
+        if not hits:
+            return None
+        return min(hits, key=lambda hit: hit.label_rank).label
+    
+    @staticmethod
+    def labels_in_order(hits: List[KeywordHit]) -> List[str]:
+        """매칭된 값을 테이블 순서대로 중복 없이 반환"""
+        ranked = {}
+        for hit in hits:
+            ranked.setdefault(hit.label, hit.label_rank)
+        return sorted(ranked, key=ranked.get)
+
+_shared_matcher = KeywordMatcher()
+
+def get_keyword_matcher() -> KeywordMatcher:
+    """파서가 쓰는 프로세스 공용 매처 (스냅샷에 컴파일 결과 저장)"""
+    return _shared_matcher
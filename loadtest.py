@@ -0,0 +1,333 @@
+"""
+API 부하 테스트 모듈
+JSONL 질의 로그(또는 합성 한국어 질의)를 검색 API에 재생해 엔드포인트별 지연시간/오류율/처리량 측정
+
+대상:
+    in-process   Flask 테스트 클라이언트로 같은 프로세스의 앱 호출 (서버 불필요, --synthetic-size로 데이터 규모 지정)
+    --url        실행 중인 서버(python main.py / python serve.py)에 HTTP keep-alive 연결로 요청
+
+부하 모델:
+    --rate 미지정   폐쇄형 - 동시 작업자 수(--concurrency)만큼 응답을 받는 즉시 다음 요청
+    --rate R        개방형 - 초당 R건 도착 일정(--poisson이면 지수 분포 간격)을 미리 정하고,
+                    지연시간은 예정 시각부터 측정해 대기열 지연도 포함 (coordinated omission 방지)
+
+질의 로그 형식 (한 줄에 JSON 하나, endpoint 기본값 /api/search):
+    {"query": "서울 30대 금융 NE 10년 이상"}
+    {"endpoint": "/api/search", "query": "DBA oracle 고급", "top_k": 10, "parser": "rulebase"}
+    {"endpoint": "/api/search/batch", "queries": ["서울 java", "부산 NE"]}
+
+사용 예:
+    python loadtest.py --generate 2000 --synthetic-size 20000 --concurrency 4 --json run.json
+    python loadtest.py --log queries.jsonl --url http://localhost:5000 --rate 50 --duration 60
+    python loadtest.py --log queries.jsonl --json new.json --compare run.json
+"""
+
+import argparse
+import contextlib
+import http.client
+import io
+import json
+import random
+import threading
+import time
+import urllib.parse
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from benchmark import environment_info, summarize_latencies
+from example.synthetic_talents import DEFAULT_SEED, generate_queries
+
+DEFAULT_ENDPOINT = "/api/search"
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT = 30.0  # 초
+
+# 로그 항목에서 요청 본문이 아닌 키
+_META_KEYS = ("endpoint", "ts", "timestamp")
+
+class RequestResult:
+    """요청 1건 결과"""
+    
+    __slots__ = ("endpoint", "ok", "status", "latency", "service_time", "error")
+    
+    def __init__(self, endpoint: str, ok: bool, status: Optional[int], latency: float, service_time: float,
+                 error: Optional[str] = None):
+        self.endpoint = endpoint
+        self.ok = ok
+        self.status = status
+        self.latency = latency            # 예정 시각(폐쇄형은 전송 시각)부터 응답까지
+        self.service_time = service_time  # 전송부터 응답까지
+        self.error = error
+
+class InProcessClient:
+    """Flask 테스트 클라이언트 (작업자 스레드마다 클라이언트 하나)"""
+    
+    def __init__(self, app):
+        self.app = app
+        self._local = threading.local()
+    
+    def post(self, path: str, body: Dict) -> Tuple[int, Optional[Dict]]:
+        client = getattr(self._local, "client", None)
+        if client is None:
+            client = self._local.client = self.app.test_client()
+        response = client.post(path, json=body)
+        return response.status_code, response.get_json(silent=True)
+
+class HttpClient:
+    """HTTP keep-alive 클라이언트 (작업자 스레드마다 연결 하나, 오류 시 재연결)"""
+    
+    def __init__(self, base_url: str, timeout: float = DEFAULT_TIMEOUT):
+        parsed = urllib.parse.urlsplit(base_url)
+        if parsed.scheme not in ("http", "https"):
+            raise ValueError(f"지원하지 않는 URL: {base_url}")
+        self.scheme = parsed.scheme
+        self.netloc = parsed.netloc
+        self.base_path = parsed.path.rstrip("/")
+        self.timeout = timeout
+        self._local = threading.local()
+    
+    def _connection(self) -> http.client.HTTPConnection:
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection_class = http.client.HTTPSConnection if self.scheme == "https" else http.client.HTTPConnection
+            connection = self._local.connection = connection_class(self.netloc, timeout=self.timeout)
+        return connection
+    
+    def post(self, path: str, body: Dict) -> Tuple[int, Optional[Dict]]:
+        data = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        connection = self._connection()
+        try:
+            connection.request("POST", self.base_path + path, body=data,
+                               headers={"Content-Type": "application/json"})
+            response = connection.getresponse()
+            payload = response.read()
+        except (OSError, http.client.HTTPException):
+            connection.close()
+            self._local.connection = None
+            raise
+        
+        try:
+            return response.status, json.loads(payload)
+        except ValueError:
+            return response.status, None
+
+def load_query_log(path: str) -> List[Dict]:
+    """JSONL 질의 로그 → [{"endpoint", "body"}] (빈 줄/주석 무시, 잘못된 줄은 오류)"""
+    requests = []
+    with open(path, encoding="utf-8") as f:
+        for line_number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            try:
+                entry = json.loads(line)
+            except ValueError as e:
+                raise ValueError(f"{path}:{line_number}: JSON 오류 - {e}")
+            if isinstance(entry, str):
+                entry = {"query": entry}
+            requests.append({
+                "endpoint": entry.get("endpoint", DEFAULT_ENDPOINT),
+                "body": {key: value for key, value in entry.items() if key not in _META_KEYS}
+            })
+    return requests
+
+def generated_requests(count: int, seed: int = DEFAULT_SEED) -> List[Dict]:
+    """합성 한국어 질의로 /api/search 요청 목록 생성"""
+    return [{"endpoint": DEFAULT_ENDPOINT, "body": {"query": query}} for query in generate_queries(count, seed)]
+
+def arrival_offsets(count: int, rate: Optional[float], poisson: bool = False,
+                    seed: int = DEFAULT_SEED) -> Optional[List[float]]:
+    """요청별 예정 시각 (시작 기준 초, 폐쇄형이면 None)"""
+    if not rate:
+        return None
+    rng = random.Random(seed)
+    offsets, elapsed = [], 0.0
+    for _ in range(count):
+        offsets.append(elapsed)
+        elapsed += rng.expovariate(rate) if poisson else 1.0 / rate
+    return offsets
+
+def _is_success(status: int, payload: Optional[Dict]) -> bool:
+    if status >= 400:
+        return False
+    return not (isinstance(payload, dict) and payload.get("success") is False)
+
+def run_load(client, requests: List[Dict], total: int, concurrency: int = DEFAULT_CONCURRENCY,
+             offsets: Optional[List[float]] = None, duration: Optional[float] = None) -> Tuple[List[RequestResult], float]:
+    """요청 목록을 순환하며 total건 실행 (duration 초과 시 중단) → (결과 목록, 전체 소요 시간)"""
+    results = []
+    lock = threading.Lock()
+    next_index = [0]
+    started = time.perf_counter()
+    
+    def worker():
+        while True:
+            with lock:
+                i = next_index[0]
+                next_index[0] += 1
+            if i >= total:
+                return
+            
+            scheduled = started + offsets[i] if offsets is not None else None
+            if scheduled is not None:
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+            if duration is not None and time.perf_counter() - started >= duration:
+                return
+            
+            request = requests[i % len(requests)]
+            sent = time.perf_counter()
+            try:
+                status, payload = client.post(request["endpoint"], request["body"])
+                ok, error = _is_success(status, payload), None
+                if not ok and isinstance(payload, dict):
+                    error = str(payload.get("error"))[:200]
+            except Exception as e:
+                status, ok, error = None, False, f"{type(e).__name__}: {e}"
+            finished = time.perf_counter()
+            
+            result = RequestResult(request["endpoint"], ok, status, finished - (scheduled or sent),
+                                   finished - sent, error)
+            with lock:
+                results.append(result)
+    
+    threads = [threading.Thread(target=worker, name=f"load-{n}", daemon=True) for n in range(concurrency)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results, time.perf_counter() - started
+
+def _summarize(results: List[RequestResult], wall_seconds: float) -> Dict:
+    summary = summarize_latencies([result.latency for result in results], wall_seconds)
+    summary["throughput_rps"] = summary.pop("throughput_qps")
+    summary["service_p95_ms"] = summarize_latencies([result.service_time for result in results])["p95_ms"]
+    errors = [result for result in results if not result.ok]
+    summary["errors"] = len(errors)
+    summary["error_rate"] = round(len(errors) / len(results), 4) if results else 0.0
+    summary["status_codes"] = {}
+    for result in results:
+        key = str(result.status) if result.status is not None else "exception"
+        summary["status_codes"][key] = summary["status_codes"].get(key, 0) + 1
+    summary["sample_errors"] = sorted({result.error for result in errors if result.error})[:5]
+    return summary
+
+def build_report(results: List[RequestResult], wall_seconds: float, config: Dict) -> Dict:
+    """엔드포인트별/전체 요약 보고서 (JSON 직렬화 가능)"""
+    endpoints = {}
+    for result in results:
+        endpoints.setdefault(result.endpoint, []).append(result)
+    
+    return {
+        "config": config,
+        "environment": environment_info(),
+        "wall_seconds": round(wall_seconds, 3),
+        "overall": _summarize(results, wall_seconds),
+        "endpoints": {endpoint: _summarize(endpoint_results, wall_seconds)
+                      for endpoint, endpoint_results in sorted(endpoints.items())}
+    }
+
+def compare_reports(current: Dict, baseline: Dict) -> List[str]:
+    """기준 보고서 대비 엔드포인트별 p50/p95/p99/처리량/오류율 변화"""
+    lines = []
+    for endpoint, summary in sorted(current["endpoints"].items()):
+        base = baseline.get("endpoints", {}).get(endpoint)
+        if base is None:
+            lines.append(f"  {endpoint}: 기준 보고서에 없음")
+            continue
+        changes = []
+        for key in ("p50_ms", "p95_ms", "p99_ms", "throughput_rps"):
+            if base.get(key):
+                changes.append(f"{key} {base[key]:.2f}→{summary[key]:.2f} ({(summary[key] / base[key] - 1) * 100:+.1f}%)")
+        changes.append(f"error_rate {base.get('error_rate', 0):.2%}→{summary['error_rate']:.2%}")
+        lines.append(f"  {endpoint}: " + ", ".join(changes))
+    return lines
+
+def print_report(report: Dict):
+    print(f"\n📊 부하 테스트 결과 ({report['wall_seconds']:.1f}초)")
+    print(f"  {'엔드포인트':<22}{'요청':>8}{'오류율':>9}{'p50(ms)':>10}{'p95(ms)':>10}{'p99(ms)':>10}{'요청/초':>10}")
+    rows = list(report["endpoints"].items()) + [("전체", report["overall"])]
+    for endpoint, summary in rows:
+        print(f"  {endpoint:<22}{summary['count']:>8}{summary['error_rate']:>9.2%}{summary['p50_ms']:>10.2f}"
+              f"{summary['p95_ms']:>10.2f}{summary['p99_ms']:>10.2f}{summary['throughput_rps'] or 0:>10.1f}")
+    for endpoint, summary in report["endpoints"].items():
+        for error in summary["sample_errors"]:
+            print(f"  ⚠️  {endpoint}: {error}")
+
+def _in_process_client(synthetic_size: Optional[int], seed: int) -> InProcessClient:
+    """같은 프로세스의 Flask 앱 (synthetic_size 지정 시 합성 인재 데이터로 검색 시스템 교체)"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        import main as app_module
+        
+        if synthetic_size:
+            from example.synthetic_talents import iter_synthetic_talents
+            from example.talent_data import TalentDatabase
+            
+            talent_db = TalentDatabase(seed_scenario_data=False)
+            talent_db.add_talents(iter_synthetic_talents(synthetic_size, seed))
+            app_module.talent_system = app_module.TalentSearchSystem(talent_db=talent_db)
+    
+    if app_module.talent_system is None:
+        raise RuntimeError("검색 시스템 초기화 실패 - in-process 부하 테스트를 실행할 수 없습니다")
+    return InProcessClient(app_module.app)
+
+def main(argv: Optional[Iterable[str]] = None):
+    parser = argparse.ArgumentParser(description="검색 API 질의 로그 재생 부하 테스트")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--log", help="JSONL 질의 로그 경로")
+    source.add_argument("--generate", type=int, help="합성 한국어 질의 수 (/api/search)")
+    parser.add_argument("--url", help="대상 서버 주소 (미지정 시 in-process)")
+    parser.add_argument("--synthetic-size", type=int, help="in-process 대상의 합성 인재 수 (미지정 시 기본 데이터)")
+    parser.add_argument("--requests", type=int, help="총 요청 수 (기본값: 로그 길이, 로그를 순환 재생)")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 작업자 수")
+    parser.add_argument("--rate", type=float, help="초당 도착 요청 수 (미지정 시 폐쇄형 최대 부하)")
+    parser.add_argument("--poisson", action="store_true", help="도착 간격을 지수 분포로 (--rate와 함께)")
+    parser.add_argument("--duration", type=float, help="최대 실행 시간 (초)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="합성 질의/도착 간격 시드")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT, help="HTTP 요청 제한 시간 (초)")
+    parser.add_argument("--json", help="결과 JSON 저장 경로")
+    parser.add_argument("--compare", help="비교할 기준 결과 JSON (이전 릴리스)")
+    args = parser.parse_args(argv)
+    
+    requests = load_query_log(args.log) if args.log else generated_requests(args.generate, args.seed)
+    if not requests:
+        parser.error("재생할 요청이 없습니다")
+    total = args.requests or len(requests)
+    if args.duration and args.rate and not args.requests:
+        total = int(args.duration * args.rate)
+    
+    client = HttpClient(args.url, args.timeout) if args.url else _in_process_client(args.synthetic_size, args.seed)
+    offsets = arrival_offsets(total, args.rate, args.poisson, args.seed)
+    
+    print(f"🚀 부하 테스트 시작: {total}건, 대상 {args.url or 'in-process'}, 동시 {args.concurrency}, "
+          f"{f'{args.rate}건/초' if args.rate else '폐쇄형'}")
+    with contextlib.redirect_stdout(io.StringIO()):
+        results, wall_seconds = run_load(client, requests, total, args.concurrency, offsets, args.duration)
+    
+    config = {
+        "source": args.log or f"generated:{args.generate}",
+        "target": args.url or "in-process",
+        "synthetic_size": args.synthetic_size,
+        "requests": total,
+        "completed": len(results),
+        "concurrency": args.concurrency,
+        "rate": args.rate,
+        "poisson": args.poisson,
+        "seed": args.seed
+    }
+    report = build_report(results, wall_seconds, config)
+    print_report(report)
+    
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"\n🔍 기준 대비 변화 ({args.compare})")
+        for line in compare_reports(report, baseline):
+            print(line)
+    
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+        print(f"\n💾 결과 저장: {args.json}")
+
+if __name__ == "__main__":
+    main()
@@ -4,8 +4,13 @@
 
 from flask import Flask, render_template, request, jsonify
 import json
+import logging
 import sys
 import os
+import random
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 import traceback
 
@@ -21,6 +26,14 @@ try:
     from vector_search import VectorSearcher
     from reranking import ReRanker
     from generator import ChatbotRecommendationGenerator  # 새로운 챗봇 생성기
+    from parse_cache import ParseCache, parser_namespace
+    from result_cache import ResultCache
+    from keyword_matcher import get_keyword_matcher
+    from snapshot import load_snapshot, save_snapshot, snapshot_exists
+    from metrics import get_metrics
+    from tracing import get_tracer
+    from example.talent_data import TalentDatabase
+    from example.sqlite_talent_data import SQLiteTalentDatabase
     print("✅ 모든 모듈 import 성공")
 except ImportError as e:
     print(f"❌ 모듈 import 오류: {e}")
@@ -29,101 +42,503 @@ except ImportError as e:
 
 app = Flask(__name__)
 
+# 검색 경로 로그는 레벨로 제어 (LOG_LEVEL=DEBUG이면 단계별 진행/파싱 결과 출력)
+# 모듈 import 중 설정된 기본 로깅(rulebase_prompt INFO)보다 서버 설정이 우선
+logging.basicConfig(level=os.environ.get("LOG_LEVEL", "WARNING").upper(),
+                    format="%(asctime)s %(levelname)s %(name)s: %(message)s", force=True)
+logger = logging.getLogger(__name__)
+
+# 단계별 하위 단계로 전달할 최대 후보 수 (recall ↔ 지연시간 조절, None이면 제한 없음)
+DEFAULT_CANDIDATE_BUDGET = {
+    "payload": 500,
+    "semantic": 0,  # ANN 의미 기반 후보 수 (0이면 비활성화)
+    "vector": 100,
+    "rerank": 20
+}
+
+# 파서 모드 → 파서 클래스 (요청별 선택/전환 시 모드별로 한 번만 생성)
+PARSER_MODES = {
+    "rulebase": RulebasePromptParser,
+    "llm": LLMParser
+}
+
+# 일괄 검색 API 한 요청당 최대 질의 수
+MAX_BATCH_QUERIES = 5000
+
+# 검색 API 요청별 최대 추천 인재 수 (top_k)
+MAX_TOP_K = 1000
+
+# warm_up()에서 파서 키워드 매처를 미리 컴파일할 때 쓰는 질의
+WARM_UP_QUERY = "서울 30대 금융 NE 10년 이상 고급 oracle 유지보수"
+
 class TalentSearchSystem:
     """인재 검색 시스템 메인 클래스 - 챗봇 지원"""
     
-    def __init__(self, use_llm=False):
-        self.use_llm = use_llm
+    def __init__(self, use_llm=False, candidate_budget=None, talent_db=None, parse_cache=None,
+                 result_cache=None, snapshot_path=None, snapshot_source=None, metrics=None, tracer=None):
         self.current_year = datetime.now().year
+        # 단계별 처리 시간/후보 수/캐시 지표 (기본값은 프로세스 공용 저장소 - /api/metrics로 노출)
+        self.metrics = metrics if metrics is not None else get_metrics()
+        # 요청 추적 (헤드 샘플링 - TRACE_SAMPLE_RATE, 구성요소도 같은 추적기로 배치 span 기록)
+        self.tracer = tracer if tracer is not None else get_tracer()
+        self.candidate_budget = dict(DEFAULT_CANDIDATE_BUDGET)
+        self.candidate_budget.update(candidate_budget or {})
         
         try:
-            # 파서 초기화 (rulebase 우선, LLM은 추후 전환)
+            # 파서 초기화 (rulebase 우선, LLM은 추후 전환) - 모드별 인스턴스는 만들어 두고 재사용
+            self._parsers = {}
+            self._parser_lock = threading.Lock()
+            self.parser = self.get_parser("llm" if use_llm else "rulebase")
             if use_llm:
-                self.parser = LLMParser()
                 print("🤖 LLM 파서 모드 활성화")
             else:
-                self.parser = RulebasePromptParser()
                 print("📋 Rulebase 파서 모드 활성화")
+            # 정규화 질의 기준 파싱 캐시 (파서 종류/매핑 버전별 네임스페이스)
+            self.parse_cache = parse_cache if parse_cache is not None else ParseCache()
             
             # 시스템 구성요소 초기화
+            # 인재 데이터베이스 (TALENT_DB_PATH 지정 시 SQLite 디스크 기반,
+            # TALENT_SNAPSHOT_PATH 지정 시 메모리 DB와 색인을 스냅샷에서 복원,
+            # 스냅샷을 쓸 수 없으면 TALENT_SNAPSHOT_SOURCE 원본 파일로 재구성)
+            snapshot_path = snapshot_path or os.environ.get("TALENT_SNAPSHOT_PATH")
+            snapshot = None
+            if talent_db is not None:
+                self.talent_db = talent_db
+                snapshot_path = None
+            elif os.environ.get("TALENT_DB_PATH"):
+                self.talent_db = SQLiteTalentDatabase(os.environ["TALENT_DB_PATH"])
+                snapshot_path = None
+            else:
+                snapshot = load_snapshot(snapshot_path) if snapshot_path else None
+                if snapshot is not None:
+                    self.talent_db = snapshot.create_talent_db()
+                elif snapshot_path and snapshot_exists(snapshot_path):
+                    self.talent_db = self._rebuild_from_source(snapshot_path, snapshot_source)
+                else:
+                    self.talent_db = TalentDatabase()
             self.weight_controller = WeightController()
-            self.payload_searcher = PayloadSearcher()
-            self.vector_searcher = VectorSearcher()
-            self.reranker = ReRanker()
+            self.payload_searcher = PayloadSearcher(talent_db=self.talent_db, tracer=self.tracer)
+            # 벡터 필드 텍스트 인코더 (VECTOR_ENCODER: keyword | hashing | model, 디스크 캐시 경로 선택)
+            self.vector_searcher = VectorSearcher(
+                talent_db=self.talent_db,
+                encoder=os.environ.get("VECTOR_ENCODER"),
+                encoder_cache_path=os.environ.get("VECTOR_ENCODER_CACHE"),
+                precompute=snapshot is None,
+                tracer=self.tracer
+            )
+            self.reranker = ReRanker(tracer=self.tracer)
             self.chatbot_generator = ChatbotRecommendationGenerator()  # 챗봇 생성기
             
-            print(f"✅ 챗봇 인재 검색 시스템 초기화 완료 (기준년도: {self.current_year})")
+            # 전체 검색 결과 캐시 (데이터 변경 시 자동 무효화)
+            self.result_cache = result_cache if result_cache is not None else ResultCache()
+            self.result_cache.attach(self.talent_db)
+            self.metrics.add_collector("cache", self._collect_cache_metrics)
+            
+            if snapshot_path:
+                self._restore_snapshot(snapshot, snapshot_path)
             
+            print(f"✅ 챗봇 인재 검색 시스템 초기화 완료 (기준년도: {self.current_year})")
+        
         except Exception as e:
             print(f"❌ 시스템 초기화 오류: {e}")
             print(traceback.format_exc())
             raise e
     
-    def search_talents_chatbot(self, user_query: str):
-        """챗봇 형식 인재 검색 메인 로직"""
+    @staticmethod
+    def _rebuild_from_source(snapshot_path, snapshot_source=None):
+        """쓸 수 없는 스냅샷(형식 버전 변경/체크섬 실패)을 원본 인재 파일로 재구성
+        
+        원본이 지정되지 않으면 기본 데이터로 서비스하지 않고 시작을 중단한다.
+        """
+        if snapshot_source is None:
+            snapshot_source = os.environ.get("TALENT_SNAPSHOT_SOURCE", "")
+        if isinstance(snapshot_source, str):
+            snapshot_source = [path for path in snapshot_source.split(os.pathsep) if path]
+        
+        if not snapshot_source:
+            logger.error(f"스냅샷을 사용할 수 없고 재구성할 원본(TALENT_SNAPSHOT_SOURCE)이 없습니다: {snapshot_path}")
+            raise RuntimeError(f"스냅샷을 사용할 수 없습니다: {snapshot_path} "
+                               f"(TALENT_SNAPSHOT_SOURCE 지정 또는 snapshot.py로 다시 생성)")
+        
+        logger.error(f"스냅샷을 사용할 수 없어 원본 데이터로 재구성합니다: {snapshot_path} <- {snapshot_source}")
+        talent_db = TalentDatabase()
+        for path in snapshot_source:
+            talent_db.bulk_load(path)
+        return talent_db
+    
+    def _restore_snapshot(self, snapshot, snapshot_path):
+        """스냅샷의 후보자 벡터/키워드 매처 복원 - 없거나 오래된 부분은 다시 만든 뒤 스냅샷 갱신"""
+        stale = snapshot is None or snapshot.columns is None
+        
+        if snapshot is not None:
+            restored = snapshot.vector_meta is not None and self.vector_searcher.restore_snapshot(
+                snapshot.vector_arrays, snapshot.vector_meta
+            )
+            if not restored:
+                print("⚠️  스냅샷 후보자 벡터 사용 불가 (손상 또는 벡터 설정 변경) - 재계산")
+                self.vector_searcher.precompute_candidate_vectors(self.talent_db.get_all_talents())
+                stale = True
+            
+            if snapshot.matcher_state is None or not get_keyword_matcher().restore_state(snapshot.matcher_state):
+                stale = True
+        
+        if stale:
+            try:
+                self.save_snapshot(snapshot_path)
+            except (OSError, RuntimeError) as e:
+                print(f"⚠️  스냅샷 저장 실패: {e}")
+    
+    def save_snapshot(self, path):
+        """현재 인재 데이터/컬럼/후보자 벡터/ANN 색인/키워드 매처 스냅샷 저장"""
+        return save_snapshot(path, self.talent_db, self.vector_searcher, get_keyword_matcher())
+    
+    @property
+    def parser_mode(self) -> str:
+        """현재 기본 파서 모드 ("rulebase" | "llm")"""
+        return self._mode_of(self.parser)
+    
+    @property
+    def use_llm(self) -> bool:
+        return self.parser_mode == "llm"
+    
+    @staticmethod
+    def _mode_of(parser) -> str:
+        return next(mode for mode, parser_class in PARSER_MODES.items() if isinstance(parser, parser_class))
+    
+    def get_parser(self, mode=None):
+        """모드별 파서 반환 (None이면 현재 기본 파서, 처음 쓰는 모드는 생성 후 재사용)"""
+        if mode is None:
+            return self.parser
+        if mode not in PARSER_MODES:
+            raise ValueError(f"알 수 없는 파서 모드: {mode}")
+        
+        parser = self._parsers.get(mode)
+        if parser is None:
+            with self._parser_lock:
+                parser = self._parsers.get(mode)
+                if parser is None:
+                    parser = self._parsers[mode] = PARSER_MODES[mode]()
+        return parser
+    
+    def switch_parser(self, mode: str):
+        """기본 파서 교체 - 데이터베이스/색인/캐시는 그대로 두고 self.parser 참조만 바꿈
+        
+        참조 대입 한 번이라 원자적이며, 진행 중인 요청은 시작할 때 잡은 이전 파서로 끝난다.
+        """
+        self.parser = self.get_parser(mode)
+        print(f"🔄 기본 파서 전환: {mode}")
+        return self.parser
+    
+    def warm_up(self):
+        """첫 요청 때 만들어지는 구조(키워드 오토마톤, ANN 색인)를 미리 생성
+        
+        운영 서버는 워커 fork 전에 호출해 모든 워커가 같은 메모리를 copy-on-write로 공유한다.
+        """
+        self.parser.parse(WARM_UP_QUERY)
+        if self.vector_searcher.dense_store is not None and self.vector_searcher.ann_index is None:
+            self.vector_searcher.build_ann_index()
+        print("🔥 검색 시스템 사전 준비 완료")
+    
+    def after_fork(self):
+        """fork된 워커 프로세스 초기화 - 부모와 공유하면 안 되는 DB 연결과 난수 상태 재생성
+        
+        지표 저장소는 워커별로 새로 집계 (마스터 사전 준비 중 기록된 값이 워커마다 중복되지 않도록)
+        """
+        random.seed()
+        self.metrics.reset()
+        for resource in (self.talent_db, self.vector_searcher.encoder):
+            if hasattr(resource, "reopen"):
+                resource.reopen()
+    
+    def search_talents_chatbot(self, user_query: str, top_k=None, candidate_budget=None, parser_mode=None):
+        """챗봇 형식 인재 검색 메인 로직
+        
+        top_k: 최종 순위화할 인재 수 (candidate_budget["rerank"]보다 우선)
+        candidate_budget: 단계별 후보 수 제한 ({"payload", "semantic", "vector", "rerank"})
+        parser_mode: 이 요청에만 쓸 파서 ("rulebase" | "llm", None이면 현재 기본 파서)
+        
+        단계별 처리 시간과 후보 수는 self.metrics 히스토그램에 기록되고,
+        샘플된 요청은 단계별 span으로 묶인 trace로도 내보낸다.
+        """
+        with self.tracer.trace("search_talents_chatbot", query_length=len(user_query)) as span:
+            result = self._search_talents_chatbot(user_query, top_k, candidate_budget, parser_mode)
+            span.set_attributes(success=result.get("success"), parser=result.get("parser"))
+            return result
+    
+    def _search_talents_chatbot(self, user_query, top_k, candidate_budget, parser_mode):
+        started = time.perf_counter()
+        metrics = self.metrics
         try:
-            print(f"\n🤖 챗봇 인재 검색 시작: {user_query}")
+            logger.info(f"🤖 챗봇 인재 검색 시작: {user_query}")
+            budget = self._resolve_candidate_budget(top_k, candidate_budget)
+            # 요청 중 기본 파서가 바뀌어도 파싱과 캐시 키가 같은 파서를 쓰도록 한 번만 읽음
+            parser = self.get_parser(parser_mode)
+            
+            # 1. 사용자 질의 파싱 (캐시 우선)
+            with self._stage("parse", parser=self._mode_of(parser)):
+                parsed_query = self.parse_cache.parse(parser, user_query)
+            logger.debug("✅ 1단계: 질의 파싱 완료 - %s", parsed_query)
             
-            # 1. 사용자 질의 파싱
-            parsed_query = self.parser.parse(user_query)
-            print("✅ 1단계: 질의 파싱 완료")
-            print(f"파싱 결과: {parsed_query}")
+            # 동일 조건 검색 결과 캐시 확인
+            cache_key = self.result_cache.make_key(
+                parsed_query, self.talent_db.get_data_version(), parser_namespace(parser), budget
+            )
+            cached_result = self.result_cache.get_result(cache_key)
+            self.tracer.current_span().set_attribute("result_cache", "hit" if cached_result is not None else "miss")
+            if cached_result is not None:
+                logger.debug("♻️ 검색 결과 캐시 적중")
+                self._record_request(started, "success", "hit")
+                return cached_result
             
             # 2. 가중치 계산
-            dynamic_weights = self.weight_controller.calculate_weights(parsed_query)
-            print("✅ 2단계: 동적 가중치 계산 완료")
+            with self._stage("weights"):
+                dynamic_weights = self.weight_controller.calculate_weights(parsed_query)
+            logger.debug("✅ 2단계: 동적 가중치 계산 완료")
             
             # 3. Payload 검색 (1차 필터링)
-            payload_candidates = self.payload_searcher.search(parsed_query)
-            print(f"✅ 3단계: Payload 검색 완료 ({len(payload_candidates)}명 후보)")
+            with self._stage("payload", top_k=budget["payload"]) as span:
+                payload_candidates = self.payload_searcher.search(
+                    parsed_query, top_k=budget["payload"]
+                )
+                payload_stats = self.payload_searcher.last_search_stats
+                span.set_attributes(candidates=len(payload_candidates), scored=payload_stats.get("scored"),
+                                    matched=payload_stats.get("matched"), index_used=payload_stats.get("index_used"))
+            metrics.observe("candidates", len(payload_candidates), stage="payload")
+            logger.debug(f"✅ 3단계: Payload 검색 완료 ({len(payload_candidates)}명 후보, "
+                         f"역색인 제외 {payload_stats.get('pruned', 0)}명)")
+            
+            # 3-1. 의미 기반 후보 추가 (정형 필드가 부족해도 벡터 필드가 잘 맞는 인재)
+            if budget.get("semantic"):
+                with self._stage("semantic", top_k=budget["semantic"]) as span:
+                    payload_candidates = self._merge_semantic_candidates(
+                        parsed_query, payload_candidates, budget["semantic"]
+                    )
+                    span.set_attribute("candidates", len(payload_candidates))
             
             # 4. 벡터 검색 (2차 정밀 검색)
-            vector_results = self.vector_searcher.search(
-                parsed_query, payload_candidates
+            with self._stage("vector", top_k=budget["vector"]) as span:
+                vector_results = self.vector_searcher.search(
+                    parsed_query, payload_candidates, top_k=budget["vector"]
+                )
+                span.set_attribute("candidates", len(vector_results))
+            metrics.observe("candidates", len(vector_results), stage="vector")
+            logger.debug(f"✅ 4단계: 벡터 검색 완료 ({len(vector_results)}명 매칭)")
+            
+            result = self._build_search_result(
+                user_query, parsed_query, dynamic_weights, payload_candidates, payload_stats,
+                vector_results, budget, cache_key, self._mode_of(parser)
             )
-            print(f"✅ 4단계: 벡터 검색 완료 ({len(vector_results)}명 매칭)")
+            self._record_request(started, "success", "miss")
+            return result
+        
+        except Exception as e:
+            logger.exception(f"❌ 챗봇 인재 검색 오류: {str(e)}")
+            self._record_request(started, "error", "miss")
+            return self._generate_error_result(str(e))
+    
+    def search_batch(self, user_queries, top_k=None, candidate_budget=None, parser_mode=None):
+        """여러 질의 일괄 검색 - Payload/벡터 단계는 쿼리 × 인재 행렬로 한 번에 계산하고 재순위화부터는 쿼리별 처리
+        
+        결과는 질의 순서대로 search_talents_chatbot과 같은 형식의 목록이다.
+        일괄 단계 처리 시간은 batch_stage_duration_seconds에 기록되고, 샘플된 요청은 일괄 전체가 하나의 trace가 된다.
+        """
+        with self.tracer.trace("search_batch", queries=len(user_queries)) as span:
+            results = self._search_batch(user_queries, top_k, candidate_budget, parser_mode)
+            span.set_attribute("failed", sum(not result.get("success") for result in results))
+            return results
+    
+    def _search_batch(self, user_queries, top_k, candidate_budget, parser_mode):
+        started = time.perf_counter()
+        metrics = self.metrics
+        budget = self._resolve_candidate_budget(top_k, candidate_budget)
+        parser = self.get_parser(parser_mode)
+        mode = self._mode_of(parser)
+        results = [None] * len(user_queries)
+        pending = {}     # 캐시 키 → (첫 질의 위치, 질의, 파싱 결과)
+        duplicates = []  # (질의 위치, 캐시 키) - 같은 조건 질의는 한 번만 계산
+        
+        logger.info(f"🤖 일괄 인재 검색 시작: {len(user_queries)}개 질의")
+        with self._stage("parse", metric="batch_stage_duration_seconds", queries=len(user_queries)):
+            for i, user_query in enumerate(user_queries):
+                try:
+                    parsed_query = self.parse_cache.parse(parser, user_query)
+                    cache_key = self.result_cache.make_key(
+                        parsed_query, self.talent_db.get_data_version(), parser_namespace(parser), budget
+                    )
+                    
+                    cached_result = self.result_cache.get_result(cache_key)
+                    if cached_result is not None:
+                        results[i] = cached_result
+                    elif cache_key in pending:
+                        duplicates.append((i, cache_key))
+                    else:
+                        pending[cache_key] = (i, user_query, parsed_query)
+                except Exception as e:
+                    logger.warning(f"❌ 일괄 검색 파싱 오류: {str(e)}")
+                    results[i] = self._generate_error_result(str(e))
+        
+        logger.debug(f"✅ 질의 파싱 완료 (캐시 적중 {sum(result is not None for result in results)}개, "
+                     f"계산 {len(pending)}개)")
+        
+        if pending:
+            keys = list(pending)
+            parsed_queries = [pending[key][2] for key in keys]
             
-            # 5. 재순위화 (가중치 적용)
+            try:
+                with self._stage("payload", metric="batch_stage_duration_seconds", queries=len(keys)):
+                    payload_lists = self.payload_searcher.search_batch(parsed_queries, top_k=budget["payload"])
+                payload_stats = self.payload_searcher.last_batch_stats
+                
+                if budget.get("semantic"):
+                    with self._stage("semantic", metric="batch_stage_duration_seconds", queries=len(keys)):
+                        payload_lists = [
+                            self._merge_semantic_candidates(parsed_query, candidates, budget["semantic"])
+                            for parsed_query, candidates in zip(parsed_queries, payload_lists)
+                        ]
+                
+                with self._stage("vector", metric="batch_stage_duration_seconds", queries=len(keys)):
+                    vector_lists = self.vector_searcher.search_batch(
+                        parsed_queries, payload_lists, top_k=budget["vector"]
+                    )
+                logger.debug(f"✅ Payload/벡터 일괄 검색 완료 ({len(keys)}개 질의)")
+                
+                for key, parsed_query, payload_candidates, stats, vector_results in zip(
+                        keys, parsed_queries, payload_lists, payload_stats, vector_lists):
+                    i, user_query, _ = pending[key]
+                    metrics.observe("candidates", len(payload_candidates), stage="payload")
+                    metrics.observe("candidates", len(vector_results), stage="vector")
+                    with self.tracer.span("query", index=i, candidates=len(vector_results)):
+                        with self._stage("weights"):
+                            dynamic_weights = self.weight_controller.calculate_weights(parsed_query)
+                        results[i] = self._build_search_result(
+                            user_query, parsed_query, dynamic_weights, payload_candidates, stats,
+                            vector_results, budget, key, mode
+                        )
+            except Exception as e:
+                logger.exception(f"❌ 일괄 인재 검색 오류: {str(e)}")
+                for i, _, _ in pending.values():
+                    results[i] = self._generate_error_result(str(e))
+        
+        for i, cache_key in duplicates:
+            results[i] = dict(results[pending[cache_key][0]])
+        
+        metrics.observe("batch_duration_seconds", time.perf_counter() - started)
+        metrics.observe("batch_size", len(user_queries))
+        for result in results:
+            metrics.inc("requests_total", status="success" if result.get("success") else "error",
+                        result_cache="batch")
+        return results
+    
+    def _collect_cache_metrics(self):
+        """파싱/결과 캐시 통계를 지표 형식으로 변환 (/api/metrics 출력 시점에 호출)"""
+        caches = {"parse": self.parse_cache.stats(), "result": self.result_cache.stats()}
+        counters = [
+            ("cache_hits_total", "hits", "캐시 적중 수"),
+            ("cache_misses_total", "misses", "캐시 미적중 수 (만료 포함)"),
+            ("cache_expired_total", "expired", "TTL 만료로 버려진 캐시 항목 수"),
+            ("cache_evictions_total", "evictions", "크기 제한으로 밀려난 캐시 항목 수")
+        ]
+        collected = [
+            (name, "counter", description, [({"cache": cache}, stats[key]) for cache, stats in caches.items()])
+            for name, key, description in counters
+        ]
+        collected.append(("cache_size", "gauge", "현재 캐시 항목 수",
+                          [({"cache": cache}, stats["size"]) for cache, stats in caches.items()]))
+        return collected
+    
+    @contextmanager
+    def _stage(self, stage, metric="stage_duration_seconds", **attributes):
+        """파이프라인 단계 실행 범위 - 처리 시간 히스토그램 기록 + 샘플된 요청이면 단계 span (with ... as span)"""
+        with self.tracer.span(stage, **attributes) as span, self.metrics.time_stage(stage, name=metric):
+            yield span
+    
+    def _record_request(self, started, status, result_cache):
+        """요청 전체 처리 시간과 결과/결과 캐시 적중 여부 기록"""
+        self.metrics.observe("request_duration_seconds", time.perf_counter() - started, result_cache=result_cache)
+        self.metrics.inc("requests_total", status=status, result_cache=result_cache)
+    
+    def _build_search_result(self, user_query, parsed_query, dynamic_weights, payload_candidates,
+                             payload_stats, vector_results, budget, cache_key, parser_mode) -> dict:
+        """재순위화 → 챗봇 응답 생성 후 검색 결과 구성 및 캐시 저장"""
+        metrics = self.metrics
+        
+        # 5. 재순위화 (가중치 적용)
+        with self._stage("rerank", top_k=budget["rerank"]) as span:
             ranked_talents = self.reranker.rerank(
-                vector_results, dynamic_weights
+                vector_results, dynamic_weights, top_k=budget["rerank"]
             )
-            print("✅ 5단계: 재순위화 완료")
-            
-            # 6. 챗봇 형식 응답 생성
+            span.set_attribute("candidates", len(ranked_talents))
+        metrics.observe("candidates", len(ranked_talents), stage="rerank")
+        logger.debug("✅ 5단계: 재순위화 완료")
+        
+        # 6. 챗봇 형식 응답 생성
+        with self._stage("generation") as span:
             chatbot_response = self.chatbot_generator.generate_chatbot_response(
-                user_query, parsed_query, ranked_talents
+                user_query, parsed_query, ranked_talents, seed=self.result_cache.seed_for(cache_key)
             )
-            print("✅ 6단계: 챗봇 응답 생성 완료")
-            
-            # 7. 후속 질문 생성
+            span.set_attribute("response_type", chatbot_response.get("response_type"))
+        logger.debug("✅ 6단계: 챗봇 응답 생성 완료")
+        
+        # 7. 후속 질문 생성
+        with self._stage("follow_ups"):
             follow_up_questions = self.chatbot_generator.generate_follow_up_questions(chatbot_response)
-            chatbot_response["follow_up_questions"] = follow_up_questions
-            
-            # 8. 시장 인사이트 생성 (옵션)
-            if chatbot_response.get("response_type") in ["suggest_alternatives", "no_results"]:
+        chatbot_response["follow_up_questions"] = follow_up_questions
+        
+        # 8. 시장 인사이트 생성 (옵션)
+        if chatbot_response.get("response_type") in ["suggest_alternatives", "no_results"]:
+            with self._stage("insights"):
                 market_insights = self.chatbot_generator.generate_market_insights(parsed_query, 
                     chatbot_response.get("matching_analysis", {}))
-                chatbot_response["market_insights"] = market_insights
-            
-            return {
-                "success": True,
-                "parsed_query": parsed_query,
-                "weights": dynamic_weights,
-                "total_candidates": len(payload_candidates),
-                "matched_talents": len(vector_results),
-                "chatbot_response": chatbot_response,
-                "recommendations": chatbot_response.get("recommendations", [])  # 기존 호환성
-            }
-            
-        except Exception as e:
-            print(f"❌ 챗봇 인재 검색 오류: {str(e)}")
-            print(traceback.format_exc())
-            return {
-                "success": False,
-                "error": str(e),
-                "chatbot_response": self._generate_error_chatbot_response(str(e)),
-                "recommendations": []
-            }
+            chatbot_response["market_insights"] = market_insights
+        
+        result = {
+            "success": True,
+            "parser": parser_mode,
+            "parsed_query": parsed_query,
+            "weights": dynamic_weights,
+            "total_candidates": payload_stats.get("matched", len(payload_candidates)),
+            "payload_stats": payload_stats,
+            "candidate_budget": budget,
+            "matched_talents": len(vector_results),
+            "chatbot_response": chatbot_response,
+            "recommendations": chatbot_response.get("recommendations", [])  # 기존 호환성
+        }
+        self.result_cache.put_result(cache_key, result)
+        
+        return result
+    
+    def _merge_semantic_candidates(self, parsed_query, payload_candidates, semantic_k):
+        """ANN으로 찾은 의미 기반 이웃 중 Payload 후보에 없는 인재를 점수 계산 후 추가"""
+        existing_ids = {candidate.get("id") for candidate in payload_candidates}
+        neighbour_ids = [talent_id for talent_id, _ in self.vector_searcher.retrieve(parsed_query, semantic_k)
+                         if talent_id not in existing_ids]
+        
+        neighbours = [self.talent_db.get_talent_by_id(talent_id) for talent_id in neighbour_ids]
+        semantic_candidates = self.payload_searcher.score_candidates(
+            parsed_query, [talent for talent in neighbours if talent is not None]
+        )
+        logger.debug(f"🧭 의미 기반 후보 {len(semantic_candidates)}명 추가")
+        
+        return list(payload_candidates) + semantic_candidates
+    
+    def _resolve_candidate_budget(self, top_k=None, candidate_budget=None) -> dict:
+        """요청별 단계 후보 수 제한 결정"""
+        budget = dict(self.candidate_budget)
+        budget.update(candidate_budget or {})
+        
+        if top_k is not None:
+            budget["rerank"] = top_k
+        
+        return budget
+    
+    def _generate_error_result(self, error_message: str) -> dict:
+        """검색 실패 결과"""
+        return {
+            "success": False,
+            "error": error_message,
+            "chatbot_response": self._generate_error_chatbot_response(error_message),
+            "recommendations": []
+        }
     
     def _generate_error_chatbot_response(self, error_message: str) -> dict:
         """오류 시 챗봇 응답 생성"""
@@ -155,9 +570,9 @@ class TalentSearchSystem:
                     result["recommendations"] = []
             
             return result
-            
+        
         except Exception as e:
-            print(f"❌ 레거시 검색 오류: {str(e)}")
+            logger.error(f"❌ 레거시 검색 오류: {str(e)}")
             return {
                 "success": False,
                 "error": str(e),
@@ -177,6 +592,37 @@ def index():
     """메인 페이지 - 챗봇 인터페이스"""
     return render_template('index.html')
 
+def _is_count(value) -> bool:
+    """JSON 정수 여부 (true/false와 실수는 제외)"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def _validate_search_options(data) -> str:
+    """검색 API의 top_k / candidate_budget 값 검사 (문제가 없으면 빈 문자열, 있으면 오류 메시지)"""
+    top_k = data.get('top_k')
+    if top_k is not None and not (_is_count(top_k) and 1 <= top_k <= MAX_TOP_K):
+        return f"top_k는 1~{MAX_TOP_K} 사이의 정수여야 합니다: {top_k!r}"
+    
+    candidate_budget = data.get('candidate_budget')
+    if candidate_budget is None:
+        return ""
+    if not isinstance(candidate_budget, dict):
+        return f"candidate_budget은 단계별 후보 수 객체여야 합니다 ({' | '.join(DEFAULT_CANDIDATE_BUDGET)})"
+    
+    for stage, value in candidate_budget.items():
+        if stage not in DEFAULT_CANDIDATE_BUDGET:
+            return f"알 수 없는 candidate_budget 단계입니다: {stage} ({' | '.join(DEFAULT_CANDIDATE_BUDGET)})"
+        # null은 제한 없음, semantic은 0이면 비활성화
+        minimum = 0 if stage == "semantic" else 1
+        if value is not None and not (_is_count(value) and value >= minimum):
+            return f"candidate_budget.{stage}는 {minimum} 이상의 정수 또는 null이어야 합니다: {value!r}"
+    return ""
+
+def _with_trace_header(response, span):
+    """샘플된 요청이면 응답에 traceparent 헤더 추가 (수집기에서 해당 trace를 찾을 수 있도록)"""
+    if span.sampled:
+        response.headers['traceparent'] = span.traceparent()
+    return response
+
 @app.route('/api/search', methods=['POST'])
 def api_search():
     """인재 검색 API - 챗봇 지원"""
@@ -191,7 +637,7 @@ def api_search():
                     "chatbot_tone": "apologetic"
                 }
             }), 500
-            
+        
         data = request.get_json()
         if not data:
             return jsonify({
@@ -203,7 +649,7 @@ def api_search():
                     "chatbot_tone": "confused"
                 }
             }), 400
-            
+        
         user_query = data.get('query', '').strip()
         
         if not user_query:
@@ -222,14 +668,45 @@ def api_search():
                 }
             }), 400
         
-        # 챗봇 형식 인재 검색 실행
-        result = talent_system.search_talents_chatbot(user_query)
+        # 요청별 파서 선택 (A/B 비교용, 없으면 현재 기본 파서)
+        parser_mode = data.get('parser')
+        if parser_mode is not None and parser_mode not in PARSER_MODES:
+            return jsonify({
+                "success": False,
+                "error": f"알 수 없는 파서입니다: {parser_mode} ({' | '.join(PARSER_MODES)})",
+                "chatbot_response": {
+                    "response_type": "error",
+                    "message": "🤔 요청을 이해할 수 없어요. 다시 말씀해 주시겠어요?",
+                    "chatbot_tone": "confused"
+                }
+            }), 400
         
-        return jsonify(result)
+        option_error = _validate_search_options(data)
+        if option_error:
+            return jsonify({
+                "success": False,
+                "error": option_error,
+                "chatbot_response": {
+                    "response_type": "error",
+                    "message": "🤔 요청을 이해할 수 없어요. 다시 말씀해 주시겠어요?",
+                    "chatbot_tone": "confused"
+                }
+            }), 400
         
+        # 챗봇 형식 인재 검색 실행 (단계별 후보 수 제한은 선택, traceparent 헤더가 있으면 같은 trace로 연결)
+        with talent_system.tracer.trace("POST /api/search", traceparent=request.headers.get('traceparent'),
+                                        kind="server") as span:
+            result = talent_system.search_talents_chatbot(
+                user_query,
+                top_k=data.get('top_k'),
+                candidate_budget=data.get('candidate_budget'),
+                parser_mode=parser_mode
+            )
+        
+        return _with_trace_header(jsonify(result), span)
+    
     except Exception as e:
-        print(f"❌ API 검색 오류: {e}")
-        print(traceback.format_exc())
+        logger.exception(f"❌ API 검색 오류: {e}")
         return jsonify({
             "success": False,
             "error": f"서버 오류: {str(e)}",
@@ -241,6 +718,77 @@ def api_search():
             }
         }), 500
 
+@app.route('/api/search/batch', methods=['POST'])
+def api_search_batch():
+    """일괄 인재 검색 API - {"queries": [...], "top_k", "candidate_budget", "parser"}"""
+    try:
+        if talent_system is None:
+            return jsonify({
+                "success": False,
+                "error": "시스템이 초기화되지 않았습니다."
+            }), 500
+        
+        data = request.get_json()
+        queries = data.get('queries') if data else None
+        if not isinstance(queries, list) or not queries:
+            return jsonify({
+                "success": False,
+                "error": "queries 목록이 필요합니다."
+            }), 400
+        
+        if len(queries) > MAX_BATCH_QUERIES:
+            return jsonify({
+                "success": False,
+                "error": f"한 번에 최대 {MAX_BATCH_QUERIES}개 질의까지 검색할 수 있습니다."
+            }), 400
+        
+        user_queries = [query.strip() if isinstance(query, str) else "" for query in queries]
+        if not all(user_queries):
+            return jsonify({
+                "success": False,
+                "error": "비어있는 검색 질의가 있습니다."
+            }), 400
+        
+        parser_mode = data.get('parser')
+        if parser_mode is not None and parser_mode not in PARSER_MODES:
+            return jsonify({
+                "success": False,
+                "error": f"알 수 없는 파서입니다: {parser_mode} ({' | '.join(PARSER_MODES)})"
+            }), 400
+        
+        option_error = _validate_search_options(data)
+        if option_error:
+            return jsonify({
+                "success": False,
+                "error": option_error
+            }), 400
+        
+        started = time.perf_counter()
+        with talent_system.tracer.trace("POST /api/search/batch", traceparent=request.headers.get('traceparent'),
+                                        kind="server") as span:
+            results = talent_system.search_batch(
+                user_queries,
+                top_k=data.get('top_k'),
+                candidate_budget=data.get('candidate_budget'),
+                parser_mode=parser_mode
+            )
+        elapsed = time.perf_counter() - started
+        
+        return _with_trace_header(jsonify({
+            "success": True,
+            "count": len(results),
+            "elapsed_seconds": round(elapsed, 4),
+            "queries_per_second": round(len(results) / elapsed, 2) if elapsed > 0 else None,
+            "results": results
+        }), span)
+    
+    except Exception as e:
+        logger.exception(f"❌ 일괄 검색 API 오류: {e}")
+        return jsonify({
+            "success": False,
+            "error": f"서버 오류: {str(e)}"
+        }), 500
+
 @app.route('/api/search/legacy', methods=['POST'])
 def api_search_legacy():
     """기존 형식 인재 검색 API (호환성 유지)"""
@@ -250,14 +798,14 @@ def api_search_legacy():
                 "success": False,
                 "error": "시스템이 초기화되지 않았습니다."
             }), 500
-            
+        
         data = request.get_json()
         if not data:
             return jsonify({
                 "success": False,
                 "error": "요청 데이터가 없습니다."
             }), 400
-            
+        
         user_query = data.get('query', '').strip()
         
         if not user_query:
@@ -270,9 +818,9 @@ def api_search_legacy():
         result = talent_system.search_talents_legacy(user_query)
         
         return jsonify(result)
-        
+    
     except Exception as e:
-        print(f"❌ 레거시 API 검색 오류: {e}")
+        logger.error(f"❌ 레거시 API 검색 오류: {e}")
         return jsonify({
             "success": False,
             "error": f"서버 오류: {str(e)}"
@@ -304,7 +852,7 @@ def api_follow_up():
                 "response": "더 구체적으로 말씀해 주시겠어요?",
                 "suggestions": ["새로운 검색하기", "조건 완화하기", "도움말 보기"]
             })
-            
+    
     except Exception as e:
         return jsonify({
             "response": "죄송해요. 이해하지 못했어요. 다시 말씀해 주시겠어요?",
@@ -313,24 +861,35 @@ def api_follow_up():
 
 @app.route('/api/switch_parser', methods=['POST'])
 def api_switch_parser():
-    """파서 모드 전환 API"""
+    """파서 모드 전환 API - {"parser": "rulebase" | "llm"} 또는 {"use_llm": bool}"""
     try:
-        data = request.get_json()
-        use_llm = data.get('use_llm', False)
+        if talent_system is None:
+            return jsonify({
+                "success": False,
+                "error": "시스템이 초기화되지 않았습니다."
+            }), 500
+        
+        data = request.get_json() or {}
+        parser_mode = data.get('parser') or ("llm" if data.get('use_llm', False) else "rulebase")
+        if parser_mode not in PARSER_MODES:
+            return jsonify({
+                "success": False,
+                "error": f"알 수 없는 파서입니다: {parser_mode} ({' | '.join(PARSER_MODES)})"
+            }), 400
         
-        global talent_system
-        talent_system = TalentSearchSystem(use_llm=use_llm)
+        # 파서만 교체 (인재 데이터/색인/캐시 유지, 파싱·결과 캐시는 파서별 네임스페이스)
+        talent_system.switch_parser(parser_mode)
         
-        parser_type = "LLM" if use_llm else "Rulebase"
+        parser_type = "LLM" if parser_mode == "llm" else "Rulebase"
         
         return jsonify({
             "success": True,
             "message": f"{parser_type} 파서로 전환되었습니다.",
             "current_parser": parser_type
         })
-        
+    
     except Exception as e:
-        print(f"❌ 파서 전환 오류: {e}")
+        logger.exception(f"❌ 파서 전환 오류: {e}")
         return jsonify({
             "success": False,
             "error": f"파서 전환 오류: {str(e)}"
@@ -345,12 +904,13 @@ def api_status():
                 "system_status": "error",
                 "error": "시스템이 초기화되지 않았습니다."
             })
-            
+        
         parser_type = "LLM" if talent_system.use_llm else "Rulebase"
         
         return jsonify({
             "system_status": "active",
             "current_parser": parser_type,
+            "parser_mode": talent_system.parser_mode,
             "base_year": talent_system.current_year,
             "mode": "chatbot",
             "components": {
@@ -360,7 +920,9 @@ def api_status():
                 "vector_searcher": "ready",
                 "reranker": "ready",
                 "chatbot_generator": "ready"
-            }
+            },
+            "parse_cache": talent_system.parse_cache.stats(),
+            "result_cache": talent_system.result_cache.stats()
         })
     except Exception as e:
         return jsonify({
@@ -368,6 +930,28 @@ def api_status():
             "error": str(e)
         })
 
+@app.route('/api/metrics')
+def api_metrics():
+    """단계별 처리 시간/후보 수 히스토그램과 요청·캐시 카운터 (Prometheus 텍스트 형식)"""
+    registry = talent_system.metrics if talent_system is not None else get_metrics()
+    return app.response_class(registry.render_prometheus(), mimetype="text/plain; version=0.0.4; charset=utf-8")
+
+@app.route('/api/ann/recall')
+def api_ann_recall():
+    """ANN 의미 기반 검색 recall@k 점검 (정확 검색 대비)"""
+    try:
+        if talent_system is None:
+            return jsonify({"success": False, "error": "시스템이 초기화되지 않았습니다."}), 500
+        
+        k = request.args.get('k', 10, type=int)
+        nprobe = request.args.get('nprobe', type=int)
+        report = talent_system.vector_searcher.check_ann_recall(k=k, nprobe=nprobe)
+        
+        return jsonify({"success": True, **report})
+    
+    except Exception as e:
+        return jsonify({"success": False, "error": str(e)}), 500
+
 @app.errorhandler(404)
 def not_found(error):
     return jsonify({"error": "페이지를 찾을 수 없습니다."}), 404
@@ -390,6 +974,7 @@ if __name__ == '__main__':
     else:
         print("⚠️  시스템 초기화 실패 - 일부 기능이 제한될 수 있습니다")
     
+    print("🏭 운영 환경은 멀티 워커 진입점 사용: python serve.py")
     print("-" * 50)
     
     app.run(debug=True, host='0.0.0.0', port=5000)
\ No newline at end of file
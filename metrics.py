@@ -0,0 +1,176 @@
+"""
+검색 지표 모듈
+단계별 처리 시간/후보 수 히스토그램과 요청·캐시 카운터 집계 - Prometheus 텍스트 형식으로 출력
+
+저장소는 프로세스별이다. gunicorn pre-fork 워커는 각자 자기 요청만 집계하므로
+모든 시계열에 pid 라벨을 붙여 워커를 구분하고, 합계는 수집 측에서
+sum without (pid) (...)로 구한다. fork 직후 reset()으로 마스터에서 기록된 값을 비워
+워커 합계에 중복으로 더해지지 않게 한다.
+"""
+
+import bisect
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# 처리 시간 구간 (초)
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# 후보 수 구간 (명)
+COUNT_BUCKETS = (0, 1, 5, 10, 20, 50, 100, 200, 500, 1000, 5000, 10000, 50000, 100000)
+
+# 수집 함수 반환 형식: [(지표 이름, 타입, 설명, [(라벨, 값)])]
+CollectedMetric = Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]
+
+class Histogram:
+    """누적 구간 히스토그램 (Prometheus le 규칙 - 값이 구간 상한 이하이면 포함)"""
+    
+    def __init__(self, buckets: Iterable[float]):
+        self.buckets = tuple(sorted(buckets))
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막은 +Inf
+        self.sum = 0.0
+        self.count = 0
+    
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+    
+    def cumulative(self) -> List[Tuple[str, int]]:
+        """(le, 누적 개수) 목록"""
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float("inf"),), self.counts):
+            total += count
+            result.append(("+Inf" if bound == float("inf") else _format_value(bound), total))
+        return result
+
+class MetricsRegistry:
+    """스레드 안전 지표 저장소 - 히스토그램/카운터 계열은 라벨 조합별로 관리
+    
+    pid_label: 출력 시 모든 시계열에 현재 프로세스 pid 라벨 추가 (워커별 저장소 구분)
+    """
+    
+    def __init__(self, namespace: str = "talent_search", pid_label: bool = True):
+        self.namespace = namespace
+        self.pid_label = pid_label
+        self._lock = threading.Lock()
+        self._histograms = {}  # 이름 → (설명, 구간, {라벨 튜플: Histogram})
+        self._counters = {}    # 이름 → (설명, {라벨 튜플: 값})
+        self._collectors = {}  # 이름 → 출력 시점에 값을 읽어오는 함수 (캐시 통계 등)
+        
+        self.register_histogram("stage_duration_seconds", "검색 단계별 처리 시간", LATENCY_BUCKETS)
+        self.register_histogram("request_duration_seconds", "검색 요청 전체 처리 시간", LATENCY_BUCKETS)
+        self.register_histogram("candidates", "단계별 후보 수", COUNT_BUCKETS)
+        self.register_histogram("batch_stage_duration_seconds", "일괄 검색 단계별 처리 시간 (질의 묶음 전체)", LATENCY_BUCKETS)
+        self.register_histogram("batch_duration_seconds", "일괄 검색 요청 전체 처리 시간", LATENCY_BUCKETS)
+        self.register_histogram("batch_size", "일괄 검색 요청당 질의 수", COUNT_BUCKETS)
+        self.register_counter("requests_total", "검색 요청 수 (결과 상태/결과 캐시 적중 여부별)")
+    
+    def register_histogram(self, name: str, description: str, buckets: Iterable[float]):
+        with self._lock:
+            self._histograms.setdefault(name, (description, tuple(buckets), {}))
+    
+    def register_counter(self, name: str, description: str):
+        with self._lock:
+            self._counters.setdefault(name, (description, {}))
+    
+    def add_collector(self, name: str, collector: Callable[[], List[CollectedMetric]]):
+        """출력 때마다 호출해 지표를 추가하는 함수 등록 (같은 이름은 교체 - 시스템 재생성 시 중복 방지)"""
+        with self._lock:
+            self._collectors[name] = collector
+    
+    def observe(self, name: str, value: float, **labels):
+        """히스토그램에 값 기록"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            _, buckets, series = self._histograms[name]
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(buckets)
+            histogram.observe(value)
+    
+    def inc(self, name: str, amount: float = 1, **labels):
+        """카운터 증가"""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            _, series = self._counters[name]
+            series[key] = series.get(key, 0) + amount
+    
+    def reset(self):
+        """기록된 히스토그램/카운터 값 삭제 (등록된 지표와 수집 함수는 유지 - fork된 워커 초기화용)"""
+        with self._lock:
+            for _, _, series in self._histograms.values():
+                series.clear()
+            for _, series in self._counters.values():
+                series.clear()
+    
+    @contextmanager
+    def time_stage(self, stage: str, name: str = "stage_duration_seconds"):
+        """with 블록 처리 시간을 단조 시계로 측정해 단계 라벨로 기록"""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - started, stage=stage)
+    
+    def render_prometheus(self) -> str:
+        """Prometheus 텍스트 노출 형식 (version 0.0.4)"""
+        lines = []
+        # 출력 시점 pid (fork 후에도 워커 자신의 pid)
+        process = {"pid": str(os.getpid())} if self.pid_label else {}
+        
+        with self._lock:
+            for name, (description, _, series) in self._histograms.items():
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# HELP {full_name} {description}")
+                lines.append(f"# TYPE {full_name} histogram")
+                for key, histogram in sorted(series.items()):
+                    labels = {**process, **dict(key)}
+                    for bound, count in histogram.cumulative():
+                        lines.append(f"{full_name}_bucket{_format_labels(labels, le=bound)} {count}")
+                    lines.append(f"{full_name}_sum{_format_labels(labels)} {_format_value(histogram.sum)}")
+                    lines.append(f"{full_name}_count{_format_labels(labels)} {histogram.count}")
+            
+            for name, (description, series) in self._counters.items():
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# HELP {full_name} {description}")
+                lines.append(f"# TYPE {full_name} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full_name}{_format_labels({**process, **dict(key)})} {_format_value(value)}")
+            
+            collectors = list(self._collectors.values())
+        
+        for collector in collectors:
+            for name, metric_type, description, samples in collector():
+                full_name = f"{self.namespace}_{name}"
+                lines.append(f"# HELP {full_name} {description}")
+                lines.append(f"# TYPE {full_name} {metric_type}")
+                for labels, value in samples:
+                    lines.append(f"{full_name}{_format_labels({**process, **labels})} {_format_value(value)}")
+        
+        return "\n".join(lines) + "\n"
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _format_labels(labels: Dict, le: Optional[str] = None) -> str:
+    items = [(key, str(value)) for key, value in labels.items()]
+    if le is not None:
+        items.append(("le", le))
+    if not items:
+        return ""
+    escaped = (value.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, value in items)
+    return "{" + ",".join(f'{key}="{value}"' for (key, _), value in zip(items, escaped)) + "}"
+
+_shared_registry = MetricsRegistry()
+
+def get_metrics() -> MetricsRegistry:
+    """프로세스 공용 지표 저장소"""
+    return _shared_registry
@@ -0,0 +1,111 @@
+"""
+파싱 결과 캐시 모듈
+정규화한 질의 기준 LRU/TTL 캐시 - 파서 종류와 매핑 버전별로 네임스페이스 분리
+"""
+
+import copy
+import re
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Dict, Optional
+
+# 기본 캐시 설정
+DEFAULT_PARSE_CACHE_SIZE = 1024
+DEFAULT_PARSE_CACHE_TTL = 3600  # 초
+
+# 파싱에 의미가 있는 기호(나이 범위 ~, 기술명 c++/c#/long-term 등)는 남기고 나머지 문장부호는 공백으로
+_FOLDED_PUNCTUATION = re.compile(r"[^\w\s+#\-~/]+")
+_WHITESPACE = re.compile(r"\s+")
+
+def normalize_query(query: str) -> str:
+    """질의 정규화 (유니코드 NFKC, 소문자, 문장부호/공백 정리)"""
+    text = unicodedata.normalize("NFKC", query or "").lower()
+    text = _FOLDED_PUNCTUATION.sub(" ", text)
+    return _WHITESPACE.sub(" ", text).strip()
+
+def parser_namespace(parser) -> str:
+    """캐시 네임스페이스 (파서 클래스 + 매핑 버전)"""
+    return f"{type(parser).__name__}:{getattr(parser, 'mapping_version', '')}"
+
+class LRUTTLCache:
+    """스레드 안전 LRU/TTL 캐시 (크기 초과 시 가장 오래 안 쓴 항목 제거, TTL 지나면 만료)"""
+    
+    def __init__(self, max_size: int, ttl_seconds: Optional[float] = None):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        
+        self._entries = OrderedDict()  # 키 → (저장 시각, 값)
+        self._lock = threading.Lock()
+        self._stats = {"hits": 0, "misses": 0, "expired": 0, "evictions": 0}
+    
+    def get(self, key):
+        """캐시 값 반환 (없거나 만료되면 None)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._stats["misses"] += 1
+                return None
+            
+            stored_at, value = entry
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._stats["expired"] += 1
+                self._stats["misses"] += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self._stats["hits"] += 1
+            return value
+    
+    def put(self, key, value):
+        if self.max_size <= 0:
+            return
+        
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._stats["evictions"] += 1
+    
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+    
+    def stats(self) -> Dict:
+        """적중률 통계"""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["size"] = len(self._entries)
+        
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["max_size"] = self.max_size
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
+
+class ParseCache(LRUTTLCache):
+    """parser.parse 앞단 캐시 - 키는 (파서 네임스페이스, 정규화 질의)
+    
+    캐시 미스 시 정규화한 질의를 파싱하므로 같은 키에는 항상 같은 결과가 저장된다.
+    반환값은 복사본이라 호출 측에서 수정해도 캐시에 영향이 없다.
+    """
+    
+    def __init__(self, max_size: int = DEFAULT_PARSE_CACHE_SIZE,
+                 ttl_seconds: Optional[float] = DEFAULT_PARSE_CACHE_TTL):
+        super().__init__(max_size, ttl_seconds)
+    
+    def parse(self, parser, query: str) -> Dict:
+        """캐시된 파싱 결과 반환, 없으면 파싱 후 저장"""
+        normalized = normalize_query(query)
+        key = (parser_namespace(parser), normalized)
+        
+        cached = self.get(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+        
+        parsed = parser.parse(normalized)
+        self.put(key, copy.deepcopy(parsed))
+        return parsed
@@ -4,37 +4,504 @@ Payload 검색 모듈
 """
 
 import json
-from typing import Dict, List, Optional, Any
+import logging
+import threading
+from typing import Dict, List, Optional, Any, Set
 from example.talent_data import TalentDatabase
+from scored_talent import ScoredTalent, select_top
+from tracing import get_tracer
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 환경에서는 인재 dict 단위 점수 계산 사용
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# 필드별 매칭 만점 (정규화 분모는 전체 합)
+FIELD_WEIGHTS = {
+    "age": 10.0,
+    "residence": 15.0,
+    "industry_domain": 20.0,
+    "industry_knowledge": 15.0,
+    "specialization": 25.0,
+    "experience_years": 20.0,
+    "talent_level": 15.0,
+    "skills": 30.0
+}
+
+# 일괄 검색 시 한 번에 계산하는 쿼리 × 인재 점수 칸 수 (메모리 상한)
+BATCH_SCORE_CELLS = 2000000
+
+# 역색인 후보 점수와 후보 밖 인재 점수 상한 비교 여유 (합산 순서에 따른 반올림 차이)
+PRUNE_BOUND_EPSILON = 1e-9
+
+# 컬럼 경로에서 posting 크기 합이 인재 수의 1/N 이하면 posting ID로 행을 찾고,
+# 그보다 크면 같은 합집합을 컬럼 코드 마스크로 계산 (ID 단위 파이썬 처리가 전체 컬럼 비교보다 느려짐)
+POSTING_LOOKUP_RATIO = 32
+
+# 인접 지역 (예: 서울-경기도)
+ADJACENT_REGIONS = {
+    "서울": ["경기도"],
+    "경기도": ["서울", "인천"],
+    "인천": ["경기도"]
+}
+
+# 유사 산업
+SIMILAR_INDUSTRIES = {
+    "금융": ["공공"],
+    "공공": ["금융"],
+    "제조": ["유통"],
+    "유통": ["제조"]
+}
+
+# 관련 산업 지식
+RELATED_KNOWLEDGE = {
+    "인프라": ["네트워크", "시스템"],
+    "은행": ["금융", "보험"],
+    "증권": ["금융", "투자"]
+}
+
+# 관련 전문 분야
+RELATED_SPECS = {
+    "NE": ["SE", "보안"],
+    "SE": ["NE", "OP"],
+    "DBA": ["DVLP", "AA"],
+    "DVLP": ["DBA", "AA"],
+    "보안": ["NE", "SE"]
+}
+
+# 인재 등급 호환성
+LEVEL_COMPATIBILITY = {
+    "고급": ["중급"],
+    "중급": ["고급", "초급"]
+}
+
+# 유사 기술 (쿼리 기술 → 대체 가능한 인재 기술)
+SIMILAR_SKILLS = {
+    "linux": ["unix", "centos", "ubuntu"],
+    "oracle": ["mysql", "postgresql"],
+    "java": ["spring", "jsp"],
+    "aws": ["azure", "gcp"]
+}
 
 class PayloadSearcher:
     """Payload 기반 검색 클래스"""
     
-    def __init__(self):
-        self.talent_db = TalentDatabase()
-        self.talents = self.talent_db.get_all_talents()
+    def __init__(self, use_inverted_index: bool = True, use_vectorized: bool = True,
+                 talent_db: Optional[TalentDatabase] = None, tracer=None):
+        self.talent_db = talent_db if talent_db is not None else TalentDatabase()
+        self.use_inverted_index = use_inverted_index
+        self.use_vectorized = use_vectorized
+        # 필드 매칭 배치별 span (샘플된 요청만 기록)
+        self.tracer = tracer if tracer is not None else get_tracer()
+        
+        # 마지막 검색의 후보 축소 통계 (일괄 검색은 쿼리별 목록) - 동시 요청끼리 섞이지 않도록 스레드별 저장
+        self._local = threading.local()
+        
+        self._load_talents()
+        if self.talent_db.is_disk_backed:
+            print(f"📦 Payload 검색기 초기화 (디스크 기반 {self._talent_count}명, 후보만 로드)")
+            return
+        
+        if use_vectorized and self.columns is None:
+            print("⚠️  NumPy 미설치 - dict 기반 Payload 점수 계산 사용")
+        
+        print(f"📦 Payload 검색기 초기화 ({self._talent_count}명 인재 데이터 로드)")
+    
+    @property
+    def last_search_stats(self) -> Dict:
+        return getattr(self._local, "search_stats", {})
+    
+    @last_search_stats.setter
+    def last_search_stats(self, stats: Dict):
+        self._local.search_stats = stats
+    
+    @property
+    def last_batch_stats(self) -> List[Dict]:
+        return getattr(self._local, "batch_stats", [])
+    
+    @last_batch_stats.setter
+    def last_batch_stats(self, stats: List[Dict]):
+        self._local.batch_stats = stats
+    
+    def _load_talents(self):
+        """인재 슬롯 및 파생 데이터 로드 (데이터 버전 기준 - 인재 수와 무관한 비용)"""
+        self._data_version = self.talent_db.get_data_version()
+        self._talent_count = self.talent_db.get_talent_count()
+        self._talent_list = None
+        self._talent_positions = None
+        
+        if self.talent_db.is_disk_backed:
+            # 디스크 기반 DB는 검색 시점에 후보 행만 조회
+            self.slots = []
+            self.columns = None
+            return
+        
+        # 컬럼형 벡터화 점수 계산 (False 또는 NumPy 미설치 시 dict 단위 계산)
+        self.columns = self.talent_db.get_columns() if self.use_vectorized else None
+        
+        # 컬럼 행 번호 = 슬롯 번호 (인재 목록을 다시 만들지 않고 저장소의 슬롯 목록을 참조)
+        self.slots = self.talent_db.get_talent_slots()
+    
+    @property
+    def talents(self) -> List[Dict]:
+        """삭제된 슬롯을 뺀 인재 목록 (dict 단위 점수 계산용 - 데이터 버전별로 처음 쓸 때 생성)"""
+        if self._talent_list is None:
+            self._talent_list = [] if self.talent_db.is_disk_backed else self.talent_db.get_all_talents()
+        return self._talent_list
+    
+    def search(self, parsed_query: Dict, top_k: Optional[int] = None) -> List[ScoredTalent]:
+        """Payload 검색 실행 (top_k 지정 시 상위 top_k명만 반환)"""
+        logger.debug("📦 Payload 검색 시작")
+        
+        # 데이터베이스가 변경되었으면 스냅샷 갱신
+        if self._data_version != self.talent_db.get_data_version():
+            self._load_talents()
         
-        print(f"📦 Payload 검색기 초기화 ({len(self.talents)}명 인재 데이터 로드)")
+        if self.talent_db.is_disk_backed:
+            return self._search_disk_backed(parsed_query, top_k)
+        
+        if self.use_vectorized and self.columns is not None:
+            candidates = self._search_vectorized(parsed_query, top_k)
+        else:
+            positions = self._generate_candidates(parsed_query, top_k)
+            self.last_search_stats = self._candidate_stats(
+                len(self.talents) if positions is None else len(positions), positions is not None
+            )
+            logger.debug(f"📦 역색인 후보 생성: {self.last_search_stats['scored']}명 점수 계산, "
+                         f"{self.last_search_stats['pruned']}명 제외")
+            candidates = self._search_per_talent(parsed_query, positions, top_k)
+        
+        logger.debug(f"✅ Payload 검색 완료: {self.last_search_stats['matched']}명 중 "
+                     f"{len(candidates)}명 후보 선정")
+        return candidates
+    
+    def search_batch(self, parsed_queries: List[Dict], top_k: Optional[int] = None) -> List[List[ScoredTalent]]:
+        """여러 쿼리 Payload 검색 - 쿼리 × 인재 점수 행렬을 한 번에 계산 (쿼리별 결과는 search와 동일)"""
+        if self._data_version != self.talent_db.get_data_version():
+            self._load_talents()
+        
+        if self.talent_db.is_disk_backed or not (self.use_vectorized and self.columns is not None):
+            results, batch_stats = [], []
+            for parsed_query in parsed_queries:
+                results.append(self.search(parsed_query, top_k))
+                batch_stats.append(self.last_search_stats)
+            self.last_batch_stats = batch_stats
+            return results
+        
+        results, batch_stats = [], []
+        step = max(1, BATCH_SCORE_CELLS // max(self.columns.size, 1))
+        for start in range(0, len(parsed_queries), step):
+            chunk = parsed_queries[start:start + step]
+            score_matrix = self._calculate_payload_score_matrix(chunk)
+            
+            for scores in score_matrix:
+                self.last_search_stats = self._candidate_stats(self._talent_count, False)
+                results.append(self._select_scored_rows(scores, top_k))
+                batch_stats.append(self.last_search_stats)
+        
+        self.last_batch_stats = batch_stats
+        logger.debug(f"📦 Payload 일괄 검색 완료: {len(parsed_queries)}개 쿼리 × {self._talent_count}명")
+        return results
+    
+    def score_candidates(self, parsed_query: Dict, talents: List[Dict]) -> List[ScoredTalent]:
+        """외부에서 찾은 후보(의미 기반 검색 등)의 Payload 점수 계산 (최소 조건 필터 없음)"""
+        return [ScoredTalent(talent, self._calculate_payload_score(talent, parsed_query))
+                for talent in talents]
+    
+    def _search_disk_backed(self, parsed_query: Dict, top_k: Optional[int] = None) -> List[ScoredTalent]:
+        """디스크 기반 DB 검색 - 경량 행으로 점수 계산 후 선택된 후보만 전체 프로필 로드"""
+        # top_k가 없으면 점수가 0보다 큰 모든 인재가 결과이므로 역색인으로 줄일 수 없음
+        use_index = self.use_inverted_index and top_k is not None
+        constraints = self._expand_query_constraints(parsed_query) if use_index else {}
+        scoring_rows = self.talent_db.get_scoring_rows(constraints)
+        
+        self.last_search_stats = self._disk_candidate_stats(len(scoring_rows), bool(constraints))
+        logger.debug(f"📦 역색인 후보 생성: {len(scoring_rows)}명 점수 계산, "
+                     f"{self.last_search_stats['pruned']}명 제외")
+        
+        candidates = self._score_talents(parsed_query, scoring_rows, top_k)
+        if constraints and not self._index_result_exact(parsed_query, candidates, top_k):
+            # 역색인 밖 인재가 상위에 들 수 있으면 전체 인재로 다시 계산
+            scoring_rows = self.talent_db.get_scoring_rows()
+            self.last_search_stats = self._disk_candidate_stats(len(scoring_rows), False)
+            self.last_search_stats["index_fallback"] = True
+            candidates = self._score_talents(parsed_query, scoring_rows, top_k)
+        
+        # 필터를 통과한 후보만 프로필 JSON 로드
+        profiles = self.talent_db.get_profiles([candidate.talent["id"] for candidate in candidates])
+        for candidate in candidates:
+            candidate.talent = profiles.get(candidate.talent["id"], candidate.talent)
+        
+        logger.debug(f"✅ Payload 검색 완료: {self.last_search_stats['matched']}명 중 "
+                     f"{len(candidates)}명 후보 선정")
+        return candidates
+    
+    def _disk_candidate_stats(self, scored_count: int, index_used: bool) -> Dict:
+        """디스크 기반 DB 역색인 후보 축소 통계"""
+        return {
+            "total": self._talent_count,
+            "scored": scored_count,
+            "pruned": self._talent_count - scored_count,
+            "index_used": index_used,
+            "vectorized": False,
+            "data_version": self._data_version
+        }
+    
+    def _candidate_stats(self, scored_count: int, index_used: bool) -> Dict:
+        """역색인 후보 축소 통계"""
+        return {
+            "total": self._talent_count,
+            "scored": scored_count,
+            "pruned": self._talent_count - scored_count,
+            "index_used": index_used,
+            "vectorized": self.use_vectorized and self.columns is not None,
+            "data_version": self._data_version
+        }
     
-    def search(self, parsed_query: Dict) -> List[Dict]:
-        """Payload 검색 실행"""
-        print("📦 Payload 검색 시작")
+    def _search_per_talent(self, parsed_query: Dict, positions: Optional[List[int]],
+                           top_k: Optional[int] = None) -> List[ScoredTalent]:
+        """인재 dict 단위 점수 계산"""
+        scoring_pool = self.talents if positions is None else [self.talents[i] for i in positions]
+        candidates = self._score_talents(parsed_query, scoring_pool, top_k)
+        
+        if positions is not None and not self._index_result_exact(parsed_query, candidates, top_k):
+            # 역색인 밖 인재가 상위에 들 수 있으면 전체 인재로 다시 계산
+            self.last_search_stats = self._candidate_stats(len(self.talents), False)
+            self.last_search_stats["index_fallback"] = True
+            candidates = self._score_talents(parsed_query, self.talents, top_k)
         
+        return candidates
+    
+    def _score_talents(self, parsed_query: Dict, scoring_pool: List[Dict],
+                       top_k: Optional[int] = None) -> List[ScoredTalent]:
+        """점수 계산 후 상위 후보 선택"""
         candidates = []
         
-        for talent in self.talents:
-            score = self._calculate_payload_score(talent, parsed_query)
+        with self.tracer.span("payload.match", field="all", mode="per_talent", rows=len(scoring_pool)) as span:
+            for talent in scoring_pool:
+                score = self._calculate_payload_score(talent, parsed_query)
+                
+                if score > 0:  # 최소 조건 만족
+                    candidates.append(ScoredTalent(talent, score))
+            span.set_attribute("matched", len(candidates))
+        
+        self.last_search_stats["matched"] = len(candidates)
+        
+        # 점수 순으로 상위 후보 선택
+        return select_top(candidates, top_k, key=lambda x: x.payload_score)
+    
+    def _search_vectorized(self, parsed_query: Dict, top_k: Optional[int] = None) -> List[ScoredTalent]:
+        """컬럼형 점수 계산 (dict 경로와 동일한 점수)
+        
+        역색인 후보 행만 뽑아 점수를 계산하고, 결과가 전체 풀 계산과 같다고 보장되지 않으면
+        (_index_result_exact) 전체 풀 점수로 다시 계산한다.
+        """
+        candidate_rows = self._generate_candidate_rows(parsed_query, top_k)
+        if candidate_rows is not None:
+            self.last_search_stats = self._candidate_stats(len(candidate_rows), True)
+            logger.debug(f"📦 역색인 후보 생성: {self.last_search_stats['scored']}명 점수 계산, "
+                         f"{self.last_search_stats['pruned']}명 제외")
             
-            if score > 0:  # 최소 조건 만족
-                talent_with_score = talent.copy()
-                talent_with_score["payload_score"] = score
-                candidates.append(talent_with_score)
+            columns = self.columns.take(candidate_rows)
+            scores = self._calculate_payload_scores_vectorized(parsed_query, columns)
+            candidates = self._select_scored_rows(scores, top_k, columns, candidate_rows)
+            if self._index_result_exact(parsed_query, candidates, top_k):
+                return candidates
+        
+        self.last_search_stats = self._candidate_stats(self._talent_count, False)
+        if candidate_rows is not None:
+            # 역색인 밖 인재가 상위에 들 수 있으면 전체 인재로 다시 계산
+            self.last_search_stats["index_fallback"] = True
+        
+        scores = self._calculate_payload_scores_vectorized(parsed_query)
+        return self._select_scored_rows(scores, top_k)
+    
+    def _select_scored_rows(self, scores: "np.ndarray", top_k: Optional[int] = None, columns=None,
+                            row_slots: Optional["np.ndarray"] = None) -> List[ScoredTalent]:
+        """점수 벡터에서 최소 조건을 만족하는 상위 후보 선택
+        
+        columns: 점수를 계산한 컬럼 (None이면 전체 풀)
+        row_slots: 행 → 슬롯 번호 (None이면 행 번호 = 슬롯 번호)
+        """
+        columns = self.columns if columns is None else columns
+        rows = np.flatnonzero((scores > 0) & columns.alive)  # 최소 조건 만족 (삭제된 슬롯 제외)
+        self.last_search_stats["matched"] = len(rows)
+        
+        # 상위 top_k 부분 선택 (경계 동점은 원래 순서가 앞선 인재 우선)
+        if top_k is not None and top_k <= 0:
+            rows = rows[:0]
+        elif top_k is not None and len(rows) > top_k:
+            row_scores = scores[rows]
+            kth_score = np.partition(row_scores, len(rows) - top_k)[len(rows) - top_k]
+            above = rows[row_scores > kth_score]
+            ties = rows[row_scores == kth_score][:top_k - len(above)]
+            rows = np.sort(np.concatenate([above, ties]))
+        
+        # 점수 내림차순, 동점은 원래 순서 유지 (list.sort와 동일)
+        rows = rows[np.argsort(-scores[rows], kind="stable")]
+        
+        # 점수 계산 뒤 다른 스레드가 삭제한 슬롯은 건너뜀
+        slots = self.slots
+        talent_slots = (rows if row_slots is None else row_slots[rows]).tolist()
+        return [ScoredTalent(slots[slot], score) for slot, score in zip(talent_slots, scores[rows].tolist())
+                if slots[slot] is not None]
+    
+    def _index_constraints(self, query: Dict, top_k: Optional[int] = None) -> Optional[Dict[str, Set[str]]]:
+        """역색인 후보 생성에 쓸 필드별 값 조건 (None이면 전체 인재 대상)
         
-        # 점수 순으로 정렬
-        candidates.sort(key=lambda x: x["payload_score"], reverse=True)
+        top_k가 없으면 점수가 0보다 큰 모든 인재가 결과이므로 전체 인재 대상
+        """
+        if not self.use_inverted_index or top_k is None:
+            return None
         
-        print(f"✅ Payload 검색 완료: {len(candidates)}명 후보 선정")
-        return candidates
+        # 색인 가능한 조건이 없으면 전체 인재 대상
+        return self._expand_query_constraints(query) or None
+    
+    def _candidate_ids(self, constraints: Dict[str, Set[str]]) -> Set[str]:
+        """posting list 합집합 인재 ID"""
+        candidate_ids = set()
+        for field, values in constraints.items():
+            candidate_ids |= self.talent_db.get_posting_ids(field, values)
+        return candidate_ids
+    
+    def _generate_candidate_rows(self, query: Dict, top_k: Optional[int] = None) -> Optional["np.ndarray"]:
+        """역색인 후보의 컬럼 행 번호 (= 슬롯 번호, 오름차순 - None이면 전체 인재)
+        
+        posting이 작으면 ID → 슬롯으로 찾고, 크면 같은 합집합을 컬럼 코드로 계산한다.
+        """
+        constraints = self._index_constraints(query, top_k)
+        if constraints is None:
+            return None
+        
+        columns = self.columns
+        posting_count = sum(self.talent_db.get_posting_count(field, values) for field, values in constraints.items())
+        if posting_count * POSTING_LOOKUP_RATIO <= columns.size:
+            get_slot = self.talent_db.get_talent_slot
+            slots = [get_slot(talent_id) for talent_id in self._candidate_ids(constraints)]
+            rows = np.array([slot for slot in slots if slot is not None and slot < columns.size], dtype=np.int64)
+            rows.sort()
+            return rows
+        
+        mask = np.zeros(columns.size, dtype=bool)
+        for field, values in constraints.items():
+            mask |= columns.match_any(field, values)
+        return np.flatnonzero(mask)
+    
+    def _generate_candidates(self, query: Dict, top_k: Optional[int] = None) -> Optional[List[int]]:
+        """역색인으로 점수 계산 대상 후보 위치 생성 (self.talents 위치, None이면 전체 인재)"""
+        constraints = self._index_constraints(query, top_k)
+        if constraints is None:
+            return None
+        
+        candidate_ids = self._candidate_ids(constraints)
+        talent_positions = self._get_talent_positions()
+        positions = [talent_positions[talent_id] for talent_id in candidate_ids if talent_id in talent_positions]
+        positions.sort()
+        
+        return positions
+    
+    def _get_talent_positions(self) -> Dict[str, int]:
+        """인재 ID → self.talents 위치 (현재 인재 목록 기준으로 한 번만 생성)"""
+        talents = self.talents
+        cached = self._talent_positions
+        if cached is None or cached[0] is not talents:
+            cached = (talents, {talent["id"]: i for i, talent in enumerate(talents)})
+            self._talent_positions = cached
+        return cached[1]
+    
+    def _index_result_exact(self, query: Dict, candidates: List[ScoredTalent], top_k: Optional[int]) -> bool:
+        """역색인 후보만으로 고른 상위 top_k가 전체 인재 대상 결과와 같은지 확인
+        
+        조건이 없는 필드는 모든 인재에게 중간 점수를 주고 나이/경력은 색인이 없으므로,
+        후보 밖 인재도 0보다 큰 점수를 받을 수 있다 (상한: _pruned_score_bound).
+        top_k번째 후보 점수가 그 상한보다 커야 결과가 같고, top_k가 없거나
+        후보가 top_k명보다 적으면 (후보 0명 포함) 후보 밖 인재도 결과에 들어가야 한다.
+        """
+        if top_k is not None and top_k <= 0:
+            return True
+        if top_k is None or len(candidates) < top_k:
+            return False
+        
+        return candidates[top_k - 1].payload_score > self._pruned_score_bound(query) + PRUNE_BOUND_EPSILON
+    
+    def _pruned_score_bound(self, query: Dict) -> float:
+        """역색인 후보 밖 인재가 받을 수 있는 최대 Payload 점수 (정규화)
+        
+        색인 조건 필드: 관련 값이 아니므로 0점
+        조건 없는 필드: 모든 인재 공통 중간 점수 (나이는 0점)
+        나이/경력 조건: 색인이 없으므로 만점까지 가능
+        """
+        constraints = self._expand_query_constraints(query)
+        bound = 0.0
+        
+        for field, weight in FIELD_WEIGHTS.items():
+            if field in constraints:
+                continue
+            if field == "age":
+                if query.get("age") or query.get("age_min") or query.get("age_max"):
+                    bound += weight
+            elif field == "experience_years" and query.get("experience_years"):
+                bound += weight
+            else:
+                bound += weight * 0.5
+        
+        return bound / sum(FIELD_WEIGHTS.values())
+    
+    def _expand_query_constraints(self, query: Dict) -> Dict[str, Set[str]]:
+        """쿼리 조건을 관련 값까지 확장 (각 _match_* 함수의 부분 점수 조건과 동일)"""
+        constraints = {}
+        
+        residence = query.get("residence")
+        if residence:
+            constraints["residence"] = self._related_values(ADJACENT_REGIONS, residence)
+        
+        industry = query.get("industry_domain")
+        if industry:
+            constraints["industry_domain"] = self._related_values(SIMILAR_INDUSTRIES, industry)
+        
+        knowledge = query.get("industry_knowledge")
+        if knowledge:
+            constraints["industry_knowledge"] = self._related_values(RELATED_KNOWLEDGE, knowledge)
+        
+        spec = query.get("specialization")
+        if spec:
+            constraints["specialization"] = self._related_values(RELATED_SPECS, spec)
+        
+        query_levels = query.get("talent_level")
+        if query_levels:
+            levels = query_levels if isinstance(query_levels, list) else [query_levels]
+            if "등급무관" in levels:
+                # 등급무관이면 등급이 있는 모든 인재가 만점
+                constraints["talent_level"] = set(self.talent_db.get_index_values("talent_level"))
+            else:
+                expanded = set()
+                for level in levels:
+                    expanded |= self._related_values(LEVEL_COMPATIBILITY, level)
+                constraints["talent_level"] = expanded
+        
+        query_skills = query.get("skills")
+        if query_skills:
+            expanded = set()
+            for skill in query_skills:
+                skill_lower = skill.lower()
+                expanded.add(skill_lower)
+                expanded.update(SIMILAR_SKILLS.get(skill_lower, []))
+            constraints["skills"] = expanded
+        
+        return constraints
+    
+    @staticmethod
+    def _related_values(relations: Dict[str, List[str]], value: str) -> Set[str]:
+        """쿼리 값과 일치하거나 쿼리 값을 관련 값으로 갖는 인재 측 값 집합"""
+        related = {value}
+        
+        for talent_value, related_values in relations.items():
+            if value in related_values:
+                related.add(talent_value)
+        
+        return related
     
     def _calculate_payload_score(self, talent: Dict, query: Dict) -> float:
         """Payload 매칭 점수 계산"""
@@ -87,9 +554,244 @@ class PayloadSearcher:
         else:
             return 0.0
     
+    def _calculate_payload_scores_vectorized(self, query: Dict, columns=None) -> "np.ndarray":
+        """Payload 점수 벡터 계산 (_calculate_payload_score와 같은 순서로 합산, columns가 None이면 전체 풀)"""
+        columns = self.columns if columns is None else columns
+        
+        match = self._traced_match
+        field_scores = [
+            match("age", self._vector_match_age, columns, query),
+            match("residence", self._vector_match_category, columns, "residence", self._match_residence, query),
+            match("industry_domain", self._vector_match_category, columns, "industry_domain",
+                  self._match_industry_domain, query),
+            match("industry_knowledge", self._vector_match_category, columns, "industry_knowledge",
+                  self._match_industry_knowledge, query),
+            match("specialization", self._vector_match_category, columns, "specialization",
+                  self._match_specialization, query),
+            match("experience", self._vector_match_experience, columns, query),
+            match("talent_level", self._vector_match_category, columns, "talent_level", self._match_talent_level, query),
+            match("skills", self._vector_match_skills, columns, query)
+        ]
+        
+        total_score = np.zeros(columns.size, dtype=np.float64)
+        max_possible_score = 0.0
+        for scores in field_scores:
+            total_score += scores
+        for weight in FIELD_WEIGHTS.values():
+            max_possible_score += weight
+        
+        return total_score / max_possible_score
+    
+    def _calculate_payload_score_matrix(self, queries: List[Dict]) -> "np.ndarray":
+        """쿼리 × 인재 Payload 점수 행렬 (행마다 _calculate_payload_scores_vectorized와 같은 순서로 합산)"""
+        columns = self.columns
+        
+        match = self._traced_match
+        total_score = np.zeros((len(queries), columns.size), dtype=np.float64)
+        total_score += match("age", self._matrix_match_age, columns, queries)
+        total_score += match("residence", self._matrix_match_category, columns, "residence",
+                             self._match_residence, queries)
+        total_score += match("industry_domain", self._matrix_match_category, columns, "industry_domain",
+                             self._match_industry_domain, queries)
+        total_score += match("industry_knowledge", self._matrix_match_category, columns, "industry_knowledge",
+                             self._match_industry_knowledge, queries)
+        total_score += match("specialization", self._matrix_match_category, columns, "specialization",
+                             self._match_specialization, queries)
+        total_score += match("experience", self._matrix_match_experience, columns, queries)
+        total_score += match("talent_level", self._matrix_match_category, columns, "talent_level",
+                             self._match_talent_level, queries)
+        total_score += match("skills", self._matrix_match_skills, columns, queries)
+        
+        max_possible_score = 0.0
+        for weight in FIELD_WEIGHTS.values():
+            max_possible_score += weight
+        
+        return total_score / max_possible_score
+    
+    def _traced_match(self, field: str, match_batch, *args) -> "np.ndarray":
+        """필드 매칭 배치 실행 (컬럼 단위, args[0]은 컬럼 - 샘플된 요청이면 필드별 span 기록)"""
+        with self.tracer.span("payload.match", field=field, mode="columnar", rows=args[0].size):
+            return match_batch(*args)
+    
+    def _matrix_match_category(self, columns, field: str, matcher, queries: List[Dict]) -> "np.ndarray":
+        """범주형 필드 매칭 - 쿼리 × 범주 점수표를 만든 뒤 코드로 조회"""
+        column = columns.categories[field]
+        table = np.array(
+            [[matcher({field: value}, query)[0] for value in column.values] for query in queries],
+            dtype=np.float64
+        )
+        return table[:, column.codes]
+    
+    def _matrix_match_age(self, columns, queries: List[Dict]) -> "np.ndarray":
+        """나이 매칭 (쿼리 × 인재)"""
+        weight = FIELD_WEIGHTS["age"]
+        ages = columns.age[None, :]
+        has_age = ages != 0
+        
+        # 정확한 나이 매칭
+        query_age = np.array([query.get("age") or 0 for query in queries], dtype=np.int64)[:, None]
+        exact = has_age & (query_age != 0) & (ages == query_age)
+        scores = np.where(exact, weight, 0.0)
+        
+        # 나이 범위 매칭
+        has_range = np.array(
+            [bool(query.get("age_min") or query.get("age_max")) for query in queries]
+        )[:, None]
+        min_age = np.array([query.get("age_min") or 0 for query in queries], dtype=np.int64)[:, None]
+        max_age = np.array([query.get("age_max") or 100 for query in queries], dtype=np.int64)[:, None]
+        in_range = has_age & ~exact & has_range & (min_age <= ages) & (ages <= max_age)
+        
+        center = (min_age + max_age) / 2
+        range_size = max_age - min_age
+        with np.errstate(divide="ignore", invalid="ignore"):
+            range_scores = np.maximum(0, weight * (1 - np.abs(ages - center) / (range_size / 2)))
+        range_scores = np.where(range_size > 0, range_scores, weight)
+        
+        return np.where(in_range, range_scores, scores)
+    
+    def _matrix_match_experience(self, columns, queries: List[Dict]) -> "np.ndarray":
+        """경력 매칭 (쿼리 × 인재)"""
+        weight = FIELD_WEIGHTS["experience_years"]
+        query_exp = np.array([query.get("experience_years") or 0 for query in queries], dtype=np.int64)[:, None]
+        
+        talent_exp = columns.experience_years[None, :]
+        has_exp = talent_exp != 0
+        enough = talent_exp >= query_exp
+        
+        scores = np.zeros((len(queries), columns.size), dtype=np.float64)
+        scores[has_exp & enough & (talent_exp <= query_exp * 2)] = weight
+        scores[has_exp & enough & (talent_exp > query_exp * 2)] = weight * 0.8  # 오버스펙 패널티
+        scores[has_exp & ~enough & (query_exp - talent_exp <= 1)] = weight * 0.6
+        
+        # 경력 조건 없는 쿼리는 중간 점수
+        scores[query_exp[:, 0] == 0] = weight * 0.5
+        return scores
+    
+    def _matrix_match_skills(self, columns, queries: List[Dict]) -> "np.ndarray":
+        """기술 스택 매칭 (쿼리 × 인재)"""
+        weight = FIELD_WEIGHTS["skills"]
+        scores = np.full((len(queries), columns.size), weight * 0.5)
+        
+        skill_rows = [i for i, query in enumerate(queries) if query.get("skills", [])]
+        if not skill_rows:
+            return scores
+        
+        query_skills = [[skill.lower() for skill in queries[i]["skills"]] for i in skill_rows]
+        lengths = np.array([len(skills) for skills in query_skills], dtype=np.int64)[:, None]
+        
+        # 기술 스택 교집합 크기
+        matches = columns.count_skill_hits_batch(query_skills)
+        match_scores = weight * (matches / lengths)
+        
+        # 유사 기술 매칭 (쿼리 기술별 보유 여부를 기술 단위로 한 번만 계산)
+        similar_keys = sorted({skill for skills in query_skills for skill in skills if SIMILAR_SKILLS.get(skill)})
+        similar_matches = np.zeros((len(skill_rows), columns.size), dtype=np.int64)
+        if similar_keys:
+            has_similar = np.stack([
+                (columns.count_skill_hits(SIMILAR_SKILLS[skill]) > 0).astype(np.int64) for skill in similar_keys
+            ])
+            key_counts = np.array(
+                [[skills.count(skill) for skill in similar_keys] for skills in query_skills], dtype=np.int64
+            )
+            similar_matches = key_counts @ has_similar
+        similar_scores = weight * (similar_matches / lengths) * 0.7
+        
+        skill_scores = np.where(similar_matches > 0, similar_scores, 0.0)
+        skill_scores = np.where(matches > 0, match_scores, skill_scores)
+        scores[skill_rows] = np.where(columns.has_skills[None, :], skill_scores, 0.0)
+        return scores
+    
+    def _vector_match_category(self, columns, field: str, matcher, query: Dict) -> "np.ndarray":
+        """범주형 필드 매칭 - 범주별 점수표를 만든 뒤 코드로 조회"""
+        column = columns.categories[field]
+        table = np.array(
+            [matcher({field: value}, query)[0] for value in column.values], dtype=np.float64
+        )
+        return table[column.codes]
+    
+    def _vector_match_age(self, columns, query: Dict) -> "np.ndarray":
+        """나이 매칭 (벡터화)"""
+        weight = FIELD_WEIGHTS["age"]
+        ages = columns.age
+        scores = np.zeros(columns.size, dtype=np.float64)
+        has_age = ages != 0
+        
+        query_age = query.get("age")
+        query_age_min = query.get("age_min")
+        query_age_max = query.get("age_max")
+        
+        # 정확한 나이 매칭
+        exact = np.zeros(columns.size, dtype=bool)
+        if query_age:
+            exact = has_age & (ages == query_age)
+            scores[exact] = weight
+        
+        # 나이 범위 매칭
+        if query_age_min or query_age_max:
+            min_age = query_age_min or 0
+            max_age = query_age_max or 100
+            in_range = has_age & ~exact & (min_age <= ages) & (ages <= max_age)
+            
+            center = (min_age + max_age) / 2
+            range_size = max_age - min_age
+            
+            if range_size > 0:
+                distance = np.abs(ages - center)
+                range_scores = np.maximum(0, weight * (1 - distance / (range_size / 2)))
+                scores = np.where(in_range, range_scores, scores)
+            else:
+                scores[in_range] = weight
+        
+        return scores
+    
+    def _vector_match_experience(self, columns, query: Dict) -> "np.ndarray":
+        """경력 매칭 (벡터화)"""
+        weight = FIELD_WEIGHTS["experience_years"]
+        query_exp = query.get("experience_years")
+        
+        if not query_exp:
+            return np.full(columns.size, weight * 0.5)
+        
+        talent_exp = columns.experience_years
+        has_exp = talent_exp != 0
+        enough = talent_exp >= query_exp
+        
+        scores = np.zeros(columns.size, dtype=np.float64)
+        scores[has_exp & enough & (talent_exp <= query_exp * 2)] = weight
+        scores[has_exp & enough & (talent_exp > query_exp * 2)] = weight * 0.8  # 오버스펙 패널티
+        scores[has_exp & ~enough & (query_exp - talent_exp <= 1)] = weight * 0.6
+        
+        return scores
+    
+    def _vector_match_skills(self, columns, query: Dict) -> "np.ndarray":
+        """기술 스택 매칭 (벡터화)"""
+        weight = FIELD_WEIGHTS["skills"]
+        query_skills = query.get("skills", [])
+        
+        if not query_skills:
+            return np.full(columns.size, weight * 0.5)
+        
+        query_skills_lower = [skill.lower() for skill in query_skills]
+        
+        # 기술 스택 교집합 크기
+        matches = columns.count_skill_hits(query_skills_lower)
+        match_scores = weight * (matches / len(query_skills_lower))
+        
+        # 유사 기술 매칭 (쿼리 기술별로 하나라도 보유하면 1)
+        similar_matches = np.zeros(columns.size, dtype=np.int64)
+        for query_skill in query_skills_lower:
+            similar = SIMILAR_SKILLS.get(query_skill, [])
+            if similar:
+                similar_matches += columns.count_skill_hits(similar) > 0
+        similar_scores = weight * (similar_matches / len(query_skills_lower)) * 0.7
+        
+        scores = np.where(similar_matches > 0, similar_scores, 0.0)
+        scores = np.where(matches > 0, match_scores, scores)
+        return np.where(columns.has_skills, scores, 0.0)
+    
     def _match_age(self, talent: Dict, query: Dict) -> tuple:
         """나이 매칭"""
-        weight = 10.0
+        weight = FIELD_WEIGHTS["age"]
         
         talent_age = talent.get("age")
         if not talent_age:
@@ -124,7 +826,7 @@ class PayloadSearcher:
     
     def _match_residence(self, talent: Dict, query: Dict) -> tuple:
         """거주지역 매칭"""
-        weight = 15.0
+        weight = FIELD_WEIGHTS["residence"]
         
         talent_residence = talent.get("residence")
         query_residence = query.get("residence")
@@ -139,20 +841,14 @@ class PayloadSearcher:
             return weight, weight
         
         # 인접 지역 점수 (예: 서울-경기도)
-        adjacent_regions = {
-            "서울": ["경기도"],
-            "경기도": ["서울", "인천"],
-            "인천": ["경기도"]
-        }
-        
-        if query_residence in adjacent_regions.get(talent_residence, []):
+        if query_residence in ADJACENT_REGIONS.get(talent_residence, []):
             return weight * 0.7, weight
         
         return 0.0, weight
     
     def _match_industry_domain(self, talent: Dict, query: Dict) -> tuple:
         """산업 도메인 매칭"""
-        weight = 20.0
+        weight = FIELD_WEIGHTS["industry_domain"]
         
         talent_industry = talent.get("industry_domain")
         query_industry = query.get("industry_domain")
@@ -167,21 +863,14 @@ class PayloadSearcher:
             return weight, weight
         
         # 유사 산업 점수
-        similar_industries = {
-            "금융": ["공공"],
-            "공공": ["금융"],
-            "제조": ["유통"],
-            "유통": ["제조"]
-        }
-        
-        if query_industry in similar_industries.get(talent_industry, []):
+        if query_industry in SIMILAR_INDUSTRIES.get(talent_industry, []):
             return weight * 0.6, weight
         
         return 0.0, weight
     
     def _match_industry_knowledge(self, talent: Dict, query: Dict) -> tuple:
         """산업 지식 매칭"""
-        weight = 15.0
+        weight = FIELD_WEIGHTS["industry_knowledge"]
         
         talent_knowledge = talent.get("industry_knowledge")
         query_knowledge = query.get("industry_knowledge")
@@ -196,23 +885,17 @@ class PayloadSearcher:
             return weight, weight
         
         # 관련 지식 점수
-        related_knowledge = {
-            "인프라": ["네트워크", "시스템"],
-            "은행": ["금융", "보험"],
-            "증권": ["금융", "투자"]
-        }
-        
         talent_knowledge_list = talent_knowledge if isinstance(talent_knowledge, list) else [talent_knowledge]
         
         for tk in talent_knowledge_list:
-            if query_knowledge in related_knowledge.get(tk, []) or tk == query_knowledge:
+            if query_knowledge in RELATED_KNOWLEDGE.get(tk, []) or tk == query_knowledge:
                 return weight * 0.8, weight
         
         return 0.0, weight
     
     def _match_specialization(self, talent: Dict, query: Dict) -> tuple:
         """전문 분야 매칭"""
-        weight = 25.0
+        weight = FIELD_WEIGHTS["specialization"]
         
         talent_spec = talent.get("specialization")
         query_spec = query.get("specialization")
@@ -227,22 +910,14 @@ class PayloadSearcher:
             return weight, weight
         
         # 관련 전문 분야 점수
-        related_specs = {
-            "NE": ["SE", "보안"],
-            "SE": ["NE", "OP"],
-            "DBA": ["DVLP", "AA"],
-            "DVLP": ["DBA", "AA"],
-            "보안": ["NE", "SE"]
-        }
-        
-        if query_spec in related_specs.get(talent_spec, []):
+        if query_spec in RELATED_SPECS.get(talent_spec, []):
             return weight * 0.7, weight
         
         return 0.0, weight
     
     def _match_experience(self, talent: Dict, query: Dict) -> tuple:
         """경력 매칭"""
-        weight = 20.0
+        weight = FIELD_WEIGHTS["experience_years"]
         
         talent_exp = talent.get("experience_years")
         query_exp = query.get("experience_years")
@@ -271,7 +946,7 @@ class PayloadSearcher:
     
     def _match_talent_level(self, talent: Dict, query: Dict) -> tuple:
         """인재 등급 매칭"""
-        weight = 15.0
+        weight = FIELD_WEIGHTS["talent_level"]
         
         talent_level = talent.get("talent_level")
         query_levels = query.get("talent_level")
@@ -290,12 +965,7 @@ class PayloadSearcher:
                 return weight, weight
         
         # 레벨 호환성 체크
-        level_compatibility = {
-            "고급": ["중급"],
-            "중급": ["고급", "초급"]
-        }
-        
-        compatible_levels = level_compatibility.get(talent_level, [])
+        compatible_levels = LEVEL_COMPATIBILITY.get(talent_level, [])
         if any(level in compatible_levels for level in (query_levels if isinstance(query_levels, list) else [query_levels])):
             return weight * 0.7, weight
         
@@ -303,7 +973,7 @@ class PayloadSearcher:
     
     def _match_skills(self, talent: Dict, query: Dict) -> tuple:
         """기술 스택 매칭"""
-        weight = 30.0
+        weight = FIELD_WEIGHTS["skills"]
         
         talent_skills = talent.get("skills", [])
         query_skills = query.get("skills", [])
@@ -325,17 +995,10 @@ class PayloadSearcher:
             return weight * match_ratio, weight
         
         # 유사 기술 매칭
-        similar_skills = {
-            "linux": ["unix", "centos", "ubuntu"],
-            "oracle": ["mysql", "postgresql"],
-            "java": ["spring", "jsp"],
-            "aws": ["azure", "gcp"]
-        }
-        
         similar_matches = 0
         for query_skill in query_skills_lower:
             for talent_skill in talent_skills_lower:
-                if talent_skill in similar_skills.get(query_skill, []):
+                if talent_skill in SIMILAR_SKILLS.get(query_skill, []):
                     similar_matches += 1
                     break
         
@@ -364,7 +1027,7 @@ class PayloadSearcher:
             if meets_all_mandatory:
                 filtered.append(candidate)
         
-        print(f"📦 필수 요구사항 필터링: {len(filtered)}명 잔여")
+        logger.debug(f"📦 필수 요구사항 필터링: {len(filtered)}명 잔여")
         return filtered
     
     def get_search_statistics(self, candidates: List[Dict]) -> Dict:
@@ -4,157 +4,323 @@
 """
 
 from typing import Dict, List, Optional, Tuple
+import logging
 import math
+import warnings
+from scored_talent import ScoredTalent
+from tracing import get_tracer
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 환경에서는 행 단위 점수 계산 사용
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# 가중치 필드 → 결과에 기록된 필드별 점수 키 (없으면 payload_score 사용)
+FIELD_SCORE_KEYS = {
+    "age": "age_score",
+    "residence": "residence_score",
+    "industry_domain": "industry_score",
+    "specialization": "specialization_score",
+    "experience_years": "experience_score",
+    "talent_level": "talent_level_score",
+    "skills": "skills_score"
+}
+
+# 벡터 필드 전체 가중치
+VECTOR_FIELDS_WEIGHT = 0.4
+
+# Reciprocal Rank Fusion 기본 상수 (1 / (k + 순위))
+RRF_K = 60
+
+# 비즈니스 규칙 (판정 순서대로 점수에 곱함): (사유, 배율, 사유 기록 필드)
+BUSINESS_RULES = (
+    ("완전 매칭", 1.2, "bonus_reasons"),
+    ("과도한 경력", 0.9, "penalty_reasons"),
+    ("지역 선호", 1.1, "bonus_reasons"),
+    ("긴급 요청", 1.15, "bonus_reasons")
+)
+PREFERRED_RESIDENCES = ("서울", "경기도")
+
+# 결과 다양성 비교 속성과 MMR 관련도 가중치 λ (0~1, 1이면 점수 순서 그대로, 작을수록 다양성 우선)
+DIVERSITY_FACTORS = ("specialization", "residence", "industry_domain", "talent_level")
+DEFAULT_MMR_LAMBDA = 0.7
+
+def _attribute_source(result):
+    """인재 속성 조회 대상 (추가 값이 없는 ScoredTalent는 원본 인재 dict를 바로 조회)"""
+    if isinstance(result, ScoredTalent) and not result.extras:
+        return result.talent
+    return result
+
+def _top_order(scores, top_k: Optional[int]) -> List[int]:
+    """점수 내림차순 상위 top_k 위치 (동점은 입력 순서 유지 - select_top과 같은 순서)"""
+    if np is not None and isinstance(scores, np.ndarray):
+        order = np.argsort(-scores, kind="stable")
+        return order[:max(top_k, 0)].tolist() if top_k is not None else order.tolist()
+    
+    order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+    return order[:max(top_k, 0)] if top_k is not None else order
+
+def _descending_ranks(scores) -> List[int]:
+    """점수 내림차순 순위 (0부터, 동점은 같은 순위 = 더 높은 점수의 후보 수)"""
+    if np is not None and isinstance(scores, np.ndarray):
+        if not len(scores):
+            return np.zeros(0, dtype=np.int64)
+        
+        order = np.argsort(-scores, kind="stable")
+        ordered = scores[order]
+        positions = np.arange(len(scores))
+        # 동점 구간의 첫 위치를 구간 전체의 순위로 사용
+        group_starts = np.maximum.accumulate(
+            np.where(np.concatenate(([True], ordered[1:] != ordered[:-1])), positions, 0)
+        )
+        ranks = np.empty(len(scores), dtype=np.int64)
+        ranks[order] = group_starts
+        return ranks
+    
+    ranks = [0] * len(scores)
+    previous = None
+    rank = 0
+    for position, i in enumerate(sorted(range(len(scores)), key=scores.__getitem__, reverse=True)):
+        if scores[i] != previous:
+            rank = position
+            previous = scores[i]
+        ranks[i] = rank
+    return ranks
+
+class FieldScoreMatrix:
+    """후보 × 필드 점수 행렬 (재순위화 1회에 한 번 구축)
+    
+    필드 순서는 가중치 dict 순서, 행 순서는 후보 순서를 따른다.
+    벡터 필드 종합 점수는 별도 열(vector)로 보관한다.
+    필드별 점수 키를 가진 후보가 없는 필드는 payload_score 열과 같으므로 순위도 한 번만 계산한다.
+    """
+    
+    def __init__(self, results: List[Dict], weights: Dict):
+        self.fields = [field for field in weights if field != "vector_fields"]
+        self.field_weights = [weights[field] for field in self.fields]
+        vector_weights = list(weights.get("vector_fields", {}).items())
+        score_keys = [FIELD_SCORE_KEYS.get(field) for field in self.fields]
+        
+        override_keys = {key for key in score_keys if key is not None}
+        present_keys = set()
+        payload_scores = []
+        overrides = {}  # 필드별 점수 키가 있는 후보만: 행 위치 → 필드 점수 행
+        vector = []
+        for i, result in enumerate(results):
+            source = _attribute_source(result)
+            get = source.get
+            payload_score = result.get("payload_score", 0.0)
+            payload_scores.append(payload_score)
+            # 키별 포함 여부만 확인 (ScoredTalent 순회는 to_dict()로 전체 dict를 만들기 때문)
+            present = [key for key in override_keys if key in source]
+            if present:
+                present_keys.update(present)
+                overrides[i] = [payload_score if key is None else get(key, payload_score) for key in score_keys]
+            
+            # 벡터 필드별 세부 점수가 있으면 가중합, 없으면 vector_score
+            details = get("vector_details")
+            if details is not None:
+                detailed_score = 0.0
+                for field, weight in vector_weights:
+                    detailed_score += details.get(field, 0.0) * weight
+                vector.append(detailed_score)
+            else:
+                vector.append(result.get("vector_score", 0.0))
+        
+        # payload_score 열을 그대로 쓰는 필드 (해당 점수 키를 가진 후보가 없음)
+        self.payload_only = [key not in present_keys for key in score_keys]
+        
+        if np is not None:
+            self.payload = np.array(payload_scores, dtype=np.float64)
+            self.values = np.repeat(self.payload[:, None], len(self.fields), axis=1)
+            for i, row in overrides.items():
+                self.values[i] = row
+            self.vector = np.array(vector, dtype=np.float64)
+        else:
+            self.payload = payload_scores
+            self.values = [overrides.get(i) or [payload_score] * len(self.fields)
+                           for i, payload_score in enumerate(payload_scores)]
+            self.vector = vector
+        
+        self._ranks = None
+    
+    @property
+    def rank_weights(self) -> List[float]:
+        """순위 융합 가중치 (필드 순서 + 벡터 필드)"""
+        return self.field_weights + [VECTOR_FIELDS_WEIGHT]
+    
+    def ranks(self):
+        """필드별 내림차순 정수 순위 (후보 × (필드 + 벡터), 한 번 계산 후 재사용)"""
+        if self._ranks is None:
+            payload_ranks = _descending_ranks(self.payload) if any(self.payload_only) else None
+            columns = []
+            for j, payload_only in enumerate(self.payload_only):
+                if payload_only:
+                    columns.append(payload_ranks)
+                elif np is not None:
+                    columns.append(_descending_ranks(self.values[:, j]))
+                else:
+                    columns.append(_descending_ranks([row[j] for row in self.values]))
+            columns.append(_descending_ranks(self.vector))
+            
+            if np is not None:
+                self._ranks = np.column_stack(columns)
+            else:
+                self._ranks = [list(rank_row) for rank_row in zip(*columns)]
+        return self._ranks
+    
+    def borda_scores(self):
+        """가중 Borda 점수: Σ 가중치 × (후보 수 - 1 - 순위)"""
+        n = len(self.vector)
+        weights = self.rank_weights
+        if np is None:
+            return [sum((n - 1 - rank) * weight for rank, weight in zip(rank_row, weights))
+                    for rank_row in self.ranks()]
+        return (n - 1 - self.ranks()) @ np.array(weights, dtype=np.float64)
+    
+    def reciprocal_rank_scores(self, k: int = RRF_K):
+        """가중 RRF 점수: Σ 가중치 / (k + 순위), 순위는 1부터"""
+        weights = self.rank_weights
+        if np is None:
+            return [sum(weight / (k + rank + 1) for rank, weight in zip(rank_row, weights))
+                    for rank_row in self.ranks()]
+        return (1.0 / (k + self.ranks() + 1)) @ np.array(weights, dtype=np.float64)
+    
+    def weighted_sum(self):
+        """필드 점수 가중합 + 벡터 점수 × VECTOR_FIELDS_WEIGHT
+        
+        필드 순서대로 열 단위로 누적해 후보별 순차 합산과 같은 부동소수점 결과를 낸다.
+        """
+        if np is None:
+            scores = []
+            for row, vector_score in zip(self.values, self.vector):
+                score = 0.0
+                for field_score, weight in zip(row, self.field_weights):
+                    score += field_score * weight
+                scores.append(score + vector_score * VECTOR_FIELDS_WEIGHT)
+            return scores
+        
+        scores = np.zeros(len(self.vector))
+        for j, weight in enumerate(self.field_weights):
+            scores += self.values[:, j] * weight
+        scores += self.vector * VECTOR_FIELDS_WEIGHT
+        return scores
+    
+    def weighted_geometric_mean(self):
+        """양수 점수만의 가중 기하평균
+        
+        NumPy 사용 시 가중 로그합 / 양수 점수 가중치 합의 지수로 계산한다.
+        (행 단위 거듭제곱 곱과 마지막 자리 반올림만 다를 수 있음)
+        """
+        columns = [(j, weight) for j, weight in enumerate(self.field_weights)] + [(None, VECTOR_FIELDS_WEIGHT)]
+        
+        if np is None:
+            scores = []
+            for row, vector_score in zip(self.values, self.vector):
+                product = 1.0
+                total_weight = 0.0
+                for j, weight in columns:
+                    field_score = vector_score if j is None else row[j]
+                    if field_score > 0:
+                        product *= field_score ** weight
+                        total_weight += weight
+                scores.append(product ** (1.0 / total_weight) if total_weight > 0 else 0.0)
+            return scores
+        
+        values = np.column_stack([self.values, self.vector])
+        weights = np.array([weight for _, weight in columns], dtype=np.float64)
+        positive = values > 0
+        log_sum = np.log(np.where(positive, values, 1.0)) @ weights
+        total_weight = positive @ weights
+        has_weight = total_weight > 0
+        return np.where(has_weight, np.exp(log_sum / np.where(has_weight, total_weight, 1.0)), 0.0)
 
 class ReRanker:
     """재순위화 클래스"""
     
-    def __init__(self):
+    def __init__(self, tracer=None, rrf_k: int = RRF_K):
         # 재순위화 알고리즘 설정
         self.ranking_algorithms = {
             "weighted_sum": self._weighted_sum_ranking,
             "multiplicative": self._multiplicative_ranking,
-            "borda_count": self._borda_count_ranking
+            "borda_count": self._borda_count_ranking,
+            "reciprocal_rank_fusion": self._reciprocal_rank_fusion_ranking
         }
         
+        # RRF 순위 완화 상수 (클수록 상위 순위 간 점수 차이가 작아짐)
+        self.rrf_k = rrf_k
+        
+        # 순위 계산 span (샘플된 요청만 기록)
+        self.tracer = tracer if tracer is not None else get_tracer()
+        
         print("🔄 재순위화 모듈 초기화 완료")
     
     def rerank(self, vector_results: List[Dict], dynamic_weights: Dict, 
-               algorithm: str = "weighted_sum") -> List[Dict]:
-        """재순위화 실행"""
-        print(f"🔄 재순위화 시작 (알고리즘: {algorithm})")
+               algorithm: str = "weighted_sum", top_k: Optional[int] = None) -> List[Dict]:
+        """재순위화 실행 (top_k 지정 시 상위 top_k명만 순위 부여)"""
+        logger.debug(f"🔄 재순위화 시작 (알고리즘: {algorithm})")
         
         if not vector_results:
-            print("⚠️ 재순위화할 결과가 없음")
+            logger.debug("⚠️ 재순위화할 결과가 없음")
             return []
         
         # 선택된 알고리즘으로 재순위화
         ranking_func = self.ranking_algorithms.get(algorithm, self._weighted_sum_ranking)
-        reranked_results = ranking_func(vector_results, dynamic_weights)
+        with self.tracer.span("rerank.rank", algorithm=algorithm, candidates=len(vector_results), top_k=top_k):
+            reranked_results = ranking_func(vector_results, dynamic_weights, top_k)
         
         # 최종 순위 부여
         for i, result in enumerate(reranked_results):
             result["final_rank"] = i + 1
             result["ranking_algorithm"] = algorithm
         
-        print(f"✅ 재순위화 완료: {len(reranked_results)}명 순위 결정")
+        logger.debug(f"✅ 재순위화 완료: {len(reranked_results)}명 순위 결정")
         return reranked_results
     
-    def _weighted_sum_ranking(self, results: List[Dict], weights: Dict) -> List[Dict]:
-        """가중합 기반 순위화"""
-        
-        for result in results:
-            final_score = 0.0
-            
-            # 기본 필드 점수 계산
-            for field, weight in weights.items():
-                if field != "vector_fields":
-                    field_score = self._calculate_field_score(result, field)
-                    final_score += field_score * weight
-            
-            # 벡터 필드 점수 계산
-            vector_weights = weights.get("vector_fields", {})
-            vector_score = self._calculate_vector_score(result, vector_weights)
-            final_score += vector_score * 0.4  # 벡터 필드 전체 가중치
-            
-            result["final_score"] = final_score
-        
-        # 점수 순으로 정렬
-        results.sort(key=lambda x: x["final_score"], reverse=True)
-        return results
+    def _weighted_sum_ranking(self, results: List[Dict], weights: Dict,
+                              top_k: Optional[int] = None) -> List[Dict]:
+        """가중합 기반 순위화 (점수 행렬 × 가중치 벡터)"""
+        scores = FieldScoreMatrix(results, weights).weighted_sum()
+        return self._select_by_scores(results, scores, top_k)
     
-    def _multiplicative_ranking(self, results: List[Dict], weights: Dict) -> List[Dict]:
-        """곱셈 기반 순위화 (가중 기하평균)"""
-        
-        for result in results:
-            score_product = 1.0
-            total_weight = 0.0
-            
-            # 기본 필드 점수
-            for field, weight in weights.items():
-                if field != "vector_fields":
-                    field_score = self._calculate_field_score(result, field)
-                    if field_score > 0:
-                        score_product *= (field_score ** weight)
-                        total_weight += weight
-            
-            # 벡터 필드 점수
-            vector_weights = weights.get("vector_fields", {})
-            vector_score = self._calculate_vector_score(result, vector_weights)
-            if vector_score > 0:
-                vector_weight = 0.4
-                score_product *= (vector_score ** vector_weight)
-                total_weight += vector_weight
-            
-            # 기하평균 계산
-            if total_weight > 0:
-                result["final_score"] = score_product ** (1.0 / total_weight)
-            else:
-                result["final_score"] = 0.0
-        
-        results.sort(key=lambda x: x["final_score"], reverse=True)
-        return results
+    def _multiplicative_ranking(self, results: List[Dict], weights: Dict,
+                                top_k: Optional[int] = None) -> List[Dict]:
+        """곱셈 기반 순위화 (가중 기하평균 - 점수 행렬의 가중 로그합)"""
+        scores = FieldScoreMatrix(results, weights).weighted_geometric_mean()
+        return self._select_by_scores(results, scores, top_k)
     
-    def _borda_count_ranking(self, results: List[Dict], weights: Dict) -> List[Dict]:
-        """보다 카운트 기반 순위화"""
+    @staticmethod
+    def _select_by_scores(results: List[Dict], scores, top_k: Optional[int]) -> List[Dict]:
+        """후보별 final_score 기록 후 점수 순 상위 선택"""
+        if np is not None and isinstance(scores, np.ndarray):
+            scores_list = scores.tolist()
+        else:
+            scores_list = scores
         
-        n = len(results)
-        field_rankings = {}
+        for result, score in zip(results, scores_list):
+            result["final_score"] = score
         
-        # 각 필드별로 순위 계산
-        for field in weights.keys():
-            if field != "vector_fields":
-                # 필드 점수로 정렬
-                field_sorted = sorted(results, 
-                                    key=lambda x: self._calculate_field_score(x, field), 
-                                    reverse=True)
-                
-                field_rankings[field] = {result["id"] if "id" in result else id(result): rank 
-                                       for rank, result in enumerate(field_sorted)}
-        
-        # 벡터 필드 순위
-        vector_weights = weights.get("vector_fields", {})
-        vector_sorted = sorted(results,
-                             key=lambda x: self._calculate_vector_score(x, vector_weights),
-                             reverse=True)
-        field_rankings["vector_fields"] = {result["id"] if "id" in result else id(result): rank 
-                                         for rank, result in enumerate(vector_sorted)}
-        
-        # Borda 점수 계산
-        for result in results:
-            result_id = result["id"] if "id" in result else id(result)
-            borda_score = 0.0
-            
-            for field, weight in weights.items():
-                if field in field_rankings:
-                    rank = field_rankings[field].get(result_id, n)
-                    borda_score += (n - rank - 1) * weight
-            
-            result["final_score"] = borda_score
-        
-        results.sort(key=lambda x: x["final_score"], reverse=True)
-        return results
+        return [results[i] for i in _top_order(scores, top_k)]
+    
+    def _borda_count_ranking(self, results: List[Dict], weights: Dict,
+                             top_k: Optional[int] = None) -> List[Dict]:
+        """보다 카운트 기반 순위화 (필드별 순위 배열의 가중 Borda 점수)"""
+        scores = FieldScoreMatrix(results, weights).borda_scores()
+        return self._select_by_scores(results, scores, top_k)
+    
+    def _reciprocal_rank_fusion_ranking(self, results: List[Dict], weights: Dict,
+                                        top_k: Optional[int] = None) -> List[Dict]:
+        """Reciprocal Rank Fusion 기반 순위화 (필드별 순위의 가중 역수 합)"""
+        scores = FieldScoreMatrix(results, weights).reciprocal_rank_scores(self.rrf_k)
+        return self._select_by_scores(results, scores, top_k)
     
     def _calculate_field_score(self, result: Dict, field: str) -> float:
-        """개별 필드 점수 계산"""
-        
-        if field == "age":
-            return self._score_age_match(result)
-        elif field == "residence":
-            return self._score_residence_match(result)
-        elif field == "industry_domain":
-            return self._score_industry_match(result)
-        elif field == "specialization":
-            return self._score_specialization_match(result)
-        elif field == "experience_years":
-            return self._score_experience_match(result)
-        elif field == "talent_level":
-            return self._score_talent_level_match(result)
-        elif field == "skills":
-            return self._score_skills_match(result)
-        else:
-            # 기본 점수 (payload_score 사용)
-            return result.get("payload_score", 0.0)
+        """개별 필드 점수 계산 (필드별 점수가 없으면 payload_score 사용)"""
+        payload_score = result.get("payload_score", 0.0)
+        score_key = FIELD_SCORE_KEYS.get(field)
+        return payload_score if score_key is None else result.get(score_key, payload_score)
     
     def _calculate_vector_score(self, result: Dict, vector_weights: Dict) -> float:
         """벡터 필드 종합 점수 계산"""
@@ -171,130 +337,157 @@ class ReRanker:
         
         return vector_score
     
-    def _score_age_match(self, result: Dict) -> float:
-        """나이 매칭 점수"""
-        # payload_score에서 나이 관련 점수 추출하거나 별도 계산
-        return result.get("age_score", result.get("payload_score", 0.0))
-    
-    def _score_residence_match(self, result: Dict) -> float:
-        """거주지 매칭 점수"""
-        return result.get("residence_score", result.get("payload_score", 0.0))
-    
-    def _score_industry_match(self, result: Dict) -> float:
-        """산업 매칭 점수"""
-        return result.get("industry_score", result.get("payload_score", 0.0))
-    
-    def _score_specialization_match(self, result: Dict) -> float:
-        """전문분야 매칭 점수"""
-        return result.get("specialization_score", result.get("payload_score", 0.0))
-    
-    def _score_experience_match(self, result: Dict) -> float:
-        """경력 매칭 점수"""
-        return result.get("experience_score", result.get("payload_score", 0.0))
-    
-    def _score_talent_level_match(self, result: Dict) -> float:
-        """인재등급 매칭 점수"""
-        return result.get("talent_level_score", result.get("payload_score", 0.0))
-    
-    def _score_skills_match(self, result: Dict) -> float:
-        """기술스택 매칭 점수"""
-        return result.get("skills_score", result.get("payload_score", 0.0))
-    
-    def apply_business_rules(self, results: List[Dict]) -> List[Dict]:
-        """비즈니스 규칙 적용"""
-        print("📊 비즈니스 규칙 적용")
-        
-        for result in results:
-            # 1. 완전 매칭 보너스
-            if self._is_perfect_match(result):
-                result["final_score"] *= 1.2
-                result["bonus_reasons"] = result.get("bonus_reasons", []) + ["완전 매칭"]
-            
-            # 2. 과도한 경력 페널티
-            if self._is_overqualified(result):
-                result["final_score"] *= 0.9
-                result["penalty_reasons"] = result.get("penalty_reasons", []) + ["과도한 경력"]
-            
-            # 3. 지역 선호도 보너스
-            if self._has_location_preference(result):
-                result["final_score"] *= 1.1
-                result["bonus_reasons"] = result.get("bonus_reasons", []) + ["지역 선호"]
-            
-            # 4. 긴급 요청 우선순위
-            if self._is_urgent_request(result):
-                result["final_score"] *= 1.15
-                result["bonus_reasons"] = result.get("bonus_reasons", []) + ["긴급 요청"]
-        
-        # 규칙 적용 후 재정렬
-        results.sort(key=lambda x: x["final_score"], reverse=True)
+    def apply_business_rules(self, results: List[Dict], top_k: Optional[int] = None) -> List[Dict]:
+        """비즈니스 규칙 적용 (top_k 지정 시 상위 top_k명만 반환)
         
-        return results
-    
-    def _is_perfect_match(self, result: Dict) -> bool:
-        """완전 매칭 여부 확인"""
-        payload_score = result.get("payload_score", 0.0)
-        vector_score = result.get("vector_score", 0.0)
+        규칙별 해당 여부 마스크를 만들어 BUSINESS_RULES 순서대로 점수에 배율을 곱한다.
+        """
+        logger.debug("📊 비즈니스 규칙 적용")
         
-        return payload_score >= 0.9 and vector_score >= 0.85
-    
-    def _is_overqualified(self, result: Dict) -> bool:
-        """과도한 경력 여부 확인"""
-        experience = result.get("experience_years", 0)
-        talent_level = result.get("talent_level", "")
+        if not results:
+            return []
         
-        # 15년 이상 경력의 고급 인재가 중급 요구사항에 지원하는 경우
-        return experience >= 15 and "중급" in str(talent_level)
-    
-    def _has_location_preference(self, result: Dict) -> bool:
-        """지역 선호도 확인"""
-        residence = result.get("residence", "")
+        masks = self._business_rule_masks(results)
+        scores = [result["final_score"] for result in results]
+        if np is not None:
+            scores = np.array(scores, dtype=np.float64)
+            applied = np.zeros(len(results), dtype=bool)
+        
+        for (reason, factor, reason_field), mask in zip(BUSINESS_RULES, masks):
+            if np is not None:
+                scores = np.where(mask, scores * factor, scores)
+                applied |= mask
+                matched = np.flatnonzero(mask).tolist()
+            else:
+                matched = [i for i, hit in enumerate(mask) if hit]
+                for i in matched:
+                    scores[i] *= factor
+            
+            for i in matched:
+                result = results[i]
+                result[reason_field] = result.get(reason_field, []) + [reason]
+        
+        # 규칙이 적용된 후보만 점수 갱신 후 재정렬
+        if np is not None:
+            for i in np.flatnonzero(applied).tolist():
+                results[i]["final_score"] = float(scores[i])
+        else:
+            for result, score in zip(results, scores):
+                result["final_score"] = score
         
-        # 서울/경기 지역 선호도
-        return residence in ["서울", "경기도"]
+        return [results[i] for i in _top_order(scores, top_k)]
     
-    def _is_urgent_request(self, result: Dict) -> bool:
-        """긴급 요청 여부 확인"""
-        # 쿼리나 결과에서 긴급 키워드 확인
-        return "긴급" in str(result.get("requirement_type", []))
+    def _business_rule_masks(self, results: List[Dict]) -> List:
+        """BUSINESS_RULES 순서의 규칙별 해당 여부 (NumPy 사용 시 bool 배열)
+        
+        1. 완전 매칭: payload_score >= 0.9 이고 vector_score >= 0.85
+        2. 과도한 경력: 15년 이상 경력의 인재가 중급 등급 (중급 요구사항 대비 고급 인재)
+        3. 지역 선호: 서울/경기 거주
+        4. 긴급 요청: 요청 유형에 긴급 포함
+        """
+        sources = [_attribute_source(result) for result in results]
+        payload_scores = [result.get("payload_score", 0.0) for result in results]
+        vector_scores = [result.get("vector_score", 0.0) for result in results]
+        experience = [source.get("experience_years", 0) for source in sources]
+        mid_level = ["중급" in str(source.get("talent_level", "")) for source in sources]
+        preferred_residence = [source.get("residence", "") in PREFERRED_RESIDENCES for source in sources]
+        # 빈 요청 유형은 문자열로 바꾸지 않음
+        urgent = [bool(value) and "긴급" in str(value) for value in (source.get("requirement_type") for source in sources)]
+        
+        if np is None:
+            return [
+                [p >= 0.9 and v >= 0.85 for p, v in zip(payload_scores, vector_scores)],
+                [e >= 15 and m for e, m in zip(experience, mid_level)],
+                preferred_residence,
+                urgent
+            ]
+        
+        return [
+            (np.array(payload_scores, dtype=np.float64) >= 0.9) & (np.array(vector_scores, dtype=np.float64) >= 0.85),
+            (np.array(experience, dtype=np.float64) >= 15) & np.array(mid_level, dtype=bool),
+            np.array(preferred_residence, dtype=bool),
+            np.array(urgent, dtype=bool)
+        ]
     
-    def diversify_results(self, results: List[Dict], diversity_factor: float = 0.1) -> List[Dict]:
-        """결과 다양성 증진"""
-        print("🎯 결과 다양성 증진")
+    def diversify_results(self, results: List[Dict], *, mmr_lambda: float = DEFAULT_MMR_LAMBDA,
+                          top_k: Optional[int] = None, diversity_factor: Optional[float] = None) -> List[Dict]:
+        """결과 다양성 증진 (탐욕적 MMR - Maximal Marginal Relevance)
+        
+        매 단계 남은 후보 중 λ × 관련도 - (1 - λ) × 중복도가 가장 큰 후보를 선택한다.
+        관련도는 final_score를 0~1로 정규화한 값, 중복도는 이미 선택된 후보 중
+        다양성 속성 값이 같은 비율의 평균으로 속성별 값 카운터에서 O(속성 수)로 계산한다.
+        후보를 점수 순으로 살피다 λ × 관련도(MMR 상한)가 현재 최댓값 이하가 되면 중단한다.
+        top_k 지정 시 표시할 상위 top_k명만 선택해 반환 (None이면 전체 재정렬).
+        
+        옵션은 키워드 인자로만 받는다 (두 번째 위치 인자였던 diversity_factor와 의미가 섞이지 않도록
+        diversify_results(results, 0.1) 같은 이전 호출은 TypeError).
+        mmr_lambda: 관련도 가중치 0~1 (범위 밖이면 ValueError - 상한 중단 조건은 1 - λ >= 0일 때만 성립)
+        diversity_factor: 사용 중단 예정 (이전 다양성 보너스 가중치).
+            지정하면 DeprecationWarning과 함께 mmr_lambda = 1 - diversity_factor (0~1로 제한)로 변환한다.
+        """
+        if diversity_factor is not None:
+            warnings.warn("diversify_results(diversity_factor=...)는 사용 중단 예정입니다. "
+                          "mmr_lambda(= 1 - diversity_factor)를 사용하세요.",
+                          DeprecationWarning, stacklevel=2)
+            mmr_lambda = min(max(1.0 - diversity_factor, 0.0), 1.0)
+        
+        if not 0 <= mmr_lambda <= 1:
+            raise ValueError(f"mmr_lambda는 0~1 사이여야 합니다: {mmr_lambda}")
+        
+        logger.debug(f"🎯 결과 다양성 증진 (λ={mmr_lambda})")
         
         if len(results) <= 1:
             return results
         
-        diversified = [results[0]]  # 최고 점수는 유지
-        
-        for candidate in results[1:]:
-            # 기존 선택된 후보들과의 다양성 계산
-            diversity_score = self._calculate_diversity(candidate, diversified)
-            
-            # 다양성 보너스 적용
-            candidate["final_score"] += diversity_score * diversity_factor
-            candidate["diversity_score"] = diversity_score
+        window = len(results) if top_k is None else max(min(top_k, len(results)), 0)
         
-        # 다양성이 적용된 점수로 재정렬
-        results[1:] = sorted(results[1:], key=lambda x: x["final_score"], reverse=True)
-        
-        return results
-    
-    def _calculate_diversity(self, candidate: Dict, selected: List[Dict]) -> float:
-        """다양성 점수 계산"""
-        diversity_factors = ["specialization", "residence", "industry_domain", "talent_level"]
+        scores = [result["final_score"] for result in results]
+        high, low = max(scores), min(scores)
+        relevance = [(score - low) / (high - low) if high > low else 1.0 for score in scores]
+        values = {}  # 살펴본 후보의 다양성 속성 값 (상한으로 중단되면 나머지는 읽지 않음)
         
-        diversity_score = 0.0
+        counters = [{} for _ in DIVERSITY_FACTORS]
+        # 점수 내림차순 (동점은 입력 순서) - 동점 MMR은 앞선 후보 선택
+        remaining = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+        diversified = []
         
-        for factor in diversity_factors:
-            candidate_value = candidate.get(factor)
+        while len(diversified) < window:
+            best_position, best_mmr, best_redundancy = 0, -math.inf, 0.0
             
-            # 선택된 후보들과 다른 값일 때 다양성 점수 증가
-            different_count = sum(1 for s in selected if s.get(factor) != candidate_value)
+            for position, i in enumerate(remaining):
+                if mmr_lambda * relevance[i] <= best_mmr:
+                    break  # 중복도 0이어도 더 나을 수 없음 (이후 후보는 관련도가 같거나 낮음)
+                
+                if i not in values:
+                    values[i] = self._diversity_values(results[i])
+                
+                if diversified:
+                    shared = 0
+                    for counter, value in zip(counters, values[i]):
+                        shared += counter.get(value, 0)
+                    redundancy = shared / (len(DIVERSITY_FACTORS) * len(diversified))
+                else:
+                    redundancy = 0.0
+                
+                mmr = mmr_lambda * relevance[i] - (1 - mmr_lambda) * redundancy
+                if mmr > best_mmr:
+                    best_position, best_mmr, best_redundancy = position, mmr, redundancy
             
-            if different_count > 0:
-                diversity_score += different_count / len(selected)
+            chosen = remaining.pop(best_position)
+            for counter, value in zip(counters, values[chosen]):
+                counter[value] = counter.get(value, 0) + 1
+            
+            results[chosen]["diversity_score"] = 1.0 - best_redundancy
+            diversified.append(results[chosen])
         
-        return diversity_score / len(diversity_factors)
+        return diversified
+    
+    @staticmethod
+    def _diversity_values(result: Dict) -> Tuple:
+        """다양성 속성 값 (카운터 키로 쓰도록 목록 값은 튜플로 변환)"""
+        get = _attribute_source(result).get
+        return tuple(tuple(value) if isinstance(value, list) else value
+                     for value in (get(factor) for factor in DIVERSITY_FACTORS))
     
     def explain_ranking(self, result: Dict, weights: Dict) -> Dict:
         """순위 결정 이유 설명"""
@@ -324,8 +517,8 @@ class ReRanker:
         vector_score = result.get("vector_score", 0.0)
         explanation["score_breakdown"]["vector_fields"] = {
             "raw_score": round(vector_score, 3),
-            "weight": 0.4,
-            "weighted_score": round(vector_score * 0.4, 3)
+            "weight": VECTOR_FIELDS_WEIGHT,
+            "weighted_score": round(vector_score * VECTOR_FIELDS_WEIGHT, 3)
         }
         
         # 주요 강점 식별
@@ -0,0 +1,70 @@
+"""
+검색 결과 캐시 모듈
+정규화된 파싱 결과 + 인재 데이터 버전 + 파서 모드 + 후보 수 설정 기준 전체 검색 결과 캐시
+"""
+
+import copy
+import hashlib
+import json
+from typing import Dict, Optional
+
+from parse_cache import LRUTTLCache
+
+# 기본 캐시 설정
+DEFAULT_RESULT_CACHE_SIZE = 256
+DEFAULT_RESULT_CACHE_TTL = 300  # 초
+
+# 순서가 의미 없는 목록 필드 (파싱 시 set으로 만들어져 순서가 달라질 수 있음)
+_UNORDERED_FIELDS = ("skills",)
+
+def canonical_parsed_query(parsed_query: Dict) -> str:
+    """파싱 결과의 정규 문자열 표현 (키 정렬, 순서 무관 목록 정렬)"""
+    canonical = dict(parsed_query)
+    for field in _UNORDERED_FIELDS:
+        if isinstance(canonical.get(field), list):
+            canonical[field] = sorted(canonical[field])
+    return json.dumps(canonical, sort_keys=True, ensure_ascii=False, default=str)
+
+class ResultCache(LRUTTLCache):
+    """search_talents_chatbot 전체 결과 캐시
+    
+    키에 데이터 버전이 포함되어 인재 데이터가 바뀌면 이전 결과는 더 이상 조회되지 않고,
+    attach()로 데이터베이스 변경 알림을 받으면 저장된 결과도 즉시 비운다.
+    """
+    
+    def __init__(self, max_size: int = DEFAULT_RESULT_CACHE_SIZE,
+                 ttl_seconds: Optional[float] = DEFAULT_RESULT_CACHE_TTL):
+        super().__init__(max_size, ttl_seconds)
+        self._attached = set()
+    
+    def attach(self, talent_db):
+        """인재 데이터베이스 변경 시 캐시 비우기 (같은 DB는 한 번만 등록)"""
+        if id(talent_db) in self._attached or not hasattr(talent_db, "add_change_listener"):
+            return
+        self._attached.add(id(talent_db))
+        talent_db.add_change_listener(lambda changed_ids: self.clear())
+    
+    @staticmethod
+    def make_key(parsed_query: Dict, data_version, parser_mode: str, budget: Dict) -> str:
+        """캐시 키 (파싱 결과/데이터 버전/파서 모드/후보 수 설정의 해시)"""
+        raw = "\0".join([
+            canonical_parsed_query(parsed_query),
+            str(data_version),
+            parser_mode,
+            json.dumps(budget, sort_keys=True, default=str)
+        ])
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def seed_for(key: str) -> int:
+        """캐시 키에서 응답 템플릿 선택용 시드 (캐시 적중 여부와 무관하게 같은 문구)"""
+        return int(key[:16], 16)
+    
+    def get_result(self, key: str) -> Optional[Dict]:
+        """캐시된 결과 (최상위 dict만 복사 - 하위 값은 공유되므로 읽기 전용으로 사용)"""
+        cached = self.get(key)
+        return dict(cached) if cached is not None else None
+    
+    def put_result(self, key: str, result: Dict):
+        # 호출 측이 반환한 결과를 수정해도 캐시가 바뀌지 않도록 저장 시 깊은 복사
+        self.put(key, copy.deepcopy(result))
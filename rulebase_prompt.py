@@ -3,11 +3,13 @@
 기존 parser.py의 규칙 기반 로직을 활용하여 구현
 """
 
+import hashlib
 import json
 import re
 from typing import Dict, List, Optional
 from datetime import datetime
 import logging
+from keyword_matcher import KeywordMatcher, get_keyword_matcher
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
@@ -19,6 +21,15 @@ class RulebasePromptParser:
     def __init__(self):
         self.current_year = datetime.now().year
         self.mappings = self._init_mappings()
+        # 매핑 테이블이 바뀌면 파싱 캐시 네임스페이스도 바뀌도록 내용 해시를 버전으로 사용
+        self.mapping_version = hashlib.sha1(
+            json.dumps(self.mappings, sort_keys=True, ensure_ascii=False).encode("utf-8")
+        ).hexdigest()[:12]
+        
+        # 모든 매핑 테이블을 공용 Aho-Corasick 매처에 등록 (카테고리 이름 = 매핑 키)
+        self.matcher = get_keyword_matcher()
+        for category, table in self.mappings.items():
+            self.matcher.register(category, table)
         print("📋 Rulebase 파서 초기화 완료")
     
     def _init_mappings(self) -> Dict:
@@ -80,6 +91,37 @@ class RulebasePromptParser:
                 "보안": ["ips", "ids", "waf", "dlp", "apm", "방화벽"],
                 "웹서버": ["apache", "nginx", "tomcat", "weblogic", "jboss"],
                 "기타": ["ncrm", "가상화", "이중화", "dns", "proxy"]
+            },
+            # 벡터 필드 생성용
+            "competencies": {
+                "유지보수": ["유지보수", "maintenance", "운영", "관리"],
+                "구축": ["구축", "설치", "구현", "개발", "설계"],
+                "정기점검": ["점검", "모니터링", "감시"],
+                "트러블슈팅": ["장애", "문제해결", "troubleshooting"],
+                "시스템 운영": ["시스템 운영", "운영 경험"]
+            },
+            "scale_complexity": {
+                "대규모 시스템 경험": ["대규모", "enterprise", "글로벌", "복잡한", "이중화", "클러스터"]
+            },
+            "leadership_experience": {
+                "팀 리더십 경험": ["팀장", "리더", "매니저", "관리", "lead", "주도"]
+            },
+            "compliance_security": {
+                "보안/컴플라이언스 경험": ["보안", "컴플라이언스", "규제", "인증", "감사"]
+            },
+            # 조건 분류
+            "requirement_types": {
+                "긴급": ["긴급", "urgent", "즉시", "빨리"],
+                "장기": ["장기", "long-term", "지속", "안정"],
+                "프로젝트": ["프로젝트", "project", "구축"],
+                "운영": ["운영", "operation", "유지보수"]
+            },
+            "unknown_fields": {
+                "야간작업": ["야간", "night", "밤"],
+                "출장가능": ["출장", "travel", "이동"],
+                "상주근무": ["상주", "onsite", "현장"],
+                "외근가능": ["외근", "field", "방문"],
+                "원격근무": ["재택", "remote", "원격"]
             }
         }
     
@@ -91,33 +133,36 @@ class RulebasePromptParser:
             result = self._create_empty_result()
             text = user_input.lower()
             
+            # 모든 매핑 키워드를 한 번에 매칭
+            hits = self.matcher.find(text, list(self.mappings))
+            
             # 1. 나이 정보 추출
             age_info = self._extract_age_info(text, user_input)
             result.update(age_info)
             
             # 2. 기본 정보 추출
-            result["residence"] = self._find_best_match(text, "regions")
-            result["industry_domain"] = self._find_best_match(text, "industry_domains")
-            result["industry_knowledge"] = self._find_best_match(text, "industry_knowledge")
-            result["specialization"] = self._find_best_match(text, "specializations")
+            result["residence"] = self._find_best_match(text, "regions", hits)
+            result["industry_domain"] = self._find_best_match(text, "industry_domains", hits)
+            result["industry_knowledge"] = self._find_best_match(text, "industry_knowledge", hits)
+            result["specialization"] = self._find_best_match(text, "specializations", hits)
             
             # 3. 경력 추출
             result["experience_years"] = self._extract_experience_years(text)
             
             # 4. 인재 등급 추출
-            result["talent_level"] = self._extract_talent_levels(text)
+            result["talent_level"] = self._extract_talent_levels(text, hits)
             
             # 5. 기술 스택 추출
-            result["skills"] = self._extract_tech_skills(text)
+            result["skills"] = self._extract_tech_skills(text, hits)
             
             # 6. 벡터 필드 생성
-            result["vector_fields"] = self._generate_vector_fields(user_input, result)
+            result["vector_fields"] = self._generate_vector_fields(user_input, result, hits)
             
             # 7. 조건 분류
-            result["requirement_type"] = self._classify_requirements(text)
+            result["requirement_type"] = self._classify_requirements(text, hits)
             
             # 8. 미분류 필드
-            result["unknown_fields"] = self._extract_unknown_fields(text)
+            result["unknown_fields"] = self._extract_unknown_fields(text, hits)
             
             logger.info("✅ Rulebase 파싱 완료")
             return result
@@ -201,15 +246,16 @@ class RulebasePromptParser:
         
         return age_info
     
-    def _find_best_match(self, text: str, category: str) -> Optional[str]:
-        """텍스트에서 카테고리별 최적 매칭"""
+    def _scan(self, text: str, hits: Optional[Dict], category: str) -> List:
+        """카테고리 키워드 매칭 결과 (parse에서 미리 매칭한 hits가 없으면 새로 매칭)"""
+        if hits is None:
+            hits = self.matcher.find(text, [category])
+        return hits.get(category, [])
+    
+    def _find_best_match(self, text: str, category: str, hits: Optional[Dict] = None) -> Optional[str]:
+        """텍스트에서 카테고리별 최적 매칭 (테이블 순서상 첫 번째 값)"""
         try:
-            mappings = self.mappings.get(category, {})
-            
-            for key, keywords in mappings.items():
-                for keyword in keywords:
-                    if keyword.lower() in text:
-                        return key
+            return KeywordMatcher.first_label(self._scan(text, hits, category))
         except Exception as e:
             logger.warning(f"매칭 오류 ({category}): {e}")
         
@@ -236,38 +282,27 @@ class RulebasePromptParser:
         
         return None
     
-    def _extract_talent_levels(self, text: str) -> Optional[List[str]]:
+    def _extract_talent_levels(self, text: str, hits: Optional[Dict] = None) -> Optional[List[str]]:
         """인재 등급 추출"""
         try:
-            levels = []
-            
-            for level, keywords in self.mappings["talent_levels"].items():
-                for keyword in keywords:
-                    if keyword in text:
-                        levels.append(level)
-                        break
+            levels = KeywordMatcher.labels_in_order(self._scan(text, hits, "talent_levels"))
             
             return levels if levels else None
         except Exception as e:
             logger.warning(f"인재등급 파싱 오류: {e}")
             return None
     
-    def _extract_tech_skills(self, text: str) -> Optional[List[str]]:
+    def _extract_tech_skills(self, text: str, hits: Optional[Dict] = None) -> Optional[List[str]]:
         """기술 스택 추출"""
         try:
-            skills = []
-            
-            for category, tech_list in self.mappings["tech_stacks"].items():
-                for tech in tech_list:
-                    if tech.lower() in text:
-                        skills.append(tech)
+            skills = [hit.keyword for hit in self._scan(text, hits, "tech_stacks")]
             
             return list(set(skills)) if skills else None
         except Exception as e:
             logger.warning(f"기술스택 파싱 오류: {e}")
             return None
     
-    def _generate_vector_fields(self, original_text: str, parsed_data: Dict) -> Dict:
+    def _generate_vector_fields(self, original_text: str, parsed_data: Dict, hits: Optional[Dict] = None) -> Dict:
         """벡터 필드 생성"""
         vector_fields = {
             "professional_competency": None,
@@ -280,22 +315,11 @@ class RulebasePromptParser:
         
         try:
             text = original_text.lower()
+            if hits is None:
+                hits = self.matcher.find(text, list(self.mappings))
             
             # 전문 역량
-            competencies = []
-            competency_keywords = {
-                "유지보수": ["유지보수", "maintenance", "운영", "관리"],
-                "구축": ["구축", "설치", "구현", "개발", "설계"],
-                "정기점검": ["점검", "모니터링", "감시"],
-                "트러블슈팅": ["장애", "문제해결", "troubleshooting"],
-                "시스템 운영": ["시스템 운영", "운영 경험"]
-            }
-            
-            for comp, keywords in competency_keywords.items():
-                for keyword in keywords:
-                    if keyword in text:
-                        competencies.append(comp)
-                        break
+            competencies = KeywordMatcher.labels_in_order(hits.get("competencies", []))
             
             if competencies:
                 vector_fields["professional_competency"] = ", ".join(competencies)
@@ -325,75 +349,29 @@ class RulebasePromptParser:
                     industry_spec += f", {parsed_data['industry_knowledge']} 전문성"
                 vector_fields["industry_specialization"] = industry_spec
             
-            # 규모/복잡성
-            scale_keywords = ["대규모", "enterprise", "글로벌", "복잡한", "이중화", "클러스터"]
-            for keyword in scale_keywords:
-                if keyword in text:
-                    vector_fields["scale_complexity"] = "대규모 시스템 경험"
-                    break
-            
-            # 리더십
-            leadership_keywords = ["팀장", "리더", "매니저", "관리", "lead", "주도"]
-            for keyword in leadership_keywords:
-                if keyword in text:
-                    vector_fields["leadership_experience"] = "팀 리더십 경험"
-                    break
-            
-            # 컴플라이언스/보안
-            compliance_keywords = ["보안", "컴플라이언스", "규제", "인증", "감사"]
-            for keyword in compliance_keywords:
-                if keyword in text:
-                    vector_fields["compliance_security"] = "보안/컴플라이언스 경험"
-                    break
-                    
+            # 규모/복잡성, 리더십, 컴플라이언스/보안 (키워드가 하나라도 있으면 해당 설명)
+            for field in ("scale_complexity", "leadership_experience", "compliance_security"):
+                field_hits = hits.get(field)
+                if field_hits:
+                    vector_fields[field] = KeywordMatcher.first_label(field_hits)
+        
         except Exception as e:
             logger.warning(f"벡터 필드 생성 오류: {e}")
         
         return vector_fields
     
-    def _classify_requirements(self, text: str) -> List[str]:
+    def _classify_requirements(self, text: str, hits: Optional[Dict] = None) -> List[str]:
         """요구사항 분류"""
         try:
-            requirements = []
-            
-            req_keywords = {
-                "긴급": ["긴급", "urgent", "즉시", "빨리"],
-                "장기": ["장기", "long-term", "지속", "안정"],
-                "프로젝트": ["프로젝트", "project", "구축"],
-                "운영": ["운영", "operation", "유지보수"]
-            }
-            
-            for req_type, keywords in req_keywords.items():
-                for keyword in keywords:
-                    if keyword in text:
-                        requirements.append(req_type)
-                        break
-            
-            return requirements
+            return KeywordMatcher.labels_in_order(self._scan(text, hits, "requirement_types"))
         except Exception as e:
             logger.warning(f"요구사항 분류 오류: {e}")
             return []
     
-    def _extract_unknown_fields(self, text: str) -> List[str]:
+    def _extract_unknown_fields(self, text: str, hits: Optional[Dict] = None) -> List[str]:
         """미분류 필드 추출"""
         try:
-            unknown_fields = []
-            
-            unknown_keywords = {
-                "야간작업": ["야간", "night", "밤"],
-                "출장가능": ["출장", "travel", "이동"],
-                "상주근무": ["상주", "onsite", "현장"],
-                "외근가능": ["외근", "field", "방문"],
-                "원격근무": ["재택", "remote", "원격"]
-            }
-            
-            for field, keywords in unknown_keywords.items():
-                for keyword in keywords:
-                    if keyword in text:
-                        unknown_fields.append(field)
-                        break
-            
-            return unknown_fields
+            return KeywordMatcher.labels_in_order(self._scan(text, hits, "unknown_fields"))
         except Exception as e:
             logger.warning(f"미분류 필드 추출 오류: {e}")
             return []
\ No newline at end of file
@@ -0,0 +1,114 @@
+"""
+검색 점수 레코드 모듈
+인재 dict를 복사하지 않고 참조 + 단계별 점수만 담아 파이프라인에 전달
+"""
+
+import heapq
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+# 파이프라인 단계가 기록하는 점수/순위 필드
+SCORE_FIELDS = (
+    "payload_score",
+    "vector_score",
+    "combined_score",
+    "final_score",
+    "final_rank",
+    "ranking_algorithm",
+    "diversity_score",
+    "bonus_reasons",
+    "penalty_reasons"
+)
+
+def select_top(items: List, top_k: Optional[int], key: Callable) -> List:
+    """점수 내림차순 상위 top_k 선택 (top_k가 None이면 전체 정렬)
+    
+    동점은 입력 순서를 유지하므로 sorted(..., reverse=True)[:top_k]와 결과가 같다.
+    """
+    if top_k is None or top_k >= len(items):
+        items.sort(key=key, reverse=True)
+        return items
+    
+    return heapq.nlargest(max(top_k, 0), items, key=key)
+
+class ScoredTalent:
+    """인재 참조와 점수 필드만 가진 경량 레코드 (dict 읽기 인터페이스 호환)"""
+    
+    __slots__ = ("talent", "extras") + SCORE_FIELDS
+    
+    def __init__(self, talent: Dict, payload_score: Optional[float] = None):
+        self.talent = talent  # 원본 인재 dict (읽기 전용으로 취급)
+        self.extras = None    # 점수 필드 외 단계별 임시 값
+        
+        for field in SCORE_FIELDS:
+            setattr(self, field, None)
+        self.payload_score = payload_score
+    
+    @classmethod
+    def wrap(cls, candidate) -> "ScoredTalent":
+        """dict 후보는 레코드로 감싸고, 이미 레코드면 그대로 반환"""
+        if isinstance(candidate, ScoredTalent):
+            return candidate
+        return cls(candidate, candidate.get("payload_score"))
+    
+    def get(self, key: str, default: Any = None) -> Any:
+        """점수 필드 → 추가 값 → 원본 인재 dict 순으로 조회"""
+        if key in SCORE_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.extras and key in self.extras:
+            return self.extras[key]
+        return self.talent.get(key, default)
+    
+    def __getitem__(self, key: str) -> Any:
+        if key in SCORE_FIELDS:
+            value = getattr(self, key)
+            if value is not None:
+                return value
+        elif self.extras and key in self.extras:
+            return self.extras[key]
+        return self.talent[key]
+    
+    def __setitem__(self, key: str, value: Any):
+        if key in SCORE_FIELDS:
+            setattr(self, key, value)
+        else:
+            if self.extras is None:
+                self.extras = {}
+            self.extras[key] = value
+    
+    def __contains__(self, key: str) -> bool:
+        if key in SCORE_FIELDS and getattr(self, key) is not None:
+            return True
+        if self.extras and key in self.extras:
+            return True
+        return key in self.talent
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.to_dict())
+    
+    def copy(self) -> "ScoredTalent":
+        """같은 인재를 참조하는 레코드 복사본"""
+        record = ScoredTalent(self.talent)
+        for field in SCORE_FIELDS:
+            setattr(record, field, getattr(self, field))
+        if self.extras:
+            record.extras = dict(self.extras)
+        return record
+    
+    def to_dict(self) -> Dict:
+        """응답 렌더링용 전체 dict 생성 (원본 인재 정보 + 점수 필드)"""
+        materialized = dict(self.talent)
+        
+        for field in SCORE_FIELDS:
+            value = getattr(self, field)
+            if value is not None:
+                materialized[field] = value
+        if self.extras:
+            materialized.update(self.extras)
+        
+        return materialized
+    
+    def __repr__(self) -> str:
+        return (f"ScoredTalent(id={self.talent.get('id')!r}, "
+                f"payload_score={self.payload_score}, final_score={self.final_score})")
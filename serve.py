@@ -0,0 +1,120 @@
+"""
+운영 서버 진입점 - gunicorn pre-fork 멀티 워커
+마스터 프로세스에서 검색 시스템과 색인을 한 번만 만든 뒤 gc.freeze() 후 워커를 fork해
+인재 데이터/컬럼/벡터 행렬/ANN 색인 메모리를 copy-on-write로 공유
+
+사용 예:
+    python serve.py --bind 0.0.0.0:5000
+    WEB_CONCURRENCY=8 python serve.py --threads 2
+    TALENT_SNAPSHOT_PATH=snapshots/talents python serve.py   # 스냅샷에서 색인 복원 후 fork
+    TALENT_SNAPSHOT_PATH=snapshots/talents TALENT_SNAPSHOT_SOURCE=talents.jsonl python serve.py
+        # 스냅샷을 쓸 수 없으면(형식 버전 변경/손상) 원본 파일로 재구성, 원본이 없으면 시작 실패
+
+워커 수 산정:
+    - 검색은 파싱/NumPy 점수 계산 위주의 CPU 작업이라 기본값은 사용 가능한 코어당 워커 1개
+      (gunicorn 일반 권장값 2×코어+1은 I/O 대기가 많은 앱 기준이라 여기서는 코어 경쟁만 늘어남)
+    - BLAS 스레드는 워커당 1개로 고정 (워커 수 × BLAS 스레드가 코어 수를 넘지 않도록)
+    - 외부 API 호출 등 I/O 대기가 생기면 --threads로 워커당 스레드를 늘리고 워커 수는 유지
+    - 메모리: 공유 색인은 한 벌, 워커별로는 파싱/결과 캐시와 요청 처리 중 새로 만든 객체만 추가
+      → 워커 수 × (캐시 크기 + 요청당 작업 메모리) + 색인 크기가 가용 메모리 안에 들어오도록 조정
+    - 캐시와 파서 전환(/api/switch_parser)은 워커별로 적용됨
+    - /api/metrics 지표도 워커별: 응답한 워커 한 곳의 값만 담기며 모든 시계열에 pid 라벨이 붙음
+      (fork 직후 초기화). 전체 합계는 워커마다 수집하거나 Prometheus에서 sum without (pid)로 집계
+"""
+
+import os
+
+# 워커마다 BLAS 스레드 풀을 만들면 코어를 두고 경쟁하므로 NumPy import 전에 1개로 제한
+for _variable in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS"):
+    os.environ.setdefault(_variable, "1")
+
+import argparse
+import gc
+from typing import Iterable, Optional
+
+DEFAULT_BIND = "0.0.0.0:5000"
+DEFAULT_THREADS = 1
+DEFAULT_TIMEOUT = 60  # 초 (일괄 검색 요청 고려)
+
+def available_cores() -> int:
+    """현재 프로세스가 쓸 수 있는 CPU 코어 수 (컨테이너/affinity 제한 반영)"""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+def default_worker_count(cores: Optional[int] = None) -> int:
+    """기본 워커 수 (WEB_CONCURRENCY 지정 시 우선, 아니면 코어당 1개)"""
+    if os.environ.get("WEB_CONCURRENCY"):
+        return max(1, int(os.environ["WEB_CONCURRENCY"]))
+    return max(1, cores if cores is not None else available_cores())
+
+def build_shared_system():
+    """마스터에서 검색 시스템 생성 및 사전 준비 후 GC 추적 객체 고정
+    
+    gc.freeze() 이후 기존 객체는 GC가 순회하지 않아 워커에서 참조 카운트 외에는
+    페이지를 건드리지 않으므로 fork 후에도 공유 상태가 유지된다.
+    """
+    import main as app_module
+    
+    if app_module.talent_system is None:
+        raise RuntimeError("검색 시스템 초기화 실패 - 운영 서버를 시작할 수 없습니다")
+    
+    app_module.talent_system.warm_up()
+    
+    gc.collect()
+    gc.freeze()
+    print(f"🧊 공유 객체 고정: {gc.get_freeze_count():,}개")
+    return app_module
+
+def _post_fork(server, worker):
+    """gunicorn post_fork 훅 - 워커 프로세스별 연결/난수 상태 재생성"""
+    import main as app_module
+    
+    if app_module.talent_system is not None:
+        app_module.talent_system.after_fork()
+
+def run(bind: str = DEFAULT_BIND, workers: Optional[int] = None, threads: int = DEFAULT_THREADS,
+        timeout: int = DEFAULT_TIMEOUT):
+    """gunicorn 마스터 실행 (현재 프로세스가 마스터, 워커는 여기서 fork)"""
+    try:
+        from gunicorn.app.base import BaseApplication
+    except ImportError:
+        raise RuntimeError("운영 서버 실행에는 gunicorn 패키지가 필요합니다 (pip install gunicorn)")
+    
+    app_module = build_shared_system()
+    options = {
+        "bind": bind,
+        "workers": workers or default_worker_count(),
+        "threads": threads,
+        "timeout": timeout,
+        "preload_app": True,
+        "post_fork": _post_fork
+    }
+    
+    class TalentSearchApplication(BaseApplication):
+        """이미 만들어진 Flask 앱을 그대로 워커에 넘기는 gunicorn 애플리케이션"""
+        
+        def load_config(self):
+            for key, value in options.items():
+                self.cfg.set(key, value)
+        
+        def load(self):
+            return app_module.app
+    
+    print(f"🏭 운영 서버 시작: {bind} (워커 {options['workers']}개 × 스레드 {threads}개, "
+          f"코어 {available_cores()}개)")
+    TalentSearchApplication().run()
+
+def main(argv: Optional[Iterable[str]] = None):
+    parser = argparse.ArgumentParser(description="인재 검색 운영 서버 (gunicorn pre-fork)")
+    parser.add_argument("--bind", default=os.environ.get("BIND", DEFAULT_BIND), help="수신 주소")
+    parser.add_argument("--workers", type=int, help="워커 프로세스 수 (기본값: WEB_CONCURRENCY 또는 코어 수)")
+    parser.add_argument("--threads", type=int, default=DEFAULT_THREADS, help="워커당 스레드 수")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT, help="요청 처리 제한 시간 (초)")
+    args = parser.parse_args(argv)
+    
+    run(bind=args.bind, workers=args.workers, threads=args.threads, timeout=args.timeout)
+
+if __name__ == "__main__":
+    main()
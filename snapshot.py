@@ -0,0 +1,240 @@
+"""
+인덱스 스냅샷 모듈
+인재 데이터/역색인/컬럼 배열/후보자 벡터 행렬/ANN 색인/키워드 매처를 버전이 있는 바이너리 스냅샷으로 저장하고
+시작 시 NumPy 배열은 메모리 맵으로 불러와 재구성 없이 바로 서비스
+
+스냅샷 디렉터리 구성:
+    manifest.json     형식 버전, 데이터 버전, 벡터 설정 해시, 파일별 SHA-1
+    *.npy             컬럼/벡터 행렬 (np.load mmap_mode로 메모리 맵)
+    *.pickle          인재 목록, 역색인, 행 매핑, ANN 색인, 컴파일된 키워드 오토마톤
+
+pickle을 포함하므로 신뢰할 수 있는 경로의 스냅샷만 불러와야 한다.
+
+사용 예:
+    python snapshot.py snapshots/talents --load talents.jsonl
+"""
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import pickle
+import shutil
+import time
+from typing import Dict, Iterable, Optional
+
+from example.talent_data import TalentColumns, TalentDatabase
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 환경에서는 스냅샷 저장/불러오기 비활성화
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# 저장 형식 또는 벡터 계산 규칙이 바뀌면 올려서 이전 스냅샷을 무효화
+SNAPSHOT_FORMAT_VERSION = 2
+
+MANIFEST_FILE = "manifest.json"
+
+# 스냅샷 구성 부분 (talents가 무효면 전체 무효, 나머지는 해당 부분만 재구성)
+PARTS = ("talents", "columns", "vectors", "matcher")
+
+class Snapshot:
+    """불러온 스냅샷 - 검증을 통과한 부분만 채워짐"""
+    
+    def __init__(self, path: str, manifest: Dict):
+        self.path = path
+        self.manifest = manifest
+        self.talent_state = None      # TalentDatabase.export_state()
+        self.columns = None           # TalentColumns (배열은 읽기 전용 메모리 맵)
+        self.vector_arrays = None     # VectorSearcher.export_snapshot() 배열 (copy-on-write 메모리 맵)
+        self.vector_meta = None
+        self.matcher_state = None     # KeywordMatcher.export_state()
+    
+    def create_talent_db(self) -> TalentDatabase:
+        return TalentDatabase.from_state(self.talent_state, self.columns)
+
+def _file_checksum(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def _write_arrays(directory: str, part: str, arrays: Dict[str, "np.ndarray"], files: Dict):
+    for name, array in arrays.items():
+        filename = f"{part}.{name}.npy"
+        np.save(os.path.join(directory, filename), np.ascontiguousarray(array))
+        files[filename] = _file_checksum(os.path.join(directory, filename))
+
+def _write_pickle(directory: str, part: str, obj, files: Dict):
+    filename = f"{part}.pickle"
+    with open(os.path.join(directory, filename), "wb") as f:
+        pickle.dump(obj, f, protocol=pickle.HIGHEST_PROTOCOL)
+    files[filename] = _file_checksum(os.path.join(directory, filename))
+
+def _read_arrays(directory: str, part: str, files: Dict, mmap_mode: str) -> Dict[str, "np.ndarray"]:
+    prefix = f"{part}."
+    return {
+        filename[len(prefix):-len(".npy")]: np.load(os.path.join(directory, filename), mmap_mode=mmap_mode)
+        for filename in files if filename.endswith(".npy")
+    }
+
+def _read_pickle(directory: str, part: str):
+    with open(os.path.join(directory, f"{part}.pickle"), "rb") as f:
+        return pickle.load(f)
+
+def save_snapshot(path: str, talent_db: TalentDatabase, vector_searcher=None, matcher=None) -> Dict:
+    """스냅샷 저장 (임시 디렉터리에 쓴 뒤 교체해 읽는 쪽이 중간 상태를 보지 않음)
+    
+    vector_searcher/matcher가 없으면 해당 부분은 저장하지 않고 불러올 때 다시 만든다.
+    """
+    if np is None:
+        raise RuntimeError("스냅샷 저장에는 NumPy가 필요합니다")
+    if talent_db.is_disk_backed:
+        raise RuntimeError("디스크 기반 인재 데이터베이스는 스냅샷을 지원하지 않습니다")
+    
+    started = time.perf_counter()
+    path = os.path.abspath(path)
+    temp_path = f"{path}.tmp-{os.getpid()}"
+    shutil.rmtree(temp_path, ignore_errors=True)
+    os.makedirs(temp_path)
+    
+    parts = {}
+    try:
+        parts["talents"] = {}
+        _write_pickle(temp_path, "talents", talent_db.export_state(), parts["talents"])
+        
+        arrays, meta = talent_db.get_columns().export_arrays()
+        parts["columns"] = {}
+        _write_arrays(temp_path, "columns", arrays, parts["columns"])
+        _write_pickle(temp_path, "columns", meta, parts["columns"])
+        
+        vector_fingerprint = None
+        if vector_searcher is not None and vector_searcher.dense_store is not None:
+            # 아직 벡터가 없는 인재까지 계산해 저장 (불러온 뒤 추가 계산이 없도록)
+            if len(vector_searcher.dense_store) < talent_db.get_talent_count():
+                vector_searcher.precompute_candidate_vectors(talent_db.get_all_talents())
+            arrays, meta = vector_searcher.export_snapshot()
+            vector_fingerprint = meta["fingerprint"]
+            parts["vectors"] = {}
+            _write_arrays(temp_path, "vectors", arrays, parts["vectors"])
+            _write_pickle(temp_path, "vectors", meta, parts["vectors"])
+        
+        if matcher is not None:
+            parts["matcher"] = {}
+            _write_pickle(temp_path, "matcher", matcher.export_state(), parts["matcher"])
+        
+        manifest = {
+            "format_version": SNAPSHOT_FORMAT_VERSION,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "data_version": talent_db.get_data_version(),
+            "talent_count": talent_db.get_talent_count(),
+            "vector_fingerprint": vector_fingerprint,
+            "parts": parts
+        }
+        with open(os.path.join(temp_path, MANIFEST_FILE), "w", encoding="utf-8") as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+        
+        # 기존 스냅샷은 옆으로 옮긴 뒤 교체하고 삭제
+        old_path = f"{path}.old-{os.getpid()}"
+        if os.path.exists(path):
+            os.replace(path, old_path)
+        os.replace(temp_path, path)
+        shutil.rmtree(old_path, ignore_errors=True)
+    except Exception:
+        shutil.rmtree(temp_path, ignore_errors=True)
+        raise
+    
+    print(f"💾 스냅샷 저장 완료: {path} ({manifest['talent_count']}명, "
+          f"{time.perf_counter() - started:.2f}초)")
+    return manifest
+
+def snapshot_exists(path: str) -> bool:
+    return os.path.exists(os.path.join(path, MANIFEST_FILE))
+
+def _verify_part(path: str, files: Dict) -> bool:
+    for filename, checksum in files.items():
+        file_path = os.path.join(path, filename)
+        if not os.path.exists(file_path) or _file_checksum(file_path) != checksum:
+            logger.warning(f"스냅샷 파일 손상 또는 누락: {filename}")
+            return False
+    return True
+
+def load_snapshot(path: str, verify: bool = True) -> Optional[Snapshot]:
+    """스냅샷 불러오기 (없거나 형식 버전이 다르거나 인재 데이터가 손상되면 None - 재구성 필요)
+    
+    컬럼/벡터/매처 부분은 검증에 실패하면 비워 두고, 호출 측에서 해당 부분만 다시 만든다.
+    """
+    if np is None:
+        return None
+    
+    if not snapshot_exists(path):
+        return None
+    manifest_path = os.path.join(path, MANIFEST_FILE)
+    
+    started = time.perf_counter()
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            manifest = json.load(f)
+        
+        if manifest.get("format_version") != SNAPSHOT_FORMAT_VERSION:
+            logger.error(f"스냅샷 형식 버전 불일치: {manifest.get('format_version')} "
+                         f"(현재 {SNAPSHOT_FORMAT_VERSION}) - 재구성합니다")
+            return None
+        
+        parts = manifest.get("parts", {})
+        valid = {part: part in parts and (not verify or _verify_part(path, parts[part])) for part in PARTS}
+        if not valid["talents"]:
+            logger.error("스냅샷 인재 데이터 검증 실패 - 재구성합니다")
+            return None
+        
+        snapshot = Snapshot(path, manifest)
+        snapshot.talent_state = _read_pickle(path, "talents")
+        if snapshot.talent_state.get("data_version") != manifest.get("data_version"):
+            logger.error("스냅샷 데이터 버전 불일치 - 재구성합니다")
+            return None
+        
+        if valid["columns"]:
+            snapshot.columns = TalentColumns.from_arrays(
+                _read_arrays(path, "columns", parts["columns"], mmap_mode="r"), _read_pickle(path, "columns")
+            )
+        if valid["vectors"]:
+            # 행 추가/수정 시 스냅샷 파일이 바뀌지 않도록 copy-on-write 맵
+            snapshot.vector_arrays = _read_arrays(path, "vectors", parts["vectors"], mmap_mode="c")
+            snapshot.vector_meta = _read_pickle(path, "vectors")
+        if valid["matcher"]:
+            snapshot.matcher_state = _read_pickle(path, "matcher")
+    except (OSError, ValueError, KeyError, pickle.UnpicklingError, EOFError) as e:
+        logger.error(f"스냅샷 불러오기 오류: {e} - 재구성합니다")
+        return None
+    
+    print(f"💾 스냅샷 불러오기 완료: {path} ({manifest['talent_count']}명, "
+          f"{time.perf_counter() - started:.2f}초)")
+    return snapshot
+
+def main(argv: Optional[Iterable[str]] = None):
+    parser = argparse.ArgumentParser(description="인재 검색 인덱스 스냅샷 생성")
+    parser.add_argument("path", help="스냅샷 디렉터리")
+    parser.add_argument("--load", nargs="*", default=[], help="스냅샷에 포함할 JSONL/CSV 인재 파일")
+    parser.add_argument("--no-seed", action="store_true", help="시나리오 데이터 시드 생략")
+    parser.add_argument("--ann", action="store_true", help="ANN 색인까지 생성해 저장")
+    args = parser.parse_args(argv)
+    
+    logging.basicConfig(level=logging.INFO)
+    
+    from main import TalentSearchSystem
+    
+    talent_db = TalentDatabase(seed_scenario_data=not args.no_seed)
+    for path in args.load:
+        talent_db.bulk_load(path)
+    
+    system = TalentSearchSystem(talent_db=talent_db)
+    if args.ann:
+        system.vector_searcher.build_ann_index()
+    system.save_snapshot(args.path)
+
+if __name__ == "__main__":
+    main()
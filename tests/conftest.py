@@ -0,0 +1,38 @@
+"""
+테스트 공통 fixture
+합성 인재 데이터와 파서는 세션 단위로 한 번만 생성 (테스트에서 변경하지 않음)
+"""
+
+import logging
+
+import pytest
+
+from example.synthetic_talents import generate_queries, iter_synthetic_talents
+from example.talent_data import TalentDatabase
+from rulebase_prompt import RulebasePromptParser
+
+SYNTHETIC_SIZE = 1500
+SYNTHETIC_SEED = 7
+
+# 파서의 질의별 INFO 로그 생략
+logging.getLogger("rulebase_prompt").setLevel(logging.WARNING)
+
+@pytest.fixture(scope="session")
+def parser():
+    return RulebasePromptParser()
+
+@pytest.fixture(scope="session")
+def synthetic_db():
+    """합성 인재 DB (시나리오 데이터 없이, 읽기 전용으로 사용)"""
+    talent_db = TalentDatabase(seed_scenario_data=False)
+    talent_db.add_talents(iter_synthetic_talents(SYNTHETIC_SIZE, SYNTHETIC_SEED))
+    return talent_db
+
+@pytest.fixture(scope="session")
+def synthetic_queries(parser):
+    """합성 질의 파싱 결과"""
+    return [parser.parse(query) for query in generate_queries(40, SYNTHETIC_SEED)]
+
+def ranked(results):
+    """검색 결과 비교용 (인재 id, 점수) 목록"""
+    return [(result["id"], result["payload_score"]) for result in results]
@@ -0,0 +1,74 @@
+"""
+검색 API 요청 검증 테스트
+top_k / candidate_budget 형식과 범위가 잘못되면 500 대신 400과 오류 메시지를 반환하는지
+"""
+
+import pytest
+
+from main import MAX_TOP_K, app
+
+QUERY = "금융 인프라 NE 화웨이 네트워크 유지보수 3년 이상"
+
+INVALID_OPTIONS = [
+    {"top_k": "10"},
+    {"top_k": 0},
+    {"top_k": -3},
+    {"top_k": 2.5},
+    {"top_k": True},
+    {"top_k": MAX_TOP_K + 1},
+    {"candidate_budget": [500, 100]},
+    {"candidate_budget": "500"},
+    {"candidate_budget": {"unknown": 10}},
+    {"candidate_budget": {"payload": -1}},
+    {"candidate_budget": {"payload": 0}},
+    {"candidate_budget": {"vector": "100"}},
+    {"candidate_budget": {"rerank": 1.5}},
+    {"candidate_budget": {"semantic": -1}}
+]
+
+VALID_OPTIONS = [
+    {},
+    {"top_k": 5},
+    {"top_k": None},
+    {"candidate_budget": {"payload": 50, "vector": 20, "rerank": 5}},
+    {"candidate_budget": {"payload": None, "semantic": 0}}
+]
+
+@pytest.fixture(scope="module")
+def client():
+    return app.test_client()
+
+@pytest.mark.parametrize("options", INVALID_OPTIONS)
+def test_search_rejects_invalid_options(client, options):
+    response = client.post("/api/search", json={"query": QUERY, **options})
+    
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body["success"] is False
+    assert next(iter(options)) in body["error"]
+    assert body["chatbot_response"]["response_type"] == "error"
+
+@pytest.mark.parametrize("options", INVALID_OPTIONS)
+def test_batch_search_rejects_invalid_options(client, options):
+    response = client.post("/api/search/batch", json={"queries": [QUERY], **options})
+    
+    assert response.status_code == 400
+    body = response.get_json()
+    assert body["success"] is False
+    assert next(iter(options)) in body["error"]
+
+@pytest.mark.parametrize("options", VALID_OPTIONS)
+def test_search_accepts_valid_options(client, options):
+    response = client.post("/api/search", json={"query": QUERY, **options})
+    
+    assert response.status_code == 200
+    assert response.get_json()["success"] is True
+    
+    response = client.post("/api/search/batch", json={"queries": [QUERY, "서울 DBA"], **options})
+    assert response.status_code == 200
+    assert response.get_json()["count"] == 2
+
+def test_top_k_limits_recommendations(client):
+    response = client.post("/api/search", json={"query": QUERY, "top_k": 2})
+    
+    assert len(response.get_json()["recommendations"]) <= 2
@@ -0,0 +1,76 @@
+"""
+키워드 매처 테스트
+Aho-Corasick 매칭이 키워드별 문자열 검색과 같은 결과를 내는지, 파싱 결과가 기존 순차 검색 파서와 같은지
+"""
+
+import json
+import os
+
+import pytest
+
+from keyword_matcher import KeywordHit, KeywordMatcher
+
+# 매처 도입 전 파서(키워드별 순차 문자열 검색)로 만든 파싱 결과 (skills는 순서 없는 집합이라 정렬해 저장)
+GOLDEN_PATH = os.path.join(os.path.dirname(__file__), "data", "rulebase_parse_golden.jsonl")
+
+@pytest.fixture(scope="module")
+def golden():
+    with open(GOLDEN_PATH, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+def _scan(tables, text):
+    """키워드마다 str.find로 첫 위치를 찾는 기준 구현"""
+    hits = set()
+    for category, table in tables.items():
+        for label_rank, (label, keywords) in enumerate(table.items()):
+            for keyword_rank, keyword in enumerate(keywords):
+                keyword = keyword.lower()
+                start = text.find(keyword) if keyword else -1
+                if start >= 0:
+                    hits.add(KeywordHit(category, label, keyword, start, label_rank, keyword_rank))
+    return hits
+
+def test_parser_matches_sequential_scan(parser, golden):
+    for case in golden:
+        parsed = parser.parse(case["query"])
+        if parsed.get("skills"):
+            parsed["skills"] = sorted(parsed["skills"])
+        assert parsed == case["parsed"], case["query"]
+
+def test_matcher_hits_match_str_find(parser, golden):
+    tables = parser.mappings
+    texts = [case["query"].lower() for case in golden] + ["네트워크네트워크 ne ne", "aaaa", "javascript java"]
+    
+    for text in texts:
+        hits = parser.matcher.find(text, list(tables))
+        found = {hit for category_hits in hits.values() for hit in category_hits}
+        assert found == _scan(tables, text), text
+        
+        # 카테고리별 결과는 위치 순
+        for category_hits in hits.values():
+            starts = [hit.start for hit in category_hits]
+            assert starts == sorted(starts)
+
+def test_overlapping_keywords_and_categories():
+    tables = {
+        "tech": {"java": ["java", "자바"], "javascript": ["javascript", "js"], "script": ["script"]},
+        "role": {"dev": ["java", "개발"]}
+    }
+    matcher = KeywordMatcher()
+    for category, table in tables.items():
+        matcher.register(category, table)
+    
+    for text in ["javascript 개발자", "자바java js", "scriptjavascript", "", "없음"]:
+        hits = matcher.find(text)
+        found = {hit for category_hits in hits.values() for hit in category_hits}
+        assert found == _scan(tables, text), text
+    
+    assert set(matcher.find("javascript", ["role"])) == {"role"}
+
+def test_register_replaces_table():
+    matcher = KeywordMatcher()
+    matcher.register("tech", {"java": ["java"]})
+    assert matcher.find("java go")["tech"][0].label == "java"
+    
+    matcher.register("tech", {"go": ["go"]})
+    assert [hit.label for hit in matcher.find("java go")["tech"]] == ["go"]
@@ -0,0 +1,52 @@
+"""
+검색 지표 테스트
+워커별 저장소 구분용 pid 라벨, fork 후 초기화
+"""
+
+import os
+
+from example.talent_data import TalentDatabase
+from main import TalentSearchSystem
+from metrics import MetricsRegistry
+
+QUERY = "금융 인프라 NE 화웨이 네트워크 유지보수 3년 이상"
+
+def _samples(text):
+    return [line for line in text.splitlines() if line and not line.startswith("#")]
+
+def test_every_sample_has_pid_label(monkeypatch):
+    registry = MetricsRegistry()
+    registry.observe("stage_duration_seconds", 0.01, stage="parse")
+    registry.inc("requests_total", status="success", result_cache="miss")
+    registry.add_collector("cache", lambda: [("cache_size", "gauge", "캐시 크기", [({"cache": "parse"}, 3)])])
+    
+    samples = _samples(registry.render_prometheus())
+    assert samples and all(f'pid="{os.getpid()}"' in line for line in samples)
+    assert 'talent_search_requests_total{pid="%d",result_cache="miss",status="success"} 1' % os.getpid() in samples
+    
+    # pid는 출력 시점 값 (fork된 워커는 자기 pid로 출력)
+    monkeypatch.setattr(os, "getpid", lambda: 4242)
+    assert all('pid="4242"' in line for line in _samples(registry.render_prometheus()))
+    
+    assert 'pid=' not in MetricsRegistry(pid_label=False).render_prometheus()
+
+def test_reset_keeps_registered_metrics():
+    registry = MetricsRegistry()
+    registry.observe("candidates", 10, stage="payload")
+    registry.inc("requests_total", status="success")
+    
+    registry.reset()
+    text = registry.render_prometheus()
+    assert not _samples(text)
+    assert "# TYPE talent_search_requests_total counter" in text
+    
+    registry.inc("requests_total", status="success")
+    assert len(_samples(registry.render_prometheus())) == 1
+
+def test_after_fork_clears_master_metrics():
+    system = TalentSearchSystem(talent_db=TalentDatabase(), metrics=MetricsRegistry(pid_label=False))
+    system.search_talents_chatbot(QUERY)
+    assert "talent_search_requests_total{" in system.metrics.render_prometheus()
+    
+    system.after_fork()
+    assert "talent_search_requests_total{" not in system.metrics.render_prometheus()
@@ -0,0 +1,145 @@
+"""
+Payload 검색 테스트
+역색인 후보 생성이 순위 결과를 바꾸지 않는지 (전체 인재 점수 계산과 비교)
+"""
+
+import pytest
+
+import payload_search
+from example.talent_data import TalentDatabase
+from payload_search import PayloadSearcher
+from tests.conftest import ranked
+
+# 조건에 맞는 posting이 없어 부분 점수 후보만 있는 질의 (역색인만 쓰면 결과가 비던 질의)
+PARTIAL_MATCH_QUERIES = [
+    "개발자",
+    "부산 클라우드 aws 3년",
+    "프로젝트 매니저 PM 15년 이상 특급",
+    "데이터베이스 관리자 oracle mysql 대전",
+    "대구 50대 경영 컨설팅 특급 20년 이상"
+]
+
+@pytest.fixture(scope="module")
+def scenario_db():
+    return TalentDatabase()
+
+def _searchers(talent_db):
+    """역색인 사용 여부 × 벡터화 여부 조합의 검색기"""
+    return {
+        (use_index, use_vectorized): PayloadSearcher(use_inverted_index=use_index, use_vectorized=use_vectorized,
+                                                     talent_db=talent_db)
+        for use_index in (True, False)
+        for use_vectorized in (True, False)
+    }
+
+@pytest.mark.parametrize("top_k", [10, 200, None])
+def test_inverted_index_keeps_ranked_output(synthetic_db, synthetic_queries, top_k):
+    searchers = _searchers(synthetic_db)
+    baseline = searchers[(False, False)]
+    
+    for parsed_query in synthetic_queries:
+        expected = ranked(baseline.search(parsed_query, top_k))
+        indexed = searchers[(True, False)].search(parsed_query, top_k)
+        assert ranked(indexed) == expected
+        
+        for use_index in (True, False):
+            vectorized = ranked(searchers[(use_index, True)].search(parsed_query, top_k))
+            assert [talent_id for talent_id, _ in vectorized] == [talent_id for talent_id, _ in expected]
+            assert [score for _, score in vectorized] == pytest.approx([score for _, score in expected])
+
+def test_inverted_index_is_used_when_exact(synthetic_db, synthetic_queries):
+    searcher = PayloadSearcher(use_vectorized=False, talent_db=synthetic_db)
+    used = 0
+    for parsed_query in synthetic_queries:
+        searcher.search(parsed_query, top_k=10)
+        stats = searcher.last_search_stats
+        used += stats["index_used"] and not stats.get("index_fallback", False)
+    
+    # 상위 10명은 대부분 역색인 후보만으로 결정됨
+    assert used > len(synthetic_queries) // 2
+
+def test_inverted_index_is_used_on_vectorized_path(synthetic_db, synthetic_queries):
+    per_talent = PayloadSearcher(use_vectorized=False, talent_db=synthetic_db)
+    vectorized = PayloadSearcher(talent_db=synthetic_db)
+    
+    for parsed_query in synthetic_queries:
+        expected = ranked(per_talent.search(parsed_query, top_k=10))
+        expected_stats = per_talent.last_search_stats
+        results = ranked(vectorized.search(parsed_query, top_k=10))
+        stats = vectorized.last_search_stats
+        
+        # 컬럼 경로도 같은 후보만 점수 계산하고 같은 경우에 전체 계산으로 돌아감
+        assert stats["vectorized"] is True
+        for key in ("index_used", "scored", "pruned", "matched"):
+            assert stats[key] == expected_stats[key], key
+        assert stats.get("index_fallback", False) == expected_stats.get("index_fallback", False)
+        
+        assert [talent_id for talent_id, _ in results] == [talent_id for talent_id, _ in expected]
+        assert [score for _, score in results] == pytest.approx([score for _, score in expected])
+
+@pytest.mark.parametrize("query", PARTIAL_MATCH_QUERIES)
+def test_partial_matches_survive_empty_postings(scenario_db, parser, query):
+    parsed_query = parser.parse(query)
+    searchers = _searchers(scenario_db)
+    expected = ranked(searchers[(False, False)].search(parsed_query, top_k=500))
+    
+    assert expected, "부분 점수 후보가 있어야 함"
+    for searcher in searchers.values():
+        assert [talent_id for talent_id, _ in ranked(searcher.search(parsed_query, top_k=500))] == \
+            [talent_id for talent_id, _ in expected]
+
+def test_candidate_rows_match_posting_union(synthetic_db, synthetic_queries, monkeypatch):
+    searcher = PayloadSearcher(talent_db=synthetic_db)
+    
+    for parsed_query in synthetic_queries:
+        constraints = searcher._index_constraints(parsed_query, 10)
+        if constraints is None:
+            continue
+        expected = sorted(synthetic_db.get_talent_slot(talent_id) for talent_id in searcher._candidate_ids(constraints))
+        
+        # posting ID로 찾는 경로와 컬럼 코드 마스크 경로 모두 posting 합집합과 같은 행
+        for ratio in (0, 10 ** 9):
+            monkeypatch.setattr(payload_search, "POSTING_LOOKUP_RATIO", ratio)
+            assert searcher._generate_candidate_rows(parsed_query, 10).tolist() == expected
+
+@pytest.mark.parametrize("use_vectorized", [True, False])
+def test_fallback_is_reported(scenario_db, parser, use_vectorized):
+    searcher = PayloadSearcher(use_vectorized=use_vectorized, talent_db=scenario_db)
+    searcher.search(parser.parse("대구 50대 경영 컨설팅 특급 20년 이상"), top_k=500)
+    
+    assert searcher.last_search_stats["index_fallback"] is True
+    assert searcher.last_search_stats["pruned"] == 0
+
+def _edge_case_talents():
+    """필드 누락/빈 값/목록형 산업 지식 등 경계 인재"""
+    return [
+        {"id": "EDGE_001", "name": "빈 프로필"},
+        {"id": "EDGE_002", "name": "나이만", "age": 35},
+        {"id": "EDGE_003", "name": "목록형 지식", "industry_knowledge": ["은행", "인프라"], "skills": ["Oracle", "AWS"],
+         "specialization": "DBA", "experience_years": 0, "talent_level": "고급"},
+        {"id": "EDGE_004", "name": "오버스펙", "age": 58, "residence": "경기도", "industry_domain": "공공",
+         "experience_years": 30, "talent_level": "중급", "skills": ["centos"]}
+    ]
+
+def test_vectorized_scores_match_per_talent_scores(synthetic_db, synthetic_queries, parser):
+    talent_db = TalentDatabase(seed_scenario_data=True)
+    talent_db.add_talents([dict(talent) for talent in synthetic_db.get_all_talents()[:300]] + _edge_case_talents())
+    searcher = PayloadSearcher(talent_db=talent_db)
+    assert searcher.columns is not None
+    
+    queries = synthetic_queries + [parser.parse(query) for query in PARTIAL_MATCH_QUERIES]
+    for parsed_query in queries:
+        expected = [searcher._calculate_payload_score(talent, parsed_query) for talent in searcher.talents]
+        scores = searcher._calculate_payload_scores_vectorized(parsed_query)
+        assert scores[searcher.columns.alive].tolist() == pytest.approx(expected)
+
+def test_batch_score_matrix_matches_single_query(synthetic_db, synthetic_queries):
+    searcher = PayloadSearcher(talent_db=synthetic_db)
+    matrix = searcher._calculate_payload_score_matrix(synthetic_queries)
+    
+    for parsed_query, row in zip(synthetic_queries, matrix):
+        assert row.tolist() == searcher._calculate_payload_scores_vectorized(parsed_query).tolist()
+    
+    batch = searcher.search_batch(synthetic_queries, top_k=20)
+    assert [ranked(results) for results in batch] == \
+        [ranked(searcher.search(parsed_query, top_k=20)) for parsed_query in synthetic_queries]
@@ -0,0 +1,223 @@
+"""
+재순위화 테스트
+점수 행렬 구축 시 필드별 점수 키 조회, Borda/RRF 동점 처리, MMR 다양성 순서
+"""
+
+import random
+
+import pytest
+
+import reranking
+from reranking import (DIVERSITY_FACTORS, RRF_K, VECTOR_FIELDS_WEIGHT, FieldScoreMatrix, ReRanker,
+                       _descending_ranks)
+from scored_talent import ScoredTalent
+
+WEIGHTS = {
+    "specialization": 0.4,
+    "skills": 0.3,
+    "residence": 0.3,
+    "vector_fields": {"technical_expertise": 1.0}
+}
+
+# 동점이 많은 후보 (payload 0.8 세 명, vector 0.6 두 명, skills_score 0.7 두 명)
+TIED = [
+    {"id": "A", "payload_score": 0.8, "vector_score": 0.6, "skills_score": 0.7},
+    {"id": "B", "payload_score": 0.8, "vector_score": 0.9, "skills_score": 0.7},
+    {"id": "C", "payload_score": 0.5, "vector_score": 0.6, "skills_score": 0.9},
+    {"id": "D", "payload_score": 0.8, "vector_score": 0.3, "skills_score": 0.2},
+    {"id": "E", "payload_score": 0.5, "vector_score": 0.3, "skills_score": 0.2}
+]
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """NumPy 경로와 순수 파이썬 경로 모두 확인"""
+    if request.param == "python":
+        monkeypatch.setattr(reranking, "np", None)
+    return request.param
+
+def _talent(talent_id, **fields):
+    return {"id": talent_id, "specialization": "NE", "residence": "서울", **fields}
+
+def _reference_ranks(scores):
+    """동점은 같은 순위 = 더 높은 점수를 가진 후보 수"""
+    return [sum(other > score for other in scores) for score in scores]
+
+def _reference_columns(results, weights):
+    """필드 순서 열(필드 점수 키가 없으면 payload_score) + 벡터 열과 가중치"""
+    columns = []
+    for field, weight in weights.items():
+        if field == "vector_fields":
+            continue
+        key = reranking.FIELD_SCORE_KEYS.get(field)
+        columns.append(([result.get(key, result["payload_score"]) if key else result["payload_score"]
+                         for result in results], weight))
+    columns.append(([result["vector_score"] for result in results], VECTOR_FIELDS_WEIGHT))
+    return columns
+
+def test_score_keys_read_from_extras_without_materializing(monkeypatch):
+    records = [ScoredTalent(_talent(f"T{i}"), payload_score=0.5) for i in range(3)]
+    records[0]["skills_score"] = 0.9
+    records[1]["note"] = "추가 값만 있음"
+    records[2] = ScoredTalent(_talent("T2", residence_score=0.1), payload_score=0.5)
+    dicts = [record.to_dict() for record in records]
+    
+    def fail(self):
+        raise AssertionError("to_dict() 호출")
+    monkeypatch.setattr(ScoredTalent, "to_dict", fail)
+    
+    matrix = FieldScoreMatrix(records, WEIGHTS)
+    expected = FieldScoreMatrix(dicts, WEIGHTS)
+    
+    assert matrix.payload_only == expected.payload_only == [True, False, False]
+    assert [list(row) for row in matrix.values] == [list(row) for row in expected.values] == [
+        [0.5, 0.9, 0.5],
+        [0.5, 0.5, 0.5],
+        [0.5, 0.5, 0.1]
+    ]
+    assert list(matrix.borda_scores()) == pytest.approx(list(expected.borda_scores()))
+
+@pytest.mark.parametrize("scores", [
+    [0.8, 0.8, 0.5, 0.8, 0.5],
+    [1.0, 1.0, 1.0],
+    [0.3, 0.9, 0.6, 0.9, 0.1, 0.6],
+    [0.5],
+    []
+])
+def test_descending_ranks_share_min_rank_on_ties(scores):
+    expected = _reference_ranks(scores)
+    
+    assert list(_descending_ranks(scores)) == expected
+    assert _descending_ranks(reranking.np.array(scores, dtype=reranking.np.float64)).tolist() == expected
+
+def test_tied_candidates_get_equal_fusion_scores(backend):
+    matrix = FieldScoreMatrix([dict(result) for result in TIED], WEIGHTS)
+    columns = _reference_columns(TIED, WEIGHTS)
+    n = len(TIED)
+    
+    borda = [sum(weight * (n - 1 - _reference_ranks(scores)[i]) for scores, weight in columns) for i in range(n)]
+    rrf = [sum(weight / (RRF_K + _reference_ranks(scores)[i] + 1) for scores, weight in columns) for i in range(n)]
+    assert list(matrix.borda_scores()) == pytest.approx(borda)
+    assert list(matrix.reciprocal_rank_scores()) == pytest.approx(rrf)
+    
+    # payload 동점 세 명은 payload 열 순위가 모두 0 (1, 2위가 아니라 공동 1위)
+    assert [list(row)[0] for row in matrix.ranks()] == [0, 0, 3, 0, 3]
+
+def test_fully_tied_candidates_keep_input_order(backend):
+    results = [{"id": f"T{i}", "payload_score": 0.7, "vector_score": 0.4} for i in range(6)]
+    matrix = FieldScoreMatrix(results, WEIGHTS)
+    
+    assert len(set(matrix.borda_scores())) == 1
+    assert len(set(matrix.reciprocal_rank_scores())) == 1
+    
+    reranker = ReRanker()
+    for algorithm in ("borda_count", "reciprocal_rank_fusion"):
+        ranked = reranker.rerank([dict(result) for result in results], WEIGHTS, algorithm=algorithm)
+        assert [result["id"] for result in ranked] == [result["id"] for result in results]
+        assert [result["final_rank"] for result in ranked] == list(range(1, 7))
+        
+        top = reranker.rerank([dict(result) for result in results], WEIGHTS, algorithm=algorithm, top_k=3)
+        assert [result["id"] for result in top] == ["T0", "T1", "T2"]
+
+@pytest.mark.parametrize("algorithm", ["borda_count", "reciprocal_rank_fusion"])
+def test_fusion_ordering_with_ties(backend, algorithm):
+    reranker = ReRanker()
+    ranked = reranker.rerank([dict(result) for result in TIED], WEIGHTS, algorithm=algorithm)
+    
+    # 점수 내림차순, 같은 점수는 입력 순서
+    scores = [result["final_score"] for result in ranked]
+    assert scores == sorted(scores, reverse=True)
+    positions = {result["id"]: i for i, result in enumerate(TIED)}
+    for earlier, later in zip(ranked, ranked[1:]):
+        if earlier["final_score"] == later["final_score"]:
+            assert positions[earlier["id"]] < positions[later["id"]]
+    
+    # B는 payload 공동 1위 + skills 공동 2위 + vector 1위, E는 모든 열에서 최하위 동점
+    assert ranked[0]["id"] == "B" and ranked[-1]["id"] == "E"
+    
+    top = reranker.rerank([dict(result) for result in TIED], WEIGHTS, algorithm=algorithm, top_k=3)
+    assert [result["id"] for result in top] == [result["id"] for result in ranked[:3]]
+
+def _reference_mmr(results, mmr_lambda, top_k=None):
+    """조기 중단 없이 매 단계 모든 후보의 MMR을 계산하는 기준 구현 (동점은 점수 순으로 앞선 후보)"""
+    scores = [result["final_score"] for result in results]
+    high, low = max(scores), min(scores)
+    relevance = [(score - low) / (high - low) if high > low else 1.0 for score in scores]
+    remaining = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+    selected = []
+    
+    while remaining and len(selected) < (len(results) if top_k is None else top_k):
+        best, best_mmr = None, None
+        for i in remaining:
+            shared = sum(results[i].get(factor) == results[j].get(factor)
+                         for j in selected for factor in DIVERSITY_FACTORS)
+            redundancy = shared / (len(DIVERSITY_FACTORS) * len(selected)) if selected else 0.0
+            mmr = mmr_lambda * relevance[i] - (1 - mmr_lambda) * redundancy
+            if best_mmr is None or mmr > best_mmr:
+                best, best_mmr = i, mmr
+        remaining.remove(best)
+        selected.append(best)
+    return [results[i]["id"] for i in selected]
+
+@pytest.fixture
+def scored_candidates(synthetic_db):
+    rng = random.Random(11)
+    return [{**talent, "final_score": round(rng.random(), 2)} for talent in synthetic_db.get_all_talents()[:120]]
+
+@pytest.mark.parametrize("mmr_lambda", [0.0, 0.3, 0.5, 0.7, 0.9])
+def test_mmr_matches_reference_order(scored_candidates, mmr_lambda):
+    reranker = ReRanker()
+    
+    for top_k in (None, 10, 1):
+        diversified = reranker.diversify_results([dict(result) for result in scored_candidates],
+                                                 mmr_lambda=mmr_lambda, top_k=top_k)
+        assert [result["id"] for result in diversified] == _reference_mmr(scored_candidates, mmr_lambda, top_k)
+
+def test_mmr_lambda_one_keeps_score_order(scored_candidates):
+    diversified = ReRanker().diversify_results([dict(result) for result in scored_candidates], mmr_lambda=1.0)
+    
+    by_score = sorted(scored_candidates, key=lambda result: result["final_score"], reverse=True)
+    assert [result["id"] for result in diversified] == [result["id"] for result in by_score]
+
+def test_mmr_prefers_different_candidate_over_near_duplicate():
+    base = {"specialization": "NE", "residence": "서울", "industry_domain": "금융", "talent_level": "고급"}
+    results = [
+        {"id": "TOP", "final_score": 1.0, **base},
+        {"id": "DUPLICATE", "final_score": 0.95, **base},
+        {"id": "DIFFERENT", "final_score": 0.9, "specialization": "DBA", "residence": "부산",
+         "industry_domain": "공공", "talent_level": "중급"},
+        {"id": "LOW", "final_score": 0.0, **base}
+    ]
+    reranker = ReRanker()
+    
+    diversified = reranker.diversify_results([dict(result) for result in results], mmr_lambda=0.5)
+    assert [result["id"] for result in diversified] == ["TOP", "DIFFERENT", "DUPLICATE", "LOW"]
+    assert diversified[0]["diversity_score"] == 1.0 and diversified[1]["diversity_score"] == 1.0
+    assert diversified[2]["diversity_score"] == pytest.approx(0.5)
+    
+    # 관련도 위주면 점수 순 유지
+    relevant = reranker.diversify_results([dict(result) for result in results], mmr_lambda=0.99)
+    assert [result["id"] for result in relevant] == ["TOP", "DUPLICATE", "DIFFERENT", "LOW"]
+
+def test_diversity_factor_is_deprecated_alias(scored_candidates):
+    reranker = ReRanker()
+    
+    with pytest.warns(DeprecationWarning, match="diversity_factor"):
+        legacy = reranker.diversify_results([dict(result) for result in scored_candidates], diversity_factor=0.1)
+    current = reranker.diversify_results([dict(result) for result in scored_candidates], mmr_lambda=0.9)
+    
+    assert [result["id"] for result in legacy] == [result["id"] for result in current]
+    assert [result["id"] for result in legacy] == _reference_mmr(scored_candidates, 0.9)
+
+def test_diversify_options_are_keyword_only(scored_candidates):
+    reranker = ReRanker()
+    
+    # 이전 diversity_factor 위치 인자가 λ로 조용히 해석되지 않음
+    with pytest.raises(TypeError):
+        reranker.diversify_results([dict(result) for result in scored_candidates], 0.1)
+    with pytest.raises(TypeError):
+        reranker.diversify_results([dict(result) for result in scored_candidates], 0.7, 10)
+
+@pytest.mark.parametrize("mmr_lambda", [-0.1, 1.5, float("nan")])
+def test_mmr_lambda_out_of_range_is_rejected(scored_candidates, mmr_lambda):
+    with pytest.raises(ValueError, match="mmr_lambda"):
+        ReRanker().diversify_results([dict(result) for result in scored_candidates], mmr_lambda=mmr_lambda)
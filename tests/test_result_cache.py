@@ -0,0 +1,99 @@
+"""
+검색 결과 캐시 테스트
+같은 질의는 캐시 적중, 인재 추가/수정/삭제 시 즉시 무효화되어 변경이 검색 결과에 반영되는지
+"""
+
+import pytest
+
+from example.talent_data import TalentDatabase
+from main import TalentSearchSystem
+from result_cache import ResultCache
+
+QUERY = "금융 인프라 NE 화웨이 네트워크 유지보수 3년 이상"
+
+NEW_TALENT = {
+    "id": "NEW_001",
+    "name": "신규",
+    "industry_domain": "금융",
+    "industry_knowledge": "인프라",
+    "specialization": "NE",
+    "experience_years": 8,
+    "talent_level": "고급",
+    "skills": ["화웨이", "네트워크 유지보수", "시스코"],
+    "vector_fields": {
+        "professional_competency": "화웨이 네트워크 유지보수 8년",
+        "technical_expertise": "화웨이 장비 전문",
+        "industry_specialization": "금융 인프라"
+    }
+}
+
+@pytest.fixture
+def system():
+    return TalentSearchSystem(talent_db=TalentDatabase(), result_cache=ResultCache())
+
+def _recommended_ids(result):
+    return [recommendation["id"] for recommendation in result["recommendations"]]
+
+def test_repeated_query_hits_cache(system):
+    first = system.search_talents_chatbot(QUERY)
+    second = system.search_talents_chatbot(QUERY)
+    
+    assert first["success"] and second == first
+    stats = system.result_cache.stats()
+    assert stats["hits"] == 1 and stats["size"] == 1
+    
+    # 반환된 결과를 수정해도 캐시는 그대로
+    second["recommendations"] = []
+    assert _recommended_ids(system.search_talents_chatbot(QUERY)) == _recommended_ids(first)
+
+@pytest.mark.parametrize("mutate", [
+    lambda talent_db: talent_db.add_talent(dict(NEW_TALENT)),
+    lambda talent_db: talent_db.add_talents([dict(NEW_TALENT)]),
+    lambda talent_db: talent_db.update_talent("SCENARIO1_003", {**NEW_TALENT, "id": "SCENARIO1_003"}),
+    lambda talent_db: talent_db.delete_talent("SCENARIO1_001")
+], ids=["add", "add_batch", "update", "delete"])
+def test_mutation_invalidates_cache(system, mutate):
+    before = system.search_talents_chatbot(QUERY)
+    assert system.result_cache.stats()["size"] == 1
+    
+    version = system.talent_db.get_data_version()
+    assert mutate(system.talent_db)
+    assert system.talent_db.get_data_version() > version
+    assert system.result_cache.stats()["size"] == 0
+    
+    after = system.search_talents_chatbot(QUERY)
+    assert system.result_cache.stats()["hits"] == 0
+    assert _recommended_ids(after) != _recommended_ids(before)
+
+def test_added_talent_shows_up_after_invalidation(system):
+    assert "NEW_001" not in _recommended_ids(system.search_talents_chatbot(QUERY))
+    
+    system.talent_db.add_talent(dict(NEW_TALENT))
+    
+    assert "NEW_001" in _recommended_ids(system.search_talents_chatbot(QUERY))
+
+def test_failed_mutation_keeps_cache(system):
+    system.search_talents_chatbot(QUERY)
+    
+    assert not system.talent_db.delete_talent("MISSING")
+    assert not system.talent_db.add_talent({"id": "SCENARIO1_001"})
+    
+    system.search_talents_chatbot(QUERY)
+    assert system.result_cache.stats()["hits"] == 1
+
+def test_key_includes_data_version_and_ignores_skill_order():
+    parsed = {"specialization": "NE", "skills": ["화웨이", "시스코"]}
+    budget = {"payload": 500, "rerank": 20}
+    key = ResultCache.make_key(parsed, 1, "rulebase", budget)
+    
+    assert ResultCache.make_key({**parsed, "skills": ["시스코", "화웨이"]}, 1, "rulebase", budget) == key
+    assert ResultCache.make_key(parsed, 2, "rulebase", budget) != key
+    assert ResultCache.make_key(parsed, 1, "rulebase", {**budget, "rerank": 10}) != key
+
+def test_attach_registers_once():
+    talent_db = TalentDatabase()
+    cache = ResultCache()
+    cache.attach(talent_db)
+    cache.attach(talent_db)
+    
+    assert len(talent_db._change_listeners) == 1
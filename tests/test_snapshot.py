@@ -0,0 +1,109 @@
+"""
+스냅샷 테스트
+저장 → 불러오기 왕복, 파일 손상/형식 버전 불일치 처리, 쓸 수 없는 스냅샷의 시작 처리
+"""
+
+import json
+import logging
+import os
+
+import pytest
+
+from example.talent_data import TalentDatabase
+from main import TalentSearchSystem
+from payload_search import PayloadSearcher
+from snapshot import MANIFEST_FILE, SNAPSHOT_FORMAT_VERSION, load_snapshot, save_snapshot
+from tests.conftest import ranked
+from vector_search import VectorSearcher
+
+SNAPSHOT_TALENTS = 200
+
+@pytest.fixture
+def talent_db(synthetic_db):
+    talent_db = TalentDatabase(seed_scenario_data=False)
+    talent_db.add_talents([dict(talent) for talent in synthetic_db.get_all_talents()[:SNAPSHOT_TALENTS]])
+    return talent_db
+
+@pytest.fixture
+def snapshot_path(tmp_path, talent_db):
+    path = str(tmp_path / "snapshot")
+    save_snapshot(path, talent_db, VectorSearcher(talent_db=talent_db))
+    return path
+
+def _corrupt(path, filename):
+    with open(os.path.join(path, filename), "r+b") as f:
+        f.seek(-16, os.SEEK_END)
+        f.write(b"\0" * 16)
+
+def _part_file(path, part, suffix):
+    with open(os.path.join(path, MANIFEST_FILE), encoding="utf-8") as f:
+        files = json.load(f)["parts"][part]
+    return next(filename for filename in files if filename.endswith(suffix))
+
+def test_snapshot_round_trip(snapshot_path, talent_db, synthetic_queries):
+    snapshot = load_snapshot(snapshot_path)
+    assert snapshot is not None
+    assert snapshot.columns is not None and snapshot.vector_arrays is not None
+    
+    restored_db = snapshot.create_talent_db()
+    assert restored_db.get_all_talents() == talent_db.get_all_talents()
+    assert restored_db.get_data_version() == talent_db.get_data_version()
+    
+    original = PayloadSearcher(talent_db=talent_db)
+    restored = PayloadSearcher(talent_db=restored_db)
+    for parsed_query in synthetic_queries:
+        assert ranked(restored.search(parsed_query, 20)) == ranked(original.search(parsed_query, 20))
+    
+    vector_searcher = VectorSearcher(talent_db=restored_db, precompute=False)
+    assert vector_searcher.restore_snapshot(snapshot.vector_arrays, snapshot.vector_meta)
+    assert len(vector_searcher.dense_store) == SNAPSHOT_TALENTS
+
+def test_corrupted_talents_invalidate_snapshot(snapshot_path, caplog):
+    _corrupt(snapshot_path, "talents.pickle")
+    
+    with caplog.at_level(logging.ERROR, logger="snapshot"):
+        assert load_snapshot(snapshot_path) is None
+    assert any(record.levelno == logging.ERROR for record in caplog.records)
+
+def test_corrupted_part_is_dropped(snapshot_path):
+    _corrupt(snapshot_path, _part_file(snapshot_path, "columns", ".npy"))
+    
+    snapshot = load_snapshot(snapshot_path)
+    assert snapshot is not None
+    assert snapshot.columns is None
+    assert snapshot.vector_arrays is not None
+
+def test_format_version_mismatch(snapshot_path):
+    manifest_path = os.path.join(snapshot_path, MANIFEST_FILE)
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    manifest["format_version"] = SNAPSHOT_FORMAT_VERSION + 1
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+    
+    assert load_snapshot(snapshot_path) is None
+
+def test_unusable_snapshot_fails_startup(snapshot_path, monkeypatch, caplog):
+    monkeypatch.delenv("TALENT_SNAPSHOT_SOURCE", raising=False)
+    _corrupt(snapshot_path, "talents.pickle")
+    
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(RuntimeError):
+            TalentSearchSystem(snapshot_path=snapshot_path)
+    assert any(record.levelno == logging.ERROR and record.name == "main" for record in caplog.records)
+
+def test_unusable_snapshot_rebuilds_from_source(snapshot_path, talent_db, tmp_path):
+    source_path = str(tmp_path / "talents.jsonl")
+    with open(source_path, "w", encoding="utf-8") as f:
+        for talent in talent_db.get_all_talents():
+            f.write(json.dumps(talent, ensure_ascii=False) + "\n")
+    _corrupt(snapshot_path, "talents.pickle")
+    
+    system = TalentSearchSystem(snapshot_path=snapshot_path, snapshot_source=[source_path])
+    scenario_count = TalentDatabase().get_talent_count()
+    assert system.talent_db.get_talent_count() == scenario_count + SNAPSHOT_TALENTS
+    
+    # 재구성한 데이터로 스냅샷을 다시 저장
+    snapshot = load_snapshot(snapshot_path)
+    assert snapshot is not None
+    assert snapshot.manifest["talent_count"] == scenario_count + SNAPSHOT_TALENTS
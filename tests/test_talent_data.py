@@ -0,0 +1,236 @@
+"""
+인재 데이터베이스 변경 테스트
+추가/수정/삭제 시 데이터 버전, tombstone 슬롯 재사용, 컬럼 행 제자리 갱신이 검색 결과에 반영되는지
+"""
+
+import random
+import time
+
+import pytest
+
+from example.talent_data import TalentColumns, TalentDatabase
+from payload_search import PayloadSearcher
+from tests.conftest import ranked
+
+QUERY = {"specialization": "NE", "skills": ["화웨이", "시스코"], "experience_years": 3}
+
+def _new_talent(talent_id, **fields):
+    talent = {
+        "id": talent_id,
+        "name": "신규",
+        "age": 35,
+        "residence": "서울",
+        "industry_domain": "금융",
+        "industry_knowledge": "인프라",
+        "specialization": "NE",
+        "experience_years": 6,
+        "talent_level": "고급",
+        "skills": ["화웨이", "시스코"],
+        "vector_fields": {}
+    }
+    talent.update(fields)
+    return talent
+
+def _column_rows(columns):
+    """살아 있는 행을 행별 값으로 풀어 비교 (범주 코드 번호와 행 위치는 생성 순서에 따라 다를 수 있음)"""
+    vocab = {code: skill for skill, code in columns.skill_vocab.items()}
+    skills = [set() for _ in range(columns.size)]
+    count = columns.skill_count
+    for row, code, alive in zip(columns.skill_rows[:count].tolist(), columns.skill_indices[:count].tolist(),
+                                columns.skill_alive[:count].tolist()):
+        if alive:
+            skills[row].add(vocab[code])
+    
+    return [
+        (
+            columns.ids[row],
+            int(columns.age[row]),
+            int(columns.experience_years[row]),
+            tuple(column.values[column.codes[row]] for column in columns.categories.values()),
+            skills[row],
+            bool(columns.has_skills[row])
+        )
+        for row in range(columns.size)
+        if columns.alive[row]
+    ]
+
+def _pool(synthetic_db, size):
+    """합성 인재를 ID만 바꿔 size명으로 늘린 DB (컬럼 생성까지)"""
+    donors = synthetic_db.get_all_talents()
+    talent_db = TalentDatabase(seed_scenario_data=False)
+    talent_db.add_talents(dict(donors[i % len(donors)], id=f"POOL_{i:06d}") for i in range(size))
+    talent_db.get_columns()
+    return talent_db
+
+@pytest.fixture
+def talent_db():
+    return TalentDatabase()
+
+def test_data_version_bumps_on_each_write(talent_db):
+    version = talent_db.get_data_version()
+    
+    assert talent_db.add_talent(_new_talent("NEW_001"))
+    assert talent_db.get_data_version() == version + 1
+    assert talent_db.update_talent("NEW_001", {"experience_years": 10})
+    assert talent_db.get_data_version() == version + 2
+    assert talent_db.delete_talent("NEW_001")
+    assert talent_db.get_data_version() == version + 3
+    
+    # 일괄 추가는 배치당 한 번, 실패한 변경은 버전 유지
+    assert talent_db.add_talents([_new_talent("NEW_002"), _new_talent("NEW_003")]) == 2
+    assert talent_db.get_data_version() == version + 4
+    assert not talent_db.add_talent(_new_talent("NEW_002"))
+    assert not talent_db.update_talent("MISSING", {"age": 40})
+    assert not talent_db.delete_talent("MISSING")
+    assert talent_db.get_data_version() == version + 4
+
+def test_deleted_slot_is_reused(talent_db):
+    count = talent_db.get_talent_count()
+    slot = talent_db._id_index["SCENARIO1_002"]
+    
+    assert talent_db.delete_talent("SCENARIO1_002")
+    assert talent_db.talents[slot] is None
+    assert talent_db.get_talent_by_id("SCENARIO1_002") is None
+    assert talent_db.get_talent_count() == count - 1
+    assert "SCENARIO1_002" not in [talent["id"] for talent in talent_db.get_all_talents()]
+    assert "SCENARIO1_002" not in talent_db.get_posting_ids("specialization", ["NE"])
+    
+    assert talent_db.add_talent(_new_talent("NEW_001"))
+    assert talent_db._id_index["NEW_001"] == slot
+    assert talent_db.get_talent_count() == count
+
+@pytest.mark.parametrize("use_vectorized", [True, False])
+@pytest.mark.parametrize("use_index", [True, False])
+def test_writes_show_up_in_search(talent_db, use_index, use_vectorized):
+    searcher = PayloadSearcher(use_inverted_index=use_index, use_vectorized=use_vectorized, talent_db=talent_db)
+    ids = lambda: [result["id"] for result in searcher.search(QUERY, 5)]
+    
+    assert "NEW_001" not in ids()
+    talent_db.add_talent(_new_talent("NEW_001"))
+    assert ids()[0] == "NEW_001"
+    
+    talent_db.update_talent("NEW_001", {"specialization": "SE", "skills": ["java"], "experience_years": 1})
+    assert "NEW_001" not in ids()
+    
+    # 삭제 후 같은 슬롯에 들어간 인재가 검색되고 삭제된 인재는 빠짐
+    talent_db.delete_talent("SCENARIO1_002")
+    assert "SCENARIO1_002" not in ids()
+    talent_db.add_talent(_new_talent("NEW_002", skills=["화웨이", "시스코", "네트워크"]))
+    assert ids()[0] == "NEW_002"
+
+def test_patched_columns_match_rebuild(synthetic_db, synthetic_queries):
+    talent_db = TalentDatabase(seed_scenario_data=False)
+    talent_db.add_talents([dict(talent) for talent in synthetic_db.get_all_talents()[:400]])
+    searcher = PayloadSearcher(talent_db=talent_db)
+    rng = random.Random(3)
+    
+    for step in range(120):
+        ids = list(talent_db._id_index)
+        action = rng.random()
+        if action < 0.3:
+            talent_db.delete_talent(rng.choice(ids))
+        elif action < 0.6:
+            donor = rng.choice(synthetic_db.get_all_talents())
+            talent_db.add_talent(dict(donor, id=f"NEW_{step:03d}"))
+        else:
+            donor = rng.choice(synthetic_db.get_all_talents())
+            talent_db.update_talent(rng.choice(ids), {
+                "skills": donor["skills"] + [f"신규기술{step}"],
+                "residence": donor.get("residence"),
+                "industry_knowledge": donor.get("industry_knowledge"),
+                "experience_years": donor.get("experience_years")
+            })
+        
+        # 컬럼 행은 슬롯과 정렬된 채로 유지 (재생성 없이)
+        columns = talent_db.get_columns()
+        assert talent_db._columns is columns
+        assert [columns.ids[slot] if columns.alive[slot] else None for slot in range(len(talent_db.talents))] == \
+            [talent["id"] if talent else None for talent in talent_db.talents]
+        if step % 20 == 0:
+            assert _column_rows(columns) == _column_rows(TalentColumns(talent_db.get_all_talents()))
+    
+    assert _column_rows(talent_db.get_columns()) == _column_rows(TalentColumns(talent_db.get_all_talents()))
+    
+    rebuilt = TalentDatabase(seed_scenario_data=False)
+    rebuilt.add_talents(talent_db.get_all_talents())
+    baseline = PayloadSearcher(use_vectorized=False, talent_db=rebuilt)
+    for parsed_query in synthetic_queries:
+        assert ranked(searcher.search(parsed_query, 20)) == ranked(baseline.search(parsed_query, 20))
+
+def test_read_only_columns_are_patched_by_copy(talent_db):
+    arrays, meta = talent_db.get_columns().export_arrays()
+    for array in arrays.values():
+        array.flags.writeable = False
+    read_only = TalentColumns.from_arrays(arrays, meta)
+    talent_db._columns = read_only
+    before = _column_rows(read_only)
+    
+    talent_db.update_talent("SCENARIO1_001", {"experience_years": 12, "skills": ["주니퍼"]})
+    copied = talent_db.get_columns()
+    talent_db.delete_talent("SCENARIO1_003")
+    talent_db.add_talent(_new_talent("NEW_001"))
+    
+    # 첫 쓰기에서 한 번만 복사하고 이후는 복사본을 제자리에서 고침
+    assert copied is not read_only and talent_db.get_columns() is copied
+    assert _column_rows(read_only) == before
+    assert _column_rows(talent_db.get_columns()) == _column_rows(TalentColumns(talent_db.get_all_talents()))
+
+def test_large_batch_writes_rows(talent_db):
+    talent_db.get_columns()
+    talent_db.add_talents(_new_talent(f"NEW_{i:03d}") for i in range(500))
+    
+    columns = talent_db._columns
+    assert columns is not None and int(columns.alive.sum()) == talent_db.get_talent_count()
+    assert _column_rows(columns) == _column_rows(TalentColumns(talent_db.get_all_talents()))
+
+def _write_seconds(talent_db, writes=300):
+    """수정/삭제/추가(슬롯 재사용) 한 번씩의 최소 처리 시간 (다른 작업에 의한 지연 제외)"""
+    slots = talent_db.get_talent_slots()
+    best = float("inf")
+    for i in range(writes):
+        talent = slots[(i * 7919) % len(slots)]
+        started = time.perf_counter()
+        talent_db.update_talent(talent["id"], {"experience_years": i % 20, "skills": ["화웨이", f"기술{i}"]})
+        talent_db.delete_talent(talent["id"])
+        talent_db.add_talent(dict(talent))
+        best = min(best, time.perf_counter() - started)
+    return best
+
+def test_write_cost_does_not_grow_with_pool_size(synthetic_db):
+    small = _pool(synthetic_db, 2000)
+    large = _pool(synthetic_db, 64000)
+    
+    # 첫 쓰기에서 여유 공간을 둔 배열로 한 번 재할당, 이후 쓰기는 제자리
+    _write_seconds(small, writes=1)
+    _write_seconds(large, writes=1)
+    columns = large.get_columns()
+    
+    small_seconds = _write_seconds(small)
+    large_seconds = _write_seconds(large)
+    
+    # 32배 큰 풀에서도 쓰기 비용이 비슷해야 함 (이전 구현은 풀 크기에 비례)
+    assert large_seconds < small_seconds * 4
+    assert large.get_columns() is columns
+    assert _column_rows(large.get_columns()) == _column_rows(TalentColumns(large.get_all_talents()))
+
+def test_search_after_write_reads_slots(monkeypatch, talent_db):
+    searcher = PayloadSearcher(talent_db=talent_db)
+    talent_db.add_talent(_new_talent("NEW_001"))
+    talent_db.delete_talent("SCENARIO1_002")
+    
+    def fail():
+        raise AssertionError("get_all_talents() 호출")
+    monkeypatch.setattr(talent_db, "get_all_talents", fail)
+    
+    ids = [result["id"] for result in searcher.search(QUERY, 5)]
+    assert ids[0] == "NEW_001" and "SCENARIO1_002" not in ids
+    assert searcher.last_search_stats["total"] == talent_db.get_talent_count()
+
+def test_update_does_not_mutate_returned_dicts(talent_db):
+    talents = talent_db.get_all_talents()
+    before = dict(talents[0])
+    
+    talent_db.update_talent(before["id"], {"experience_years": 30})
+    
+    assert talents[0] == before
+    assert talent_db.get_talent_by_id(before["id"])["experience_years"] == 30
@@ -0,0 +1,65 @@
+"""
+텍스트 인코더 테스트
+인코더 인터페이스, 캐시 메모리 계층 크기 제한, 쿼리 텍스트 디스크 미저장, 키워드 인코더 매처 분리
+"""
+
+import sqlite3
+
+import pytest
+
+from keyword_matcher import get_keyword_matcher
+from text_encoder import CachedEncoder, HashingNgramEncoder, KeywordEncoder, TextEncoder
+
+def _disk_rows(path):
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+def test_text_encoder_requires_encode_batch():
+    class IncompleteEncoder(TextEncoder):
+        pass
+    
+    with pytest.raises(TypeError):
+        IncompleteEncoder()
+
+def test_memory_cache_is_bounded_lru():
+    encoder = CachedEncoder(HashingNgramEncoder(), memory_size=3)
+    texts = [f"네트워크 운영 {i}년" for i in range(5)]
+    
+    expected = encoder.encoder.encode_batch(texts)
+    assert encoder.encode_batch(texts) == expected
+    assert len(encoder._memory) == 3
+    assert encoder.stats["evictions"] == 2
+    
+    # 최근 사용 항목은 적중, 밀려난 항목은 다시 인코딩
+    encoder.encode_batch(texts[-1:])
+    assert encoder.stats["hits"] == 1
+    encoder.encode_batch(texts[:1])
+    assert encoder.stats["misses"] == 6
+    assert len(encoder._memory) == 3
+
+def test_query_texts_are_not_persisted(tmp_path):
+    path = str(tmp_path / "encoder.db")
+    encoder = CachedEncoder(HashingNgramEncoder(), path)
+    
+    encoder.encode_batch(["화웨이 네트워크 유지보수"])
+    encoder.encode_queries(["금융권 네트워크 전문가", "화웨이 네트워크 유지보수"])
+    encoder.close()
+    assert _disk_rows(path) == 1
+    
+    reopened = CachedEncoder(HashingNgramEncoder(), path)
+    reopened.encode_queries(["화웨이 네트워크 유지보수", "금융권 네트워크 전문가"])
+    assert reopened.stats["disk_hits"] == 1
+    assert reopened.stats["misses"] == 1
+    reopened.close()
+
+def test_keyword_encoders_do_not_share_matcher():
+    shared = get_keyword_matcher()
+    shared_state = shared.export_state()["tables"]
+    
+    network = KeywordEncoder({"네트워크": {"network": 1.0}})
+    security = KeywordEncoder({"보안": {"security": 1.0}})
+    
+    assert network.encode("네트워크 보안") == {"network": 1.0}
+    assert security.encode("네트워크 보안") == {"security": 1.0}
+    assert "vector_keywords" not in shared.export_state()["tables"]
+    assert shared.export_state()["tables"] == shared_state
@@ -0,0 +1,121 @@
+"""
+벡터 검색 테스트
+밀집 float32 행렬 유사도와 dict 코사인 유사도 비교, 개념/행 확장, 동시 행 생성, ANN recall
+"""
+
+import threading
+
+import pytest
+
+from example.talent_data import TalentDatabase
+from tests.conftest import SYNTHETIC_SIZE
+from vector_search import DenseVectorStore, VectorSearcher
+
+@pytest.fixture(scope="module")
+def vector_searcher(synthetic_db):
+    return VectorSearcher(talent_db=synthetic_db, ann_backend="numpy")
+
+def _dict_similarities(searcher, query_vector, candidates):
+    return [
+        searcher._calculate_vector_similarity(query_vector, searcher._create_candidate_vector(candidate))
+        for candidate in candidates
+    ]
+
+def test_dense_similarity_matches_dict_cosine(vector_searcher, synthetic_db, synthetic_queries):
+    candidates = synthetic_db.get_all_talents()[:300]
+    
+    for parsed_query in synthetic_queries:
+        query_vector = vector_searcher._create_query_vector(parsed_query)
+        dense = vector_searcher._calculate_vector_similarities(query_vector, candidates)
+        assert dense == pytest.approx(_dict_similarities(vector_searcher, query_vector, candidates), abs=1e-5)
+
+def test_new_concepts_grow_columns_geometrically():
+    fields = ("technical_expertise", "industry_specialization")
+    store = DenseVectorStore(fields, {"network": 0, "cloud": 1}, capacity=2)
+    searcher = VectorSearcher(ann_backend="numpy")
+    widths = set()
+    vectors = {}
+    
+    for i in range(40):
+        vectors[f"T{i}"] = {
+            "technical_expertise": {"network": 1.0, f"concept_{i}": 0.5, f"concept_{i + 1}": 0.25},
+            "industry_specialization": {} if i % 3 else {"cloud": 1.0}
+        }
+        store.add(f"T{i}", vectors[f"T{i}"])
+        widths.add(store.matrices["technical_expertise"].shape[1])
+    
+    assert len(store.vocabulary) == 43
+    # 개념마다 한 열씩이 아니라 두 배씩 확장
+    assert widths == {4, 8, 16, 32, 64}
+    assert len(store) == 40 and store.matrices["technical_expertise"].shape[0] == 64
+    
+    # 빈 필드 규칙: 둘 다 비면 0.5, 한쪽만 비면 0, 그 외 코사인
+    query = {"technical_expertise": {"network": 1.0, "concept_7": 1.0}, "industry_specialization": {}}
+    weights = {field: 0.5 for field in fields}
+    query_dense = {field: store.to_dense(query[field]) for field in fields}
+    rows = [store.get_row(talent_id) for talent_id in vectors]
+    expected = [
+        sum(
+            weights[field] * (searcher._cosine_similarity(query[field], vector[field])
+                              if query[field] and vector[field]
+                              else 0.5 if not query[field] and not vector[field] else 0.0)
+            for field in fields
+        )
+        for vector in vectors.values()
+    ]
+    assert store.similarities(query_dense, rows, weights).tolist() == pytest.approx(expected, abs=1e-6)
+    
+    # 스냅샷 형식은 어휘 크기 열만 저장
+    arrays, _ = store.export_state()
+    assert arrays["matrix.technical_expertise"].shape == (40, 43)
+
+def test_concurrent_row_creation_keeps_one_row_per_talent(synthetic_db):
+    talent_db = TalentDatabase(seed_scenario_data=False)
+    talent_db.add_talents([dict(talent) for talent in synthetic_db.get_all_talents()[:400]])
+    searcher = VectorSearcher(talent_db=talent_db, precompute=False)
+    talents = talent_db.get_all_talents()
+    barrier = threading.Barrier(8)
+    
+    def create_rows():
+        barrier.wait()
+        for talent in talents:
+            searcher._get_candidate_row(talent)
+    
+    threads = [threading.Thread(target=create_rows) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    store = searcher.dense_store
+    rows = [store.get_row(talent["id"]) for talent in talents]
+    assert len(store) == len(talents)
+    assert sorted(rows) == list(range(len(talents)))
+    assert all(store.get_talent_id(row) == talent["id"] for row, talent in zip(rows, talents))
+
+def test_ann_recall_against_exact_search(vector_searcher, synthetic_queries):
+    vector_searcher.build_ann_index()
+    index = vector_searcher.ann_index
+    assert index is not None and len(vector_searcher.dense_store) == SYNTHETIC_SIZE
+    
+    # 모든 클러스터를 탐색하면 정확 검색과 같음
+    exhaustive = vector_searcher.check_ann_recall(synthetic_queries, k=10, nprobe=index.nlist)
+    assert exhaustive["recall"] == 1.0
+    
+    default = vector_searcher.check_ann_recall(synthetic_queries, k=10)
+    assert default["queries"] == len(synthetic_queries)
+    assert default["recall"] >= 0.9
+    
+    sampled = vector_searcher.check_ann_recall(k=10, sample_size=50)
+    assert sampled["recall"] >= 0.9
+
+def test_ann_retrieve_matches_exact_top_k(vector_searcher, synthetic_db, synthetic_queries):
+    vector_searcher.build_ann_index()
+    nlist = vector_searcher.ann_index.nlist
+    talents = synthetic_db.get_all_talents()
+    
+    for parsed_query in synthetic_queries[:10]:
+        retrieved = vector_searcher.retrieve(parsed_query, 10, nprobe=nlist)
+        query_vector = vector_searcher._create_query_vector(parsed_query)
+        exact = sorted(vector_searcher._calculate_vector_similarities(query_vector, talents), reverse=True)[:10]
+        assert [score for _, score in retrieved] == pytest.approx(exact, abs=1e-5)
@@ -0,0 +1,315 @@
+"""
+텍스트 인코더 모듈
+벡터 필드 텍스트를 희소 개념 벡터(dict)로 일괄 변환 - 키워드/해싱 n-gram/로컬 CPU 모델 백엔드와 디스크 캐시
+"""
+
+import abc
+import hashlib
+import json
+import logging
+import re
+import sqlite3
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from keyword_matcher import KeywordMatcher
+
+logger = logging.getLogger(__name__)
+
+# 해싱 n-gram 인코더 기본 설정
+DEFAULT_HASH_FEATURES = 256
+DEFAULT_NGRAM_RANGE = (2, 3)
+DEFAULT_NGRAM_WEIGHT = 0.5
+
+# 로컬 CPU 모델 기본값 (sentence-transformers 설치 및 모델 파일 필요)
+DEFAULT_MODEL_NAME = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+# 인코더 캐시 메모리 계층 최대 항목 수 (초과 시 가장 오래 안 쓴 항목 제거)
+DEFAULT_ENCODER_CACHE_SIZE = 100000
+
+class TextEncoder(abc.ABC):
+    """텍스트 인코더 인터페이스 - encode_batch(texts)가 텍스트별 {개념: 값} 벡터 목록 반환"""
+    
+    # 디스크 캐시 네임스페이스 (설정이 바뀌면 캐시 키도 바뀌도록 설정값 포함)
+    cache_key = "base"
+    
+    @abc.abstractmethod
+    def encode_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        """텍스트별 {개념: 값} 벡터 목록 (빈 텍스트는 빈 dict)"""
+    
+    def encode(self, text: str) -> Dict[str, float]:
+        return self.encode_batch([text])[0]
+    
+    def encode_queries(self, texts: List[str]) -> List[Dict[str, float]]:
+        """검색 쿼리 텍스트 인코딩 (캐시 인코더는 디스크에 남기지 않음)"""
+        return self.encode_batch(texts)
+    
+    def vocabulary(self) -> List[str]:
+        """인코더가 만들 수 있는 개념 목록 (밀집 행렬 열 사전 할당용)"""
+        return []
+
+class KeywordEncoder(TextEncoder):
+    """키워드 → 개념 벡터 매핑 합산 후 합계 정규화 (기존 VectorSearcher._text_to_vector 방식)"""
+    
+    cache_key = "keyword"
+    
+    # 인코더 전용 키워드 매처의 카테고리 이름
+    matcher_category = "vector_keywords"
+    
+    def __init__(self, keyword_vectors: Dict[str, Dict[str, float]]):
+        self.keyword_vectors = keyword_vectors
+        # 인스턴스마다 키워드 표가 다를 수 있으므로 파서용 공용 매처와 분리
+        self.matcher = KeywordMatcher()
+        self.matcher.register(self.matcher_category, {keyword: [keyword] for keyword in keyword_vectors})
+    
+    def encode_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        return [self._encode_one(text) for text in texts]
+    
+    def _encode_one(self, text: str) -> Dict[str, float]:
+        if not text:
+            return {}
+        
+        text_lower = text.lower()
+        vector = {}
+        
+        # 키워드 매칭으로 벡터 생성 (합산 순서를 기존과 같게 테이블 순서로 정렬)
+        hits = self.matcher.find(text_lower, [self.matcher_category]).get(self.matcher_category, [])
+        for hit in sorted(hits, key=lambda hit: hit.label_rank):
+            for vec_key, vec_value in self.keyword_vectors[hit.label].items():
+                vector[vec_key] = vector.get(vec_key, 0) + vec_value
+        
+        # 정규화
+        if vector:
+            total = sum(vector.values())
+            if total > 0:
+                vector = {k: v/total for k, v in vector.items()}
+        
+        return vector
+    
+    def vocabulary(self) -> List[str]:
+        concepts = {}
+        for keyword_vector in self.keyword_vectors.values():
+            for concept in keyword_vector:
+                concepts.setdefault(concept, None)
+        return list(concepts)
+
+class HashingNgramEncoder(TextEncoder):
+    """해싱 트릭 문자 n-gram 인코더 (결정적, 외부 의존성 없음)
+    
+    키워드 개념 벡터에 문자 n-gram 해시 버킷(#번호)을 ngram_weight 비율로 더해
+    키워드 목록에 없는 표현도 비슷한 텍스트끼리 유사도가 생기도록 한다.
+    """
+    
+    def __init__(self, keyword_vectors: Optional[Dict[str, Dict[str, float]]] = None,
+                 n_features: int = DEFAULT_HASH_FEATURES,
+                 ngram_range: Tuple[int, int] = DEFAULT_NGRAM_RANGE,
+                 ngram_weight: float = DEFAULT_NGRAM_WEIGHT):
+        self.keyword_encoder = KeywordEncoder(keyword_vectors) if keyword_vectors else None
+        self.n_features = n_features
+        self.ngram_range = ngram_range
+        self.ngram_weight = ngram_weight
+        self.cache_key = f"hashing:{n_features}:{ngram_range[0]}-{ngram_range[1]}:{ngram_weight}:{bool(keyword_vectors)}"
+    
+    def encode_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        return [self._encode_one(text) for text in texts]
+    
+    def _encode_one(self, text: str) -> Dict[str, float]:
+        if not text:
+            return {}
+        
+        vector = dict(self.keyword_encoder._encode_one(text)) if self.keyword_encoder else {}
+        
+        # 공백 정리 후 앞뒤 경계 포함 문자 n-gram
+        normalized = " " + re.sub(r"\s+", " ", text.lower().strip()) + " "
+        counts = {}
+        min_n, max_n = self.ngram_range
+        for n in range(min_n, max_n + 1):
+            for i in range(len(normalized) - n + 1):
+                bucket = zlib.crc32(normalized[i:i + n].encode("utf-8")) % self.n_features
+                counts[bucket] = counts.get(bucket, 0) + 1
+        
+        total = sum(counts.values())
+        if total:
+            # 키워드가 없으면 n-gram만, 있으면 n-gram 부분을 ngram_weight 비율로 합산
+            scale = self.ngram_weight if vector else 1.0
+            for bucket, count in counts.items():
+                key = f"#{bucket}"
+                vector[key] = vector.get(key, 0) + scale * count / total
+        
+        return vector
+    
+    def vocabulary(self) -> List[str]:
+        concepts = self.keyword_encoder.vocabulary() if self.keyword_encoder else []
+        return concepts + [f"#{bucket}" for bucket in range(self.n_features)]
+
+class SentenceModelEncoder(TextEncoder):
+    """로컬 CPU 문장 임베딩 모델 인코더 (sentence-transformers 선택 의존성)"""
+    
+    def __init__(self, model_name: str = DEFAULT_MODEL_NAME, batch_size: int = 32):
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            raise RuntimeError("로컬 모델 인코더에는 sentence-transformers 패키지가 필요합니다")
+        
+        self.model = SentenceTransformer(model_name, device="cpu")
+        self.batch_size = batch_size
+        self.dimension = self.model.get_sentence_embedding_dimension()
+        self.cache_key = f"model:{model_name}"
+    
+    def encode_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        vectors = [{} for _ in texts]
+        present = [i for i, text in enumerate(texts) if text]
+        if not present:
+            return vectors
+        
+        embeddings = self.model.encode(
+            [texts[i] for i in present], batch_size=self.batch_size,
+            normalize_embeddings=True, show_progress_bar=False
+        )
+        for i, embedding in zip(present, embeddings):
+            vectors[i] = {f"e{dim}": float(value) for dim, value in enumerate(embedding) if value}
+        return vectors
+    
+    def vocabulary(self) -> List[str]:
+        return [f"e{dim}" for dim in range(self.dimension)]
+
+class CachedEncoder(TextEncoder):
+    """인코더 결과 캐시 - 프로세스 메모리(LRU) + (선택) SQLite 디스크 캐시, 키는 인코더 설정과 텍스트 해시
+    
+    디스크에는 후보자 텍스트만 저장한다. 쿼리 텍스트(encode_queries)는 사용자 입력이라 종류에 끝이 없으므로
+    디스크에서 읽기만 하고 크기가 제한된 메모리 계층에만 남긴다.
+    """
+    
+    def __init__(self, encoder: TextEncoder, cache_path: Optional[str] = None,
+                 memory_size: int = DEFAULT_ENCODER_CACHE_SIZE):
+        self.encoder = encoder
+        self.cache_key = encoder.cache_key
+        self.cache_path = cache_path
+        self.memory_size = memory_size
+        self.stats = {"hits": 0, "disk_hits": 0, "misses": 0, "evictions": 0}
+        
+        self._memory = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn = None
+        if cache_path:
+            self._conn = self._connect()
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector TEXT NOT NULL)"
+            )
+            self._conn.commit()
+    
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.cache_path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+    
+    def reopen(self):
+        """fork된 자식 프로세스에서 디스크 캐시 새 연결 생성 (부모 연결은 닫지 않음)"""
+        self._lock = threading.Lock()
+        if self._conn is not None:
+            self._inherited_conns = getattr(self, "_inherited_conns", []) + [self._conn]
+            self._conn = self._connect()
+    
+    def _text_key(self, text: str) -> str:
+        return hashlib.sha1(f"{self.cache_key}\0{text}".encode("utf-8")).hexdigest()
+    
+    def encode_batch(self, texts: List[str]) -> List[Dict[str, float]]:
+        return self._encode_cached(texts, persist=True)
+    
+    def encode_queries(self, texts: List[str]) -> List[Dict[str, float]]:
+        return self._encode_cached(texts, persist=False)
+    
+    def _encode_cached(self, texts: List[str], persist: bool) -> List[Dict[str, float]]:
+        keys = [self._text_key(text) for text in texts]
+        vectors = {}
+        
+        with self._lock:
+            for key in keys:
+                vector = self._memory.get(key)
+                if vector is not None:
+                    self._memory.move_to_end(key)
+                    vectors[key] = vector
+            self.stats["hits"] += sum(1 for key in keys if key in vectors)
+            
+            missing = list(dict.fromkeys(key for key in keys if key not in vectors))
+            if missing and self._conn is not None:
+                for key, vector in self._load(missing):
+                    vectors[key] = vector
+                    self._remember(key, vector)
+                    self.stats["disk_hits"] += 1
+        
+        # 캐시에 없는 텍스트만 한 번에 인코딩
+        pending = {}
+        for key, text in zip(keys, texts):
+            if key not in vectors:
+                pending.setdefault(key, text)
+        
+        if pending:
+            encoded = self.encoder.encode_batch(list(pending.values()))
+            with self._lock:
+                self.stats["misses"] += len(pending)
+                for key, vector in zip(pending, encoded):
+                    vectors[key] = vector
+                    self._remember(key, vector)
+                if persist and self._conn is not None:
+                    self._store(zip(pending, encoded))
+        
+        return [vectors[key] for key in keys]
+    
+    def _remember(self, key: str, vector: Dict[str, float]):
+        """메모리 계층에 저장 (잠금 안에서 호출, 크기 초과 시 가장 오래 안 쓴 항목 제거)"""
+        if self.memory_size <= 0:
+            return
+        
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+            self.stats["evictions"] += 1
+    
+    def _load(self, keys: List[str]) -> Iterable[Tuple[str, Dict]]:
+        # SQLite 바인딩 변수 개수 제한을 넘지 않도록 나눠서 조회
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            rows = self._conn.execute(
+                f"SELECT key, vector FROM embeddings WHERE key IN ({', '.join('?' * len(chunk))})", chunk
+            ).fetchall()
+            for key, vector in rows:
+                yield key, json.loads(vector)
+    
+    def _store(self, items: Iterable[Tuple[str, Dict]]):
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                    ((key, json.dumps(vector)) for key, vector in items)
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"임베딩 캐시 저장 오류: {e}")
+    
+    def vocabulary(self) -> List[str]:
+        return self.encoder.vocabulary()
+    
+    def close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+def create_encoder(name: str = "keyword", keyword_vectors: Optional[Dict] = None,
+                   cache_path: Optional[str] = None, **kwargs) -> TextEncoder:
+    """인코더 생성 (name: "keyword" | "hashing" | "model"), 캐시로 감싸서 반환"""
+    if name == "keyword":
+        encoder = KeywordEncoder(keyword_vectors or {})
+    elif name == "hashing":
+        encoder = HashingNgramEncoder(keyword_vectors, **kwargs)
+    elif name == "model":
+        encoder = SentenceModelEncoder(**kwargs)
+    else:
+        raise ValueError(f"알 수 없는 인코더: {name}")
+    
+    # 키워드 인코더는 계산이 가벼워 디스크 캐시를 지정한 경우에만 캐시
+    if name == "keyword" and not cache_path:
+        return encoder
+    return CachedEncoder(encoder, cache_path)
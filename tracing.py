@@ -0,0 +1,374 @@
+"""
+요청 추적 모듈
+검색 요청마다 trace를 시작해 파이프라인 단계와 점수 계산 배치(필드 매칭/벡터 유사도)를 span으로 기록하고
+JSONL 파일 또는 OTLP/HTTP(JSON) 수집기로 내보냄
+
+헤드 샘플링: 최상위 span을 만들 때 한 번만 샘플 여부를 정하고, 샘플되지 않은 요청은
+하위 span 호출이 공용 no-op 객체를 돌려줘 추적 비용이 거의 없다.
+내보내기는 백그라운드 스레드에서 처리해 요청 처리 시간에 포함되지 않는다.
+
+환경 변수:
+    TRACE_SAMPLE_RATE             샘플링 비율 0~1 (기본 0 - 추적 끔, traceparent 헤더의 sampled 플래그는 항상 따름)
+    TRACE_EXPORTER                jsonl | otlp (기본 jsonl)
+    TRACE_JSONL_PATH              JSONL 출력 경로 (기본 traces.jsonl)
+    OTEL_EXPORTER_OTLP_ENDPOINT   OTLP 수집기 주소 (기본 http://localhost:4318)
+    TRACE_SERVICE_NAME            서비스 이름 (기본 talent-search)
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import random
+import re
+import threading
+import time
+import urllib.request
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SERVICE_NAME = "talent-search"
+DEFAULT_JSONL_PATH = "traces.jsonl"
+DEFAULT_OTLP_ENDPOINT = "http://localhost:4318"
+
+# 내보내기 대기열 크기 (trace 단위, 가득 차면 버리고 dropped_traces만 증가)
+MAX_QUEUED_TRACES = 1024
+
+# 내보내기 1회당 최대 trace 수
+EXPORT_BATCH_SIZE = 64
+
+# W3C Trace Context traceparent 헤더 (version-traceid-spanid-flags)
+_TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+
+class _NoopSpan:
+    """샘플되지 않은 요청의 span - 모든 기록을 무시"""
+    
+    sampled = False
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        return False
+    
+    def set_attribute(self, key: str, value):
+        pass
+    
+    def set_attributes(self, **attributes):
+        pass
+    
+    def traceparent(self) -> Optional[str]:
+        return None
+
+NOOP_SPAN = _NoopSpan()
+
+# 현재 실행 중인 span (샘플되지 않은 trace 안에서는 _UNSAMPLED)
+_current_span = ContextVar("talent_search_current_span", default=None)
+
+class _UnsampledScope:
+    """샘플되지 않은 최상위 trace 범위 - 안쪽의 trace() 호출이 새 trace를 시작하지 않도록 표시"""
+    
+    sampled = False
+    
+    def __enter__(self):
+        self._token = _current_span.set(_UNSAMPLED)
+        return NOOP_SPAN
+    
+    def __exit__(self, exc_type, exc, tb):
+        _current_span.reset(self._token)
+        return False
+
+_UNSAMPLED = object()
+
+class Span:
+    """샘플된 trace의 span - with 블록 동안 현재 span으로 설정되고 종료 시 trace에 기록"""
+    
+    sampled = True
+    
+    __slots__ = ("tracer", "trace_id", "span_id", "parent_id", "name", "kind", "attributes",
+                 "start_ns", "end_ns", "status", "error", "_finished", "_is_root", "_started_perf", "_token")
+    
+    def __init__(self, tracer: "Tracer", name: str, trace_id: str, parent_id: Optional[str],
+                 finished: List["Span"], is_root: bool = False, kind: str = "internal",
+                 attributes: Optional[Dict] = None):
+        self.tracer = tracer
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.attributes = {}
+        self.start_ns = 0
+        self.end_ns = 0
+        self.status = "ok"
+        self.error = None
+        self._finished = finished  # 같은 trace에서 끝난 span 목록 (최상위 span 종료 시 내보냄)
+        self._is_root = is_root
+        self._started_perf = 0
+        self._token = None
+        if attributes:
+            self.set_attributes(**attributes)
+    
+    def __enter__(self):
+        # 시작 시각은 벽시계, 길이는 단조 시계로 측정
+        self.start_ns = time.time_ns()
+        self._started_perf = time.perf_counter_ns()
+        self._token = _current_span.set(self)
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = self.start_ns + (time.perf_counter_ns() - self._started_perf)
+        if exc is not None:
+            self.status = "error"
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current_span.reset(self._token)
+        
+        self._finished.append(self)
+        if self._is_root:
+            self.tracer._enqueue(self._finished)
+        return False
+    
+    def set_attribute(self, key: str, value):
+        """속성 기록 (None은 생략, 기본 타입 외 값은 문자열로 저장)"""
+        if value is None:
+            return
+        if not isinstance(value, (bool, int, float, str)):
+            value = str(value)
+        self.attributes[key] = value
+    
+    def set_attributes(self, **attributes):
+        for key, value in attributes.items():
+            self.set_attribute(key, value)
+    
+    def traceparent(self) -> str:
+        """하위 서비스/응답 헤더로 전달할 W3C traceparent"""
+        return f"00-{self.trace_id}-{self.span_id}-01"
+    
+    def to_dict(self) -> Dict:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_span_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time_unix_nano": self.start_ns,
+            "end_time_unix_nano": self.end_ns,
+            "duration_ms": round((self.end_ns - self.start_ns) / 1e6, 4),
+            "attributes": self.attributes,
+            "status": self.status,
+            "error": self.error
+        }
+
+class JsonlSpanExporter:
+    """span을 한 줄에 하나씩 JSONL 파일에 추가"""
+    
+    def __init__(self, path: str = DEFAULT_JSONL_PATH, service_name: str = DEFAULT_SERVICE_NAME):
+        self.path = path
+        self.service_name = service_name
+    
+    def export(self, spans: List[Span]):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            for span in spans:
+                record = span.to_dict()
+                record["service"] = self.service_name
+                f.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+class OtlpHttpSpanExporter:
+    """OTLP/HTTP JSON 형식으로 수집기(OpenTelemetry Collector, Jaeger 등)에 전송"""
+    
+    _KINDS = {"internal": 1, "server": 2, "client": 3}
+    
+    def __init__(self, endpoint: str = DEFAULT_OTLP_ENDPOINT, service_name: str = DEFAULT_SERVICE_NAME,
+                 timeout: float = 2.0):
+        endpoint = endpoint.rstrip("/")
+        self.url = endpoint if endpoint.endswith("/v1/traces") else f"{endpoint}/v1/traces"
+        self.service_name = service_name
+        self.timeout = timeout
+    
+    def export(self, spans: List[Span]):
+        body = json.dumps(self.to_payload(spans)).encode("utf-8")
+        request = urllib.request.Request(self.url, data=body, method="POST",
+                                         headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request, timeout=self.timeout) as response:
+            response.read()
+    
+    def to_payload(self, spans: List[Span]) -> Dict:
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [_otlp_attribute("service.name", self.service_name)]},
+                "scopeSpans": [{
+                    "scope": {"name": "talent_search"},
+                    "spans": [self._otlp_span(span) for span in spans]
+                }]
+            }]
+        }
+    
+    def _otlp_span(self, span: Span) -> Dict:
+        otlp_span = {
+            "traceId": span.trace_id,
+            "spanId": span.span_id,
+            "name": span.name,
+            "kind": self._KINDS.get(span.kind, 1),
+            "startTimeUnixNano": str(span.start_ns),
+            "endTimeUnixNano": str(span.end_ns),
+            "attributes": [_otlp_attribute(key, value) for key, value in span.attributes.items()],
+            "status": {"code": 2, "message": span.error} if span.status == "error" else {"code": 1}
+        }
+        if span.parent_id:
+            otlp_span["parentSpanId"] = span.parent_id
+        return otlp_span
+
+def _otlp_attribute(key: str, value) -> Dict:
+    if isinstance(value, bool):
+        return {"key": key, "value": {"boolValue": value}}
+    if isinstance(value, int):
+        return {"key": key, "value": {"intValue": str(value)}}
+    if isinstance(value, float):
+        return {"key": key, "value": {"doubleValue": value}}
+    return {"key": key, "value": {"stringValue": str(value)}}
+
+class Tracer:
+    """헤드 샘플링 추적기
+    
+    trace(): 현재 span이 없으면 샘플 여부를 정해 새 trace 시작, 있으면 하위 span
+    span(): 샘플된 trace 안에서만 하위 span 생성 (그 외에는 NOOP_SPAN)
+    """
+    
+    def __init__(self, sample_rate: float = 0.0, exporter=None):
+        self.sample_rate = max(0.0, min(1.0, float(sample_rate)))
+        self.exporter = exporter
+        self.dropped_traces = 0
+        self.export_errors = 0
+        self._lock = threading.Lock()
+        self._queue = None
+        self._worker_pid = None
+    
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        """환경 변수 설정으로 추적기 생성 (모듈 docstring 참고)"""
+        service_name = os.environ.get("TRACE_SERVICE_NAME", DEFAULT_SERVICE_NAME)
+        if os.environ.get("TRACE_EXPORTER", "jsonl").lower() == "otlp":
+            exporter = OtlpHttpSpanExporter(
+                os.environ.get("OTEL_EXPORTER_OTLP_ENDPOINT", DEFAULT_OTLP_ENDPOINT), service_name
+            )
+        else:
+            exporter = JsonlSpanExporter(os.environ.get("TRACE_JSONL_PATH", DEFAULT_JSONL_PATH), service_name)
+        
+        try:
+            sample_rate = float(os.environ.get("TRACE_SAMPLE_RATE", 0.0))
+        except ValueError:
+            logger.warning(f"잘못된 TRACE_SAMPLE_RATE: {os.environ.get('TRACE_SAMPLE_RATE')} - 추적 끔")
+            sample_rate = 0.0
+        return cls(sample_rate, exporter)
+    
+    def trace(self, name: str, traceparent: Optional[str] = None, kind: str = "internal", **attributes):
+        """요청 범위 span - 진행 중인 trace가 없으면 여기서 샘플 여부 결정
+        
+        traceparent: 상위 서비스가 보낸 W3C traceparent 헤더 (있으면 같은 trace로 이어 붙이고 sampled 플래그를 따름)
+        """
+        current = _current_span.get()
+        if current is _UNSAMPLED:
+            return NOOP_SPAN
+        if current is not None:
+            return Span(self, name, current.trace_id, current.span_id, current._finished,
+                        kind=kind, attributes=attributes)
+        
+        parent = _parse_traceparent(traceparent)
+        if parent is not None:
+            trace_id, parent_id, sampled = parent
+        else:
+            trace_id, parent_id = None, None
+            sampled = self.sample_rate > 0 and random.random() < self.sample_rate
+        
+        if not sampled or self.exporter is None:
+            return _UnsampledScope()
+        return Span(self, name, trace_id or os.urandom(16).hex(), parent_id, [], is_root=True,
+                    kind=kind, attributes=attributes)
+    
+    def span(self, name: str, **attributes):
+        """하위 span (샘플된 trace 밖에서는 NOOP_SPAN - 호출 비용은 ContextVar 조회 한 번)"""
+        current = _current_span.get()
+        if current is None or current is _UNSAMPLED:
+            return NOOP_SPAN
+        return Span(self, name, current.trace_id, current.span_id, current._finished, attributes=attributes)
+    
+    @staticmethod
+    def current_span():
+        current = _current_span.get()
+        return NOOP_SPAN if current is None or current is _UNSAMPLED else current
+    
+    def _enqueue(self, spans: List[Span]):
+        """끝난 trace를 내보내기 대기열에 추가 (fork된 프로세스에서는 대기열/스레드 새로 생성)"""
+        if self._worker_pid != os.getpid():
+            self._start_worker()
+        try:
+            self._queue.put_nowait(spans)
+        except queue.Full:
+            self.dropped_traces += 1
+    
+    def _start_worker(self):
+        with self._lock:
+            if self._worker_pid == os.getpid():
+                return
+            self._queue = queue.Queue(maxsize=MAX_QUEUED_TRACES)
+            self._worker_pid = os.getpid()
+            threading.Thread(target=self._export_loop, args=(self._queue,), name="trace-exporter",
+                             daemon=True).start()
+            atexit.register(self.flush)
+    
+    def _export_loop(self, export_queue: queue.Queue):
+        while True:
+            traces = [export_queue.get()]
+            while len(traces) < EXPORT_BATCH_SIZE:
+                try:
+                    traces.append(export_queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            try:
+                self.exporter.export([span for spans in traces for span in spans])
+            except Exception as e:
+                self.export_errors += 1
+                logger.warning(f"trace 내보내기 실패 ({len(traces)}개 trace): {e}")
+            finally:
+                for _ in traces:
+                    export_queue.task_done()
+    
+    def flush(self, timeout: float = 5.0) -> bool:
+        """대기 중인 trace 내보내기 완료까지 대기 (timeout 초과 시 False)"""
+        export_queue = self._queue
+        if export_queue is None or self._worker_pid != os.getpid():
+            return True
+        
+        deadline = time.monotonic() + timeout
+        while export_queue.unfinished_tasks:
+            if time.monotonic() >= deadline:
+                return False
+            time.sleep(0.01)
+        return True
+
+def _parse_traceparent(header: Optional[str]):
+    """traceparent 헤더 → (trace_id, 상위 span_id, sampled) (형식이 잘못되면 None)"""
+    if not header:
+        return None
+    match = _TRACEPARENT_PATTERN.match(header.strip().lower())
+    if match is None or match.group(1) == "0" * 32 or match.group(2) == "0" * 16:
+        return None
+    return match.group(1), match.group(2), bool(int(match.group(3), 16) & 0x01)
+
+_shared_tracer = None
+_shared_lock = threading.Lock()
+
+def get_tracer() -> Tracer:
+    """프로세스 공용 추적기 (처음 호출 시 환경 변수로 생성)"""
+    global _shared_tracer
+    if _shared_tracer is None:
+        with _shared_lock:
+            if _shared_tracer is None:
+                _shared_tracer = Tracer.from_env()
+    return _shared_tracer
@@ -3,18 +3,290 @@
 벡터 필드를 기반으로 의미적 유사도 검색 수행
 """
 
+import hashlib
+import json
 import math
-from typing import Dict, List, Optional, Tuple
+import threading
+from typing import Dict, Iterable, List, Optional, Tuple
 import re
 import logging
+from scored_talent import ScoredTalent, select_top
+from ann_index import create_ann_index
+from text_encoder import TextEncoder, create_encoder
+from tracing import get_tracer
+
+try:
+    import numpy as np
+except ImportError:  # NumPy 미설치 환경에서는 dict 기반 코사인 유사도 사용
+    np = None
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 추론 규칙에서만 생성되는 개념 (keyword_vectors 값과 합쳐 고정 어휘 구성)
+INFERRED_CONCEPTS = (
+    "network", "infrastructure", "maintenance", "database", "data",
+    "security", "protection", "monitoring", "operation", "cloud",
+    "system", "development", "programming", "finance", "banking",
+    "insurance", "energy", "power", "manufacturing", "production",
+    "public", "government", "leadership", "management", "team_lead",
+    "guidance", "enterprise", "complex", "compliance"
+)
+
+class DenseVectorStore:
+    """인재별 후보자 벡터 저장소 - 벡터 필드마다 L2 정규화된 float32 행렬 (행: 인재, 열: 개념)
+    
+    행/열은 용량 단위로 두 배씩 늘리므로 행렬 열 수는 어휘 크기보다 클 수 있다 (남는 열은 0).
+    검색 중 후보 행이 지연 생성되므로 행 추가/무효화/복원은 잠금 안에서 수행한다.
+    """
+    
+    def __init__(self, fields: Iterable[str], vocabulary: Dict[str, int], capacity: int = 1024):
+        self.fields = tuple(fields)
+        self.vocabulary = vocabulary  # 개념 → 열 번호
+        
+        self._rows = {}        # 인재 ID → 행 번호
+        self._row_ids = {}     # 행 번호 → 인재 ID
+        self._free_rows = []   # 무효화된 행 (재사용)
+        self._size = 0
+        self._lock = threading.Lock()
+        
+        width = len(vocabulary)
+        self.matrices = {field: np.zeros((capacity, width), dtype=np.float32) for field in self.fields}
+        self.present = {field: np.zeros(capacity, dtype=bool) for field in self.fields}
+    
+    def __len__(self) -> int:
+        return len(self._rows)
+    
+    def get_row(self, talent_id: str) -> Optional[int]:
+        return self._rows.get(talent_id)
+    
+    def get_talent_id(self, row: int) -> Optional[str]:
+        return self._row_ids.get(row)
+    
+    def active_rows(self) -> "np.ndarray":
+        """저장된 인재 행 번호 (행 번호 순)"""
+        return np.sort(np.fromiter(self._rows.values(), dtype=np.int64, count=len(self._rows)))
+    
+    @property
+    def joint_width(self) -> int:
+        """결합 벡터 차원 (필드별 개념 열 + 필드별 빈 벡터 표시 열)"""
+        return len(self.fields) * (len(self.vocabulary) + 1)
+    
+    def joint_vectors(self, rows: "np.ndarray") -> "np.ndarray":
+        """필드별 행렬과 빈 필드 표시를 이어 붙인 후보 결합 벡터 (ANN 색인용)"""
+        width = len(self.vocabulary)
+        return np.hstack(
+            [self.matrices[field][rows, :width] for field in self.fields]
+            + [(~self.present[field][rows]).astype(np.float32)[:, None] for field in self.fields]
+        )
+    
+    def joint_query(self, query_dense: Dict[str, Optional["np.ndarray"]],
+                    weights: Dict[str, float]) -> "np.ndarray":
+        """결합 벡터와의 내적이 similarities() 값과 같은 쿼리 벡터
+        
+        필드 f 블록은 w_f·q_f, 빈 표시 열은 쿼리 필드가 비었을 때 0.5·w_f (둘 다 비면 0.5 규칙).
+        """
+        width = len(self.vocabulary)
+        blocks, empty_terms = [], []
+        
+        for field in self.fields:
+            weight = weights.get(field, 0.0)
+            query_field = query_dense.get(field)
+            if query_field is None:
+                blocks.append(np.zeros(width, dtype=np.float32))
+                empty_terms.append(0.5 * weight)
+            else:
+                blocks.append((query_field[:width] * weight).astype(np.float32))
+                empty_terms.append(0.0)
+        
+        return np.concatenate(blocks + [np.array(empty_terms, dtype=np.float32)])
+    
+    def to_dense(self, field_vector: Dict) -> Optional["np.ndarray"]:
+        """dict 개념 벡터를 단위 길이 밀집 벡터로 변환 (빈 벡터는 None)
+        
+        노름은 dict의 모든 값으로 계산하므로, 어휘에 없는 개념이 있어도 코사인 값이 dict 계산과 같다.
+        """
+        if not field_vector:
+            return None
+        
+        magnitude = math.sqrt(sum(v*v for v in field_vector.values()))
+        dense = np.zeros(len(self.vocabulary), dtype=np.float64)
+        if magnitude == 0:
+            return dense
+        for concept, value in field_vector.items():
+            column = self.vocabulary.get(concept)
+            if column is not None:
+                dense[column] = value / magnitude
+        return dense
+    
+    def add(self, talent_id: str, candidate_vector: Dict) -> int:
+        """후보자 벡터를 한 행으로 저장하고 행 번호 반환 (동시 요청이 먼저 저장했으면 그 행 반환)"""
+        with self._lock:
+            row = self._rows.get(talent_id)
+            if row is not None:
+                return row
+            
+            for field in self.fields:
+                for concept in candidate_vector.get(field, {}):
+                    if concept not in self.vocabulary:
+                        self._add_concept(concept)
+            dense_fields = {field: self.to_dense(candidate_vector.get(field, {})) for field in self.fields}
+            
+            if self._free_rows:
+                row = self._free_rows.pop()
+            else:
+                row = self._size
+                self._size += 1
+                if row >= len(self.present[self.fields[0]]):
+                    self._grow_rows()
+            
+            width = len(self.vocabulary)
+            for field, dense in dense_fields.items():
+                if dense is None:
+                    self.matrices[field][row] = 0.0
+                    self.present[field][row] = False
+                else:
+                    self.matrices[field][row, :width] = dense
+                    self.present[field][row] = True
+            
+            self._rows[talent_id] = row
+            self._row_ids[row] = talent_id
+            return row
+    
+    def invalidate(self, talent_ids: Optional[Iterable[str]] = None):
+        """인재 행 무효화 (None이면 전체)"""
+        with self._lock:
+            if talent_ids is None:
+                talent_ids = list(self._rows)
+            
+            for talent_id in talent_ids:
+                row = self._rows.pop(talent_id, None)
+                if row is not None:
+                    del self._row_ids[row]
+                    self._free_rows.append(row)
+    
+    def similarities(self, query_dense: Dict[str, Optional["np.ndarray"]], rows: "np.ndarray",
+                     weights: Dict[str, float]) -> "np.ndarray":
+        """여러 후보의 가중 벡터 유사도를 필드별 행렬-벡터 곱으로 한 번에 계산
+        
+        _calculate_vector_similarity와 같은 규칙: 둘 다 비면 0.5, 한쪽만 비면 0, 그 외 코사인.
+        """
+        total = np.zeros(len(rows), dtype=np.float64)
+        
+        for field, weight in weights.items():
+            query_field = query_dense.get(field)
+            present = self.present[field][rows]
+            
+            if query_field is None:
+                field_similarity = np.where(present, 0.0, 0.5)
+            else:
+                # 빈 후보 행은 0 벡터이므로 곱 결과도 0
+                matrix = self.matrices[field]
+                field_similarity = matrix[rows] @ self._fit_width(query_field, matrix.shape[1])
+            
+            total += field_similarity * weight
+        
+        return total
+    
+    def similarity_matrix(self, query_denses: List[Dict[str, Optional["np.ndarray"]]], rows: "np.ndarray",
+                          weights: Dict[str, float]) -> "np.ndarray":
+        """similarities()를 여러 쿼리에 대해 필드별 행렬-행렬 곱으로 계산 (후보 행 × 쿼리)"""
+        total = np.zeros((len(rows), len(query_denses)), dtype=np.float64)
+        
+        for field, weight in weights.items():
+            matrix = self.matrices[field]
+            present = self.present[field][rows]
+            
+            query_block = np.zeros((len(query_denses), matrix.shape[1]), dtype=np.float32)
+            missing = np.zeros(len(query_denses), dtype=bool)
+            for i, query_dense in enumerate(query_denses):
+                query_field = query_dense.get(field)
+                if query_field is None:
+                    missing[i] = True
+                else:
+                    query_block[i] = self._fit_width(query_field, matrix.shape[1])
+            
+            field_similarity = (matrix[rows] @ query_block.T).astype(np.float64)
+            if missing.any():
+                field_similarity[:, missing] = np.where(present, 0.0, 0.5)[:, None]
+            
+            total += field_similarity * weight
+        
+        return total
+    
+    @staticmethod
+    def _fit_width(query_field: "np.ndarray", width: int) -> "np.ndarray":
+        """쿼리 벡터를 행렬 열 수에 맞춤 (남는 용량 열은 0, 인코딩 뒤 추가된 개념 열은 제외)"""
+        fitted = np.zeros(width, dtype=np.float32)
+        size = min(len(query_field), width)
+        fitted[:size] = query_field[:size]
+        return fitted
+    
+    def export_state(self) -> Tuple[Dict[str, "np.ndarray"], Dict]:
+        """스냅샷 저장용 (필드별 행렬/값 존재 배열, 행 매핑 메타데이터)"""
+        arrays = {}
+        width = len(self.vocabulary)
+        for field in self.fields:
+            arrays[f"matrix.{field}"] = self.matrices[field][:self._size, :width]
+            arrays[f"present.{field}"] = self.present[field][:self._size]
+        
+        meta = {
+            "fields": self.fields,
+            "vocabulary": self.vocabulary,
+            "rows": self._rows,
+            "free_rows": self._free_rows,
+            "size": self._size
+        }
+        return arrays, meta
+    
+    def restore_state(self, arrays: Dict[str, "np.ndarray"], meta: Dict):
+        """export_state() 결과로 복원 - 행렬은 메모리 맵 배열을 그대로 사용 (행 추가 시 복사)"""
+        if tuple(meta["fields"]) != self.fields:
+            raise ValueError(f"벡터 필드 불일치: {meta['fields']}")
+        
+        with self._lock:
+            self.vocabulary = dict(meta["vocabulary"])
+            self._rows = dict(meta["rows"])
+            self._row_ids = {row: talent_id for talent_id, row in self._rows.items()}
+            self._free_rows = list(meta["free_rows"])
+            self._size = meta["size"]
+            
+            for field in self.fields:
+                if self._size:
+                    self.matrices[field] = arrays[f"matrix.{field}"]
+                    self.present[field] = arrays[f"present.{field}"]
+                else:
+                    # 빈 스냅샷은 두 배 확장이 불가능하므로 기본 용량으로 새로 할당
+                    self.matrices[field] = np.zeros((len(self.present[field]), len(self.vocabulary)),
+                                                    dtype=np.float32)
+                    self.present[field] = np.zeros(len(self.present[field]), dtype=bool)
+    
+    def _grow_rows(self):
+        """행 용량 두 배 확장"""
+        for field in self.fields:
+            matrix = self.matrices[field]
+            self.matrices[field] = np.concatenate([matrix, np.zeros_like(matrix)])
+            self.present[field] = np.concatenate([self.present[field], np.zeros_like(self.present[field])])
+    
+    def _add_concept(self, concept: str):
+        """고정 어휘에 없는 개념 추가 (열 용량이 부족하면 두 배로 확장)"""
+        self.vocabulary[concept] = len(self.vocabulary)
+        width = len(self.vocabulary)
+        
+        for field in self.fields:
+            matrix = self.matrices[field]
+            if width <= matrix.shape[1]:
+                continue
+            grown = np.zeros((matrix.shape[0], max(width, matrix.shape[1] * 2)), dtype=np.float32)
+            grown[:, :matrix.shape[1]] = matrix
+            self.matrices[field] = grown
+
 class VectorSearcher:
     """벡터 기반 검색 클래스"""
     
-    def __init__(self):
+    def __init__(self, talent_db=None, ann_backend: str = "auto", ann_nprobe: int = 32,
+                 encoder=None, encoder_cache_path: Optional[str] = None, precompute: bool = True,
+                 tracer=None):
         # 벡터 필드 가중치
         self.vector_weights = {
             "professional_competency": 0.25,
@@ -28,7 +300,278 @@ class VectorSearcher:
         # 키워드 임베딩 시뮬레이션용 매핑
         self.keyword_vectors = self._init_keyword_vectors()
         
-        print("🔍 벡터 검색기 초기화 완료")
+        # 텍스트 인코더 (인스턴스 또는 "keyword" | "hashing" | "model")
+        if not isinstance(encoder, TextEncoder):
+            encoder = create_encoder(encoder or "keyword", self.keyword_vectors, encoder_cache_path)
+        self.encoder = encoder
+        
+        # 개념 → 고정 인덱스 어휘
+        self.vocabulary = self._init_vocabulary()
+        
+        # 인재 ID → 후보자 벡터 캐시 (인재 벡터는 쿼리와 무관하므로 한 번만 계산)
+        # NumPy가 있으면 필드별 float32 행렬, 없으면 dict
+        self._candidate_vectors = {}
+        self.dense_store = (
+            DenseVectorStore(self.vector_weights.keys(), dict(self.vocabulary)) if np is not None else None
+        )
+        self.talent_db = talent_db
+        
+        # 의미 기반 후보 검색용 ANN 색인 (retrieve 첫 호출 시 생성)
+        self.ann_index = None
+        self.ann_backend = ann_backend
+        self.ann_nprobe = ann_nprobe
+        
+        # 유사도 계산 배치별 span (샘플된 요청만 기록)
+        self.tracer = tracer if tracer is not None else get_tracer()
+        
+        if talent_db is not None:
+            talent_db.add_change_listener(self.invalidate_candidate_vectors)
+            # 스냅샷에서 복원할 때는 precompute=False로 생성 후 restore_snapshot() 호출
+            if precompute and not talent_db.is_disk_backed:
+                self.precompute_candidate_vectors(talent_db.get_all_talents())
+        
+        cached = len(self.dense_store) if self.dense_store is not None else len(self._candidate_vectors)
+        print(f"🔍 벡터 검색기 초기화 완료 (후보자 벡터 {cached}명 사전 계산)")
+    
+    def _init_vocabulary(self) -> Dict[str, int]:
+        """keyword_vectors, 추론 규칙, 인코더 개념을 고정 인덱스로 매핑"""
+        vocabulary = {}
+        
+        for keyword_vector in self.keyword_vectors.values():
+            for concept in keyword_vector:
+                vocabulary.setdefault(concept, len(vocabulary))
+        for concept in INFERRED_CONCEPTS:
+            vocabulary.setdefault(concept, len(vocabulary))
+        for concept in self.encoder.vocabulary():
+            vocabulary.setdefault(concept, len(vocabulary))
+        
+        return vocabulary
+    
+    def snapshot_fingerprint(self) -> str:
+        """후보자 벡터 스냅샷 호환성 해시 (인코더 설정, 기본 어휘, 키워드 벡터, 벡터 필드)"""
+        raw = json.dumps({
+            "encoder": self.encoder.cache_key,
+            "vocabulary": list(self.vocabulary),
+            "keyword_vectors": self.keyword_vectors,
+            "fields": list(self.vector_weights)
+        }, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:12]
+    
+    def export_snapshot(self) -> Tuple[Dict[str, "np.ndarray"], Dict]:
+        """스냅샷 저장용 (밀집 행렬 배열, 행 매핑/ANN 색인 메타데이터)"""
+        arrays, meta = self.dense_store.export_state()
+        meta["fingerprint"] = self.snapshot_fingerprint()
+        # faiss 색인은 pickle 불가 - 복원 후 첫 의미 기반 검색 때 다시 생성
+        numpy_index = self.ann_index is not None and self.ann_index.backend == "numpy"
+        meta["ann_index"] = self.ann_index if numpy_index else None
+        return arrays, meta
+    
+    def restore_snapshot(self, arrays: Dict[str, "np.ndarray"], meta: Dict) -> bool:
+        """스냅샷의 후보자 벡터/ANN 색인 복원 (인코더/어휘 설정이 달라졌으면 False - 재계산 필요)"""
+        if self.dense_store is None or meta.get("fingerprint") != self.snapshot_fingerprint():
+            return False
+        
+        self.dense_store.restore_state(arrays, meta)
+        self._candidate_vectors.clear()
+        self.ann_index = meta.get("ann_index")
+        print(f"🔍 스냅샷에서 후보자 벡터 {len(self.dense_store)}명 복원")
+        return True
+    
+    def precompute_candidate_vectors(self, talents: List[Dict], batch_size: int = 1024):
+        """인재 목록의 후보자 벡터를 미리 계산해 캐시에 저장 (텍스트는 배치 단위로 인코딩)"""
+        for start in range(0, len(talents), batch_size):
+            batch = talents[start:start + batch_size]
+            encoded = self._encode_texts(
+                content
+                for talent in batch
+                for content in (talent.get("vector_fields") or {}).values()
+                if content
+            )
+            
+            for talent in batch:
+                if self.dense_store is not None:
+                    self._get_candidate_row(talent, encoded)
+                else:
+                    self._get_candidate_vector(talent, encoded)
+    
+    def _encode_texts(self, texts: Iterable[str], query: bool = False) -> Dict[str, Dict]:
+        """텍스트 목록을 한 번에 인코딩해 {텍스트: 벡터} 반환 (query면 디스크 캐시에 저장하지 않음)"""
+        unique = list(dict.fromkeys(texts))
+        if not unique:
+            return {}
+        encode = self.encoder.encode_queries if query else self.encoder.encode_batch
+        return dict(zip(unique, encode(unique)))
+    
+    def invalidate_candidate_vectors(self, talent_ids: Optional[List[str]] = None):
+        """추가/수정/삭제된 인재의 캐시된 벡터 제거 (None이면 전체 제거)"""
+        if talent_ids is None:
+            self._candidate_vectors.clear()
+            if self.dense_store is not None:
+                self.dense_store.invalidate()
+            self.ann_index = None
+            return
+        
+        for talent_id in talent_ids:
+            self._candidate_vectors.pop(talent_id, None)
+        
+        if self.dense_store is None:
+            return
+        
+        if self.ann_index is not None:
+            stale_rows = [self.dense_store.get_row(talent_id) for talent_id in talent_ids]
+            self.ann_index.remove(row for row in stale_rows if row is not None)
+        self.dense_store.invalidate(talent_ids)
+        
+        # ANN 색인이 있으면 변경 후 인재를 바로 다시 색인 (전체 코퍼스 검색 유지)
+        if self.ann_index is not None:
+            self._index_talents(talent_ids)
+    
+    def _get_candidate_vector(self, candidate: Dict, encoded: Optional[Dict] = None) -> Dict:
+        """캐시된 후보자 벡터 반환 (없으면 계산 후 저장, 밀집 저장소 사용 시 캐시하지 않음)"""
+        talent_id = candidate.get("id")
+        if talent_id is None or self.talent_db is None or self.dense_store is not None:
+            # 무효화 통지를 받을 수 없으면 캐시하지 않음
+            return self._create_candidate_vector(candidate, encoded)
+        
+        candidate_vector = self._candidate_vectors.get(talent_id)
+        if candidate_vector is None:
+            candidate_vector = self._create_candidate_vector(candidate, encoded)
+            self._candidate_vectors[talent_id] = candidate_vector
+        return candidate_vector
+    
+    def _get_candidate_row(self, candidate: Dict, encoded: Optional[Dict] = None) -> int:
+        """밀집 저장소의 후보자 행 번호 반환 (없으면 계산 후 저장)"""
+        talent_id = candidate.get("id")
+        row = self.dense_store.get_row(talent_id)
+        if row is None:
+            row = self.dense_store.add(talent_id, self._create_candidate_vector(candidate, encoded))
+        return row
+    
+    def build_ann_index(self, nlist: Optional[int] = None):
+        """전체 인재 결합 벡터로 ANN 색인 생성"""
+        if self.dense_store is None or self.talent_db is None:
+            logger.warning("⚠️ ANN 색인에는 NumPy와 인재 데이터베이스가 필요합니다")
+            return
+        
+        # 아직 벡터가 없는 인재(디스크 기반 DB 등)까지 모두 계산
+        if len(self.dense_store) < self.talent_db.get_talent_count():
+            self.precompute_candidate_vectors(self.talent_db.get_all_talents())
+        
+        rows = self.dense_store.active_rows()
+        if len(rows) == 0:
+            self.ann_index = None
+            return
+        
+        self.ann_index = create_ann_index(
+            self.dense_store.joint_width, len(rows), nlist=nlist,
+            nprobe=self.ann_nprobe, backend=self.ann_backend
+        )
+        self.ann_index.build(self.dense_store.joint_vectors(rows), rows)
+        logger.info(f"🧭 ANN 색인 생성 ({self.ann_index.backend}, {len(rows)}명, "
+                    f"클러스터 {self.ann_index.nlist}개)")
+    
+    def _index_talents(self, talent_ids: List[str]):
+        """인재를 DB에서 다시 읽어 밀집 저장소와 ANN 색인에 등록 (삭제된 인재는 건너뜀)"""
+        rows = []
+        for talent_id in dict.fromkeys(talent_ids):
+            talent = self.talent_db.get_talent_by_id(talent_id)
+            if talent is not None:
+                rows.append(self._get_candidate_row(talent))
+        
+        if self.ann_index.dim != self.dense_store.joint_width:
+            # 새 개념으로 차원이 바뀌면 다음 검색 때 재생성
+            self.ann_index = None
+            return
+        
+        if rows:
+            rows = np.array(rows, dtype=np.int64)
+            self.ann_index.add(self.dense_store.joint_vectors(rows), rows)
+    
+    def _ensure_ann_index(self) -> bool:
+        """ANN 색인 준비 (없거나 어휘 확장으로 차원이 바뀌었으면 재생성)"""
+        if self.ann_index is None or self.ann_index.dim != self.dense_store.joint_width:
+            self.build_ann_index()
+        return self.ann_index is not None
+    
+    def retrieve(self, parsed_query: Dict, k: int, nprobe: Optional[int] = None) -> List[Tuple[str, float]]:
+        """전체 인재 중 쿼리와 의미적으로 가까운 상위 k명 (인재 ID, 벡터 유사도) - ANN 검색"""
+        if k <= 0 or self.dense_store is None or self.talent_db is None:
+            return []
+        if not self._ensure_ann_index():
+            return []
+        
+        query_vector = self._create_query_vector(parsed_query)
+        rows, scores = self.ann_index.search(self._joint_query(query_vector), k, nprobe)
+        
+        return [(self.dense_store.get_talent_id(row), float(score))
+                for row, score in zip(rows.tolist(), scores.tolist())
+                if self.dense_store.get_talent_id(row) is not None]
+    
+    def _joint_query(self, query_vector: Dict) -> "np.ndarray":
+        query_dense = {
+            field: self.dense_store.to_dense(query_vector.get(field, {}))
+            for field in self.vector_weights
+        }
+        return self.dense_store.joint_query(query_dense, self.vector_weights)
+    
+    def check_ann_recall(self, parsed_queries: Optional[List[Dict]] = None, k: int = 10,
+                         sample_size: int = 50, nprobe: Optional[int] = None) -> Dict:
+        """ANN 검색 결과의 정확 검색 대비 recall@k 측정
+        
+        parsed_queries가 없으면 저장된 인재 벡터를 표본 추출해 쿼리로 사용한다.
+        """
+        if self.dense_store is None or not self._ensure_ann_index():
+            return {"recall": None, "queries": 0, "k": k}
+        
+        rows = self.dense_store.active_rows()
+        joint = self.dense_store.joint_vectors(rows)
+        
+        if parsed_queries:
+            queries = [self._joint_query(self._create_query_vector(query)) for query in parsed_queries]
+        else:
+            rng = np.random.default_rng(0)
+            sample = rng.choice(len(rows), min(sample_size, len(rows)), replace=False)
+            queries = [self._sample_query(joint[i]) for i in sample]
+        
+        recalls = []
+        for query in queries:
+            exact_scores = np.sort(joint @ query)[::-1][:k]
+            if len(exact_scores) == 0:
+                continue
+            _, approx_scores = self.ann_index.search(query, k, nprobe)
+            # k번째 정확 점수 이상인 결과를 정답으로 계산 (동점 인재는 서로 대체 가능)
+            kth_score = exact_scores[-1] - 1e-6
+            recalls.append(int(np.sum(approx_scores >= kth_score)) / len(exact_scores))
+        
+        recall = float(np.mean(recalls)) if recalls else None
+        return {
+            "recall": recall,
+            "queries": len(recalls),
+            "k": k,
+            "nprobe": min(nprobe or self.ann_index.nprobe, self.ann_index.nlist),
+            "nlist": self.ann_index.nlist,
+            "backend": self.ann_index.backend
+        }
+    
+    def _sample_query(self, joint_vector: "np.ndarray") -> "np.ndarray":
+        """저장된 인재 결합 벡터를 같은 인재를 찾는 쿼리 벡터로 변환"""
+        fields = self.dense_store.fields
+        width = len(self.dense_store.vocabulary)
+        query = joint_vector.copy()
+        
+        for i, field in enumerate(fields):
+            weight = self.vector_weights[field]
+            query[i * width:(i + 1) * width] *= weight
+            query[len(fields) * width + i] *= 0.5 * weight
+        return query
+    
+    def _can_use_dense_store(self, candidates: List) -> bool:
+        """밀집 행렬 경로 사용 가능 여부 (무효화 통지를 받는 DB의 ID 있는 후보만)"""
+        return (
+            self.dense_store is not None
+            and self.talent_db is not None
+            and all(candidate.get("id") is not None for candidate in candidates)
+        )
     
     def _init_keyword_vectors(self) -> Dict:
         """키워드 벡터 매핑 초기화 (실제 환경에서는 임베딩 모델 사용)"""
@@ -59,8 +602,9 @@ class VectorSearcher:
             "리더십": {"leadership": 1.0, "management": 0.8, "guidance": 0.7}
         }
     
-    def search(self, parsed_query: Dict, payload_candidates: List[Dict]) -> List[Dict]:
-        """벡터 검색 실행"""
+    def search(self, parsed_query: Dict, payload_candidates: List,
+               top_k: Optional[int] = None) -> List[ScoredTalent]:
+        """벡터 검색 실행 (후보 레코드에 점수를 직접 기록, top_k 지정 시 상위만 반환)"""
         logger.info("🔍 벡터 검색 시작")
         
         if not payload_candidates:
@@ -71,98 +615,145 @@ class VectorSearcher:
             # 쿼리 벡터 생성
             query_vector = self._create_query_vector(parsed_query)
             
-            results = []
-            
-            for candidate in payload_candidates:
-                # 후보자 벡터 생성
-                candidate_vector = self._create_candidate_vector(candidate)
+            candidates = [ScoredTalent.wrap(candidate) for candidate in payload_candidates]
+            if self._can_use_dense_store(candidates):
+                similarity_scores = self._calculate_vector_similarities(query_vector, candidates)
                 
-                # 유사도 계산
-                similarity_score = self._calculate_vector_similarity(query_vector, candidate_vector)
+                for candidate, similarity_score in zip(candidates, similarity_scores):
+                    payload_score = candidate.get("payload_score", 0.0)
+                    candidate.vector_score = similarity_score
+                    candidate.combined_score = self._combine_scores(payload_score, similarity_score)
                 
-                # Payload 점수와 벡터 점수 결합
-                payload_score = candidate.get("payload_score", 0.0)
-                combined_score = self._combine_scores(payload_score, similarity_score)
-                
-                candidate_with_scores = candidate.copy()
-                candidate_with_scores["vector_score"] = similarity_score
-                candidate_with_scores["combined_score"] = combined_score
+                results = select_top(candidates, top_k, key=lambda x: x.combined_score)
                 
-                results.append(candidate_with_scores)
+                logger.info(f"✅ 벡터 검색 완료: {len(results)}명 결과")
+                return results
             
-            # 결합 점수로 정렬
-            results.sort(key=lambda x: x.get("combined_score", 0), reverse=True)
+            results = []
+            
+            with self.tracer.span("vector.similarity", algorithm="sparse_cosine", candidates=len(payload_candidates)):
+                for candidate in payload_candidates:
+                    candidate = ScoredTalent.wrap(candidate)
+                    
+                    # 후보자 벡터 (캐시)
+                    candidate_vector = self._get_candidate_vector(candidate)
+                    
+                    # 유사도 계산
+                    similarity_score = self._calculate_vector_similarity(query_vector, candidate_vector)
+                    
+                    # Payload 점수와 벡터 점수 결합
+                    payload_score = candidate.get("payload_score", 0.0)
+                    combined_score = self._combine_scores(payload_score, similarity_score)
+                    
+                    candidate.vector_score = similarity_score
+                    candidate.combined_score = combined_score
+                    
+                    results.append(candidate)
+            
+            # 결합 점수로 상위 후보 선택
+            results = select_top(results, top_k, key=lambda x: x.combined_score)
             
             logger.info(f"✅ 벡터 검색 완료: {len(results)}명 결과")
             return results
-            
+        
         except Exception as e:
             logger.error(f"❌ 벡터 검색 오류: {e}")
             return payload_candidates
     
+    def search_batch(self, parsed_queries: List[Dict], candidate_lists: List[List],
+                     top_k: Optional[int] = None) -> List[List[ScoredTalent]]:
+        """여러 쿼리 벡터 검색 - 모든 쿼리 후보 행의 합집합 × 쿼리 유사도 행렬을 한 번에 계산"""
+        candidate_lists = [[ScoredTalent.wrap(candidate) for candidate in candidates]
+                           for candidates in candidate_lists]
+        
+        if not all(self._can_use_dense_store(candidates) for candidates in candidate_lists):
+            return [self.search(parsed_query, candidates, top_k)
+                    for parsed_query, candidates in zip(parsed_queries, candidate_lists)]
+        
+        logger.info(f"🔍 벡터 일괄 검색 시작 ({len(parsed_queries)}개 쿼리)")
+        query_denses = []
+        for parsed_query in parsed_queries:
+            query_vector = self._create_query_vector(parsed_query)
+            query_denses.append({
+                field: self.dense_store.to_dense(query_vector.get(field, {}))
+                for field in self.vector_weights
+            })
+        
+        # 쿼리별 후보 행 번호 (후보 벡터가 없으면 이 단계에서 계산) → 합집합 행렬 한 번 계산
+        row_lists = [
+            np.fromiter((self._get_candidate_row(candidate) for candidate in candidates),
+                        dtype=np.int64, count=len(candidates))
+            for candidates in candidate_lists
+        ]
+        union_rows = np.unique(np.concatenate(row_lists)) if row_lists else np.zeros(0, dtype=np.int64)
+        with self.tracer.span("vector.similarity", algorithm="dense_matmul", queries=len(query_denses),
+                              candidates=len(union_rows)):
+            similarity_matrix = self.dense_store.similarity_matrix(query_denses, union_rows, self.vector_weights)
+        
+        results = []
+        for column, (candidates, rows) in enumerate(zip(candidate_lists, row_lists)):
+            similarity_scores = similarity_matrix[np.searchsorted(union_rows, rows), column].tolist()
+            for candidate, similarity_score in zip(candidates, similarity_scores):
+                payload_score = candidate.get("payload_score", 0.0)
+                candidate.vector_score = similarity_score
+                candidate.combined_score = self._combine_scores(payload_score, similarity_score)
+            
+            results.append(select_top(candidates, top_k, key=lambda x: x.combined_score))
+        
+        logger.info(f"✅ 벡터 일괄 검색 완료: {sum(len(result) for result in results)}명 결과")
+        return results
+    
     def _create_query_vector(self, parsed_query: Dict) -> Dict:
         """쿼리에서 벡터 생성"""
         query_vector = {}
         
         try:
             vector_fields = parsed_query.get("vector_fields", {})
+            encoded = self._encode_texts((content for content in vector_fields.values() if content), query=True)
             
             for field, content in vector_fields.items():
                 if content:
-                    query_vector[field] = self._text_to_vector(content)
+                    query_vector[field] = encoded[content]
                 else:
                     # 쿼리에서 추론 가능한 벡터 생성
                     query_vector[field] = self._infer_vector_from_query(field, parsed_query)
-                    
+        
         except Exception as e:
             logger.warning(f"쿼리 벡터 생성 오류: {e}")
         
         return query_vector
     
-    def _create_candidate_vector(self, candidate: Dict) -> Dict:
-        """후보자에서 벡터 생성"""
+    def _create_candidate_vector(self, candidate: Dict, encoded: Optional[Dict] = None) -> Dict:
+        """후보자에서 벡터 생성 (encoded: 미리 일괄 인코딩한 {텍스트: 벡터})"""
         candidate_vector = {}
         
         try:
             # 후보자의 벡터 필드 직접 사용
             vector_fields = candidate.get("vector_fields", {})
+            if encoded is None:
+                encoded = self._encode_texts(content for content in vector_fields.values() if content)
             
             for field in self.vector_weights.keys():
                 content = vector_fields.get(field)
                 if content:
-                    candidate_vector[field] = self._text_to_vector(content)
+                    candidate_vector[field] = encoded[content]
                 else:
                     # 후보자 정보에서 벡터 추론
                     candidate_vector[field] = self._infer_vector_from_candidate(field, candidate)
-                    
+        
         except Exception as e:
             logger.warning(f"후보자 벡터 생성 오류: {e}")
         
         return candidate_vector
     
     def _text_to_vector(self, text: str) -> Dict:
-        """텍스트를 벡터로 변환 (키워드 기반 시뮬레이션)"""
+        """텍스트를 벡터로 변환 (설정된 인코더 사용)"""
         if not text:
             return {}
         
         try:
-            text_lower = text.lower()
-            vector = {}
-            
-            # 키워드 매칭으로 벡터 생성
-            for keyword, keyword_vector in self.keyword_vectors.items():
-                if keyword in text_lower:
-                    for vec_key, vec_value in keyword_vector.items():
-                        vector[vec_key] = vector.get(vec_key, 0) + vec_value
-            
-            # 정규화
-            if vector:
-                total = sum(vector.values())
-                if total > 0:
-                    vector = {k: v/total for k, v in vector.items()}
-            
-            return vector
-            
+            return self.encoder.encode(text)
+        
         except Exception as e:
             logger.warning(f"텍스트 벡터 변환 오류: {e}")
             return {}
@@ -228,7 +819,7 @@ class VectorSearcher:
                     vector = {"security": 0.8, "compliance": 0.6}
                 elif parsed_query.get("specialization") == "보안":
                     vector = {"security": 0.9, "protection": 0.7}
-                    
+        
         except Exception as e:
             logger.warning(f"쿼리 벡터 추론 오류 ({field}): {e}")
         
@@ -321,7 +912,7 @@ class VectorSearcher:
                     vector = {"security": 0.9, "protection": 0.7}
                 elif industry in ["금융", "공공"]:
                     vector = {"security": 0.5, "compliance": 0.4}
-                    
+        
         except Exception as e:
             logger.warning(f"후보자 벡터 추론 오류 ({field}): {e}")
         
@@ -346,11 +937,25 @@ class VectorSearcher:
                 total_similarity += field_similarity * weight
             
             return total_similarity
-            
+        
         except Exception as e:
             logger.warning(f"벡터 유사도 계산 오류: {e}")
             return 0.0
     
+    def _calculate_vector_similarities(self, query_vector: Dict, candidates: List) -> List[float]:
+        """모든 후보의 벡터 유사도를 필드별 행렬-벡터 곱으로 한 번에 계산"""
+        rows = np.fromiter(
+            (self._get_candidate_row(candidate) for candidate in candidates),
+            dtype=np.int64, count=len(candidates)
+        )
+        query_dense = {
+            field: self.dense_store.to_dense(query_vector.get(field, {}))
+            for field in self.vector_weights
+        }
+        
+        with self.tracer.span("vector.similarity", algorithm="dense_matvec", candidates=len(rows)):
+            return self.dense_store.similarities(query_dense, rows, self.vector_weights).tolist()
+    
     def _cosine_similarity(self, vector1: Dict, vector2: Dict) -> float:
         """코사인 유사도 계산"""
         try:
@@ -371,7 +976,7 @@ class VectorSearcher:
                 return 0.0
             
             return dot_product / (magnitude1 * magnitude2)
-            
+        
         except Exception as e:
             logger.warning(f"코사인 유사도 계산 오류: {e}")
             return 0.0
@@ -385,7 +990,7 @@ class VectorSearcher:
             
             combined = payload_score * payload_weight + vector_score * vector_weight
             return max(0.0, min(1.0, combined))  # 0-1 범위로 제한
-            
+        
         except Exception as e:
             logger.warning(f"점수 결합 오류: {e}")
             return payload_score  # 오류 시 payload 점수만 반환
@@ -412,7 +1017,7 @@ class VectorSearcher:
                         "matched_concepts": list(common_keywords),
                         "explanation": self._get_field_explanation(field, similarity)
                     }
-                    
+        
         except Exception as e:
             logger.warning(f"벡터 매칭 설명 오류: {e}")
         
@@ -449,7 +1054,7 @@ class VectorSearcher:
             scored_results = []
             
             for result in results:
-                candidate_vector = self._create_candidate_vector(result)
+                candidate_vector = self._get_candidate_vector(result)
                 field_vector = candidate_vector.get(field, {})
                 
                 if field_vector:
@@ -464,7 +1069,7 @@ class VectorSearcher:
             scored_results.sort(key=lambda x: x.get(f"{field}_score", 0), reverse=True)
             
             return scored_results[:limit]
-            
+        
         except Exception as e:
             logger.warning(f"필드별 상위 매칭 결과 오류: {e}")
             return results[:limit]
\ No newline at end of file